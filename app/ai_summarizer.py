@@ -2,93 +2,530 @@ import requests
 import os
 import json
 import time
+import threading
+import contextvars
+from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+from app import llm_cache
+from app.llm_scheduler import LLMScheduler, LLM_CLASS_LIMITS
+
 load_dotenv()
 
 # LM Studio 로컬 서버 설정
-LM_STUDIO_URL = "http://localhost:12345/v1/chat/completions"
+LM_STUDIO_URL = os.getenv("LM_STUDIO_URL", "http://localhost:12345/v1/chat/completions")
 MAX_RETRIES = 3
-INITIAL_BACKOFF = 2
+INITIAL_BACKOFF = 0.5  # 과부하 응답 시 최초 대기(초), 연속 실패마다 2배
+MAX_BACKOFF = 30
+# 동시에 보낼 요청 수 (LM Studio의 병렬 처리 슬롯 수에 맞춤)
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "1"))
+# 회로 차단기: 연속 실패가 임계값에 도달하면 LLM_BREAKER_RESET초 동안 호출하지 않고 즉시 실패
+# (다시 열릴 때마다 대기 시간을 2배로 늘리며 LLM_BREAKER_MAX_RESET까지)
+LLM_BREAKER_THRESHOLD = int(os.getenv("LLM_BREAKER_THRESHOLD", "2"))
+LLM_BREAKER_RESET = float(os.getenv("LLM_BREAKER_RESET", "30"))
+LLM_BREAKER_MAX_RESET = 600
+# 차단 해제 전 확인용 가벼운 요청 (OpenAI 호환 서버의 모델 목록)
+LLM_HEALTH_URL = os.getenv("LLM_HEALTH_URL", LM_STUDIO_URL.rsplit("/chat/completions", 1)[0] + "/models")
+LLM_HEALTH_TIMEOUT = 2
+# 캐시 키에 포함되는 모델 이름 (LM Studio에서 모델을 바꾸면 함께 변경)
+LLM_MODEL = os.getenv("LLM_MODEL", "local-model")
+# 프롬프트 템플릿 버전: 프롬프트나 생성 옵션을 바꾸면 올려서 이전 캐시를 무효화
+PROMPT_VERSIONS = {
+    "news_summary": 1,
+    "wiki_content": 1,
+}
+
+
+class LLMRetryableError(Exception):
+    """5xx 또는 서버의 retry 응답 (백오프 후 재시도 대상)"""
+
+
+class LLMUnavailableError(Exception):
+    """회로 차단기가 열려 있어 LLM을 호출하지 않음 (나중에 다시 시도할 대상)"""
+
 
-def _call_llm_api_with_retry(payload, timeout):
-    """LLM API를 재시도 로직과 함께 호출합니다."""
-    last_exception = None
-    for attempt in range(MAX_RETRIES):
+class CircuitBreaker:
+    """
+    프로세스 전체가 공유하는 LLM 회로 차단기
+    - closed: 정상 호출, 연속 실패가 threshold에 도달하면 open
+    - open: 호출하지 않고 LLMUnavailableError로 즉시 실패
+    - 대기 시간이 지나면 한 스레드만 상태 확인 요청(probe)을 보내고,
+      응답이 있으면 half_open으로 전환해 그 호출 1건을 시험 삼아 허용 (성공 시 closed, 실패 시 다시 open)
+    """
+
+    def __init__(self, probe_url=LLM_HEALTH_URL, threshold=LLM_BREAKER_THRESHOLD,
+                 reset_timeout=LLM_BREAKER_RESET, max_reset=LLM_BREAKER_MAX_RESET):
+        self.probe_url = probe_url
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset = max_reset
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.rejected = 0
+        self.last_error = None
+        self.opened_at = None
+        self._current_reset = reset_timeout
+        self._retry_at = 0.0
+        self._lock = threading.Lock()
+
+    def retry_after(self):
+        """다시 호출을 시도할 수 있을 때까지 남은 시간(초)"""
+        if self.state == "closed":
+            return 0.0
+        return max(self._retry_at - time.monotonic(), 0.0)
+
+    def ready(self):
+        """지금 호출하면 실제로 LLM에 요청이 전달되는지 여부"""
+        return self.state == "closed" or (self.state == "open" and time.monotonic() >= self._retry_at)
+
+    def probe(self):
+        """LLM 서버 응답 여부 확인 (5xx/연결 실패가 아니면 사용 가능으로 판단)"""
         try:
-            headers = {"Content-Type": "application/json"}
-            response = requests.post(LM_STUDIO_URL, data=json.dumps(payload), headers=headers, timeout=timeout)
-            
-            # {"type":"retry"} 형태의 에러 응답 처리
-            if response.status_code == 200:
-                try:
-                    json_response = response.json()
-                    # 성공적인 응답에서 'choices' 키 확인
-                    if 'choices' in json_response and len(json_response['choices']) > 0:
-                        return json_response['choices'][0]['message']['content'].strip()
-                except json.JSONDecodeError:
-                    # 응답이 JSON이 아닐 경우, 재시도해야 할 수 있는 에러 메시지인지 확인
-                    if "retry" in response.text:
-                        print(f"재시도 가능한 오류 감지 (응답 내용: {response.text}). {attempt + 1}/{MAX_RETRIES}번째 재시도...")
-                        last_exception = Exception(f"서버가 재시도를 요청했습니다: {response.text}")
-                    else:
-                        raise Exception(f"JSON 디코딩 오류: {response.text}")
-
-            elif 500 <= response.status_code < 600:
-                print(f"서버 오류 (상태 코드: {response.status_code}). {attempt + 1}/{MAX_RETRIES}번째 재시도...")
-                last_exception = requests.exceptions.HTTPError(f"서버 오류: {response.status_code}")
+            return requests.get(self.probe_url, timeout=LLM_HEALTH_TIMEOUT).status_code < 500
+        except requests.exceptions.RequestException:
+            return False
+
+    def before_call(self):
+        """호출 전 확인, 차단 중이면 LLMUnavailableError"""
+        with self._lock:
+            if self.state == "closed":
+                return
+            if self.state == "half_open" or time.monotonic() < self._retry_at:
+                self.rejected += 1
+                raise LLMUnavailableError(f"LLM 사용 불가 ({self.retry_after():.0f}초 후 재확인): {self.last_error}")
+            # 확인 중에는 다른 호출이 함께 probe하지 않도록 half_open으로 표시
+            self.state = "half_open"
+        if self.probe():
+            return
+        self.on_failure("상태 확인 실패")
+        raise LLMUnavailableError(f"LLM 서버 응답 없음: {self.probe_url}")
+
+    def on_success(self):
+        with self._lock:
+            if self.state != "closed":
+                print("✅ LLM 서버 복구, 회로 차단 해제")
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self._current_reset = self.reset_timeout
+
+    def on_failure(self, error):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.last_error = str(error)[:200]
+            if self.state == "half_open":
+                # 복구 확인 실패 → 대기 시간을 늘려 다시 차단
+                self._current_reset = min(self._current_reset * 2, self.max_reset)
+            elif self.consecutive_failures < self.threshold:
+                return
             else:
-                response.raise_for_status()
+                print(f"⚠️ LLM 호출이 연속 {self.consecutive_failures}회 실패하여 {self._current_reset:.0f}초간 차단합니다.")
+            self.state = "open"
+            self.opened_at = datetime.now()
+            self._retry_at = time.monotonic() + self._current_reset
 
-        except requests.exceptions.RequestException as e:
-            print(f"네트워크 오류 발생: {e}. {attempt + 1}/{MAX_RETRIES}번째 재시도...")
-            last_exception = e
-        
-        # 재시도 전 대기 (지수 백오프)
-        if attempt < MAX_RETRIES - 1:
-            wait_time = INITIAL_BACKOFF * (2 ** attempt)
-            print(f"{wait_time}초 후 재시도합니다.")
-            time.sleep(wait_time)
+    def call(self, fn, *args, **kwargs):
+        self.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.on_failure(e)
+            raise
+        self.on_success()
+        return result
 
-    # 모든 재시도 실패
-    raise Exception(f"최대 재시도 횟수({MAX_RETRIES})를 초과했습니다. 마지막 오류: {last_exception}")
+    def snapshot(self):
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
+            "retry_in_sec": round(self.retry_after(), 1),
+            "rejected": self.rejected,
+            "last_error": self.last_error,
+        }
 
 
-def summarize_news(title, content=None):
-    """LM Studio를 사용하여 뉴스 제목과 본문을 기반으로 핵심 요약 생성"""
-    try:
-        source_text = content if content else title
-        
-        prompt = f"""아래의 보안 뉴스 내용을 지식 사전에 등록할 수 있도록 핵심만 요약해줘.
-        
-내용: {source_text[:1500]}
+class LLMClient:
+    """
+    로컬 LLM 서버 클라이언트
+    - requests.Session 연결 풀로 keep-alive 재사용
+    - 동시 요청 수를 max_in_flight로 제한하고 우선순위 등급 순으로 슬롯 배정 (app.llm_scheduler)
+    - 5xx/retry 응답 시 클라이언트 전체가 함께 쉬는 적응형 백오프 (성공하면 점차 줄임)
+    - 처리량(items/sec)과 지연 시간 백분위 집계
+    """
 
-작성 규칙:
+    def __init__(self, url=LM_STUDIO_URL, max_in_flight=LLM_MAX_IN_FLIGHT, max_retries=MAX_RETRIES, scheduler=None):
+        self.url = url
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(max_in_flight, 1))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.scheduler = scheduler or LLMScheduler(max_in_flight, LLM_CLASS_LIMITS)
+        self._lock = threading.Lock()
+        self._backoff = 0.0
+        self._cooldown_until = 0.0
+        self.reset_metrics()
+
+    def reset_metrics(self):
+        with self._lock:
+            self._latencies = deque(maxlen=2000)
+            self._counts = {"completed": 0, "failed": 0, "retries": 0, "prompt_tokens": 0, "completion_tokens": 0,
+                            "backoff_wait_sec": 0.0}
+            self._started = time.perf_counter()
+
+    def _wait_cooldown(self):
+        delay = self._cooldown_until - time.monotonic()
+        if delay > 0:
+            with self._lock:
+                self._counts["backoff_wait_sec"] += delay
+            time.sleep(delay)
+
+    def _on_overload(self):
+        with self._lock:
+            self._backoff = min(max(self._backoff * 2, INITIAL_BACKOFF), MAX_BACKOFF)
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + self._backoff)
+            return self._backoff
+
+    def _on_success(self, latency, usage=None):
+        with self._lock:
+            self._backoff = self._backoff / 2 if self._backoff >= 1 else 0.0
+            self._latencies.append(latency)
+            self._counts["completed"] += 1
+            # OpenAI 호환 서버가 보내는 토큰 사용량 (없으면 집계하지 않음)
+            for field in ("prompt_tokens", "completion_tokens"):
+                self._counts[field] += int((usage or {}).get(field) or 0)
+
+    def _post(self, payload, timeout):
+        response = self.session.post(self.url, json=payload, timeout=timeout)
+        if 500 <= response.status_code < 600:
+            raise LLMRetryableError(f"서버 오류: {response.status_code}")
+        if response.status_code != 200:
+            response.raise_for_status()
+        try:
+            json_response = response.json()
+        except ValueError:
+            # {"type":"retry"} 형태의 비 JSON 응답은 재시도, 그 외는 즉시 실패
+            if "retry" in response.text:
+                raise LLMRetryableError(f"서버가 재시도를 요청했습니다: {response.text}")
+            raise Exception(f"JSON 디코딩 오류: {response.text}")
+        if json_response.get("type") == "retry":
+            raise LLMRetryableError("서버가 재시도를 요청했습니다")
+        if json_response.get("choices"):
+            return json_response["choices"][0]["message"]["content"].strip(), json_response.get("usage")
+        raise Exception(f"응답에 choices가 없습니다: {str(json_response)[:200]}")
+
+    def complete(self, payload, timeout):
+        """chat completion 요청 후 응답 텍스트 반환 (재시도 모두 실패 시 예외)"""
+        last_exception = None
+        for attempt in range(self.max_retries):
+            self._wait_cooldown()
+            with self.scheduler.slot():
+                start = time.perf_counter()
+                try:
+                    content, usage = self._post(payload, timeout)
+                    self._on_success(time.perf_counter() - start, usage)
+                    return content
+                except requests.exceptions.ConnectionError as e:
+                    # 서버가 떠 있지 않으면 재시도해도 소용없으므로 바로 실패 (재개 시점은 회로 차단기가 판단)
+                    self._fail_fast(f"LLM 서버 연결 실패: {e}")
+                except requests.exceptions.HTTPError as e:
+                    # 4xx(잘못된 요청/모델 이름 등)는 재시도해도 같고 과부하도 아니므로 공유 백오프 없이 바로 실패
+                    self._fail_fast(f"LLM 요청 오류: {e}")
+                except (LLMRetryableError, requests.exceptions.RequestException) as e:
+                    last_exception = e
+            self._after_failure(attempt, last_exception)
+
+    def _fail_fast(self, message):
+        """재시도/백오프 없이 실패 처리"""
+        with self._lock:
+            self._counts["failed"] += 1
+        raise Exception(message)
+
+    def _after_failure(self, attempt, error):
+        """재시도 전 공유 백오프 적용, 마지막 시도였으면 예외"""
+        if attempt < self.max_retries - 1:
+            with self._lock:
+                self._counts["retries"] += 1
+            wait_time = self._on_overload()
+            print(f"LLM 요청 재시도 ({attempt + 1}/{self.max_retries}, {wait_time:.0f}초 대기): {error}")
+            return
+        with self._lock:
+            self._counts["failed"] += 1
+        raise Exception(f"최대 재시도 횟수({self.max_retries})를 초과했습니다. 마지막 오류: {error}")
+
+    def stream(self, payload, timeout):
+        """
+        stream=True로 요청하여 응답 텍스트 조각을 도착하는 대로 생성
+        첫 조각을 받기 전의 5xx/retry 응답만 재시도하며, 생성이 끝날 때까지 동시 요청 슬롯을 점유합니다.
+        """
+        payload = dict(payload, stream=True)
+        last_exception = None
+        for attempt in range(self.max_retries):
+            self._wait_cooldown()
+            with self.scheduler.slot():
+                start = time.perf_counter()
+                try:
+                    response = self.session.post(self.url, json=payload, timeout=timeout, stream=True)
+                    if 500 <= response.status_code < 600:
+                        response.close()
+                        raise LLMRetryableError(f"서버 오류: {response.status_code}")
+                    if response.status_code != 200:
+                        response.close()
+                        response.raise_for_status()
+                except requests.exceptions.ConnectionError as e:
+                    self._fail_fast(f"LLM 서버 연결 실패: {e}")
+                except requests.exceptions.HTTPError as e:
+                    self._fail_fast(f"LLM 요청 오류: {e}")
+                except (LLMRetryableError, requests.exceptions.RequestException) as e:
+                    last_exception = e
+                else:
+                    usage = None
+                    with response:
+                        # SSE 형식: "data: {chunk}" 줄, 마지막은 "data: [DONE]"
+                        for raw in response.iter_lines():
+                            line = raw.decode("utf-8")
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[5:].strip()
+                            if data == "[DONE]":
+                                break
+                            chunk = json.loads(data)
+                            usage = chunk.get("usage") or usage
+                            for choice in chunk.get("choices") or []:
+                                piece = (choice.get("delta") or {}).get("content")
+                                if piece:
+                                    yield piece
+                    self._on_success(time.perf_counter() - start, usage)
+                    return
+            self._after_failure(attempt, last_exception)
+
+    def map(self, fn, items, max_in_flight=None):
+        """
+        items를 fn(item)으로 동시에 처리하며 완료 순서대로 (item, 결과, 예외) 생성
+        대기 중인 작업 수를 동시 요청 수의 2배로 제한하므로 items는 DB 스트림이어도 됩니다.
+        호출한 쪽의 llm_priority 지정은 작업 스레드에도 그대로 적용됩니다.
+        """
+        max_in_flight = max_in_flight or self.max_in_flight
+        source = iter(items)
+        with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+            in_flight = {}
+            while True:
+                while len(in_flight) < max_in_flight * 2:
+                    item = next(source, _END)
+                    if item is _END:
+                        break
+                    in_flight[pool.submit(contextvars.copy_context().run, fn, item)] = item
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    error = future.exception()
+                    yield item, (None if error else future.result()), error
+
+    def metrics(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            elapsed = time.perf_counter() - self._started
+            result = dict(self._counts)
+
+        def pct(p):
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 1) if latencies else None
+
+        result.update({
+            "max_in_flight": self.max_in_flight,
+            "items_per_sec": round(result["completed"] / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": {"p50": pct(0.5), "p95": pct(0.95), "p99": pct(0.99)},
+            "backoff_sec": self._backoff,
+            "backoff_wait_sec": round(result["backoff_wait_sec"], 2),
+            "scheduler": self.scheduler.metrics(),
+        })
+        return result
+
+
+_END = object()
+
+SUMMARY_SYSTEM_PROMPT = "당신은 보안 뉴스를 분석하고 핵심을 요약하는 전문가입니다."
+SUMMARY_RULES = """작성 규칙:
 1. 반드시 한국어로 작성할 것. (한자 실수를 방지하기 위해 '勒'과 같은 한자 대신 '랜섬웨어'라고 작성)
 2. '누가, 어떤 취약점으로, 어떤 피해를 입었는지'를 포함할 것.
 3. 전문 용어는 가급적 유지하되 문장은 매끄럽게 '~함', '~임' 체로 끝낼 것.
 4. **절대 한자(Chinese characters)를 사용하지 말 것.** (예: '勒'(랜섬), '蜘蛛'(크롤러/스파이더), '歌曲'(음악/곡) 등 금지)
 5. 최대 2문장으로 압축할 것."""
 
-        payload = {
-            "model": "local-model",
-            "messages": [
-                {"role": "system", "content": "당신은 보안 뉴스를 분석하고 핵심을 요약하는 전문가입니다."},
-                {"role": "user", "content": prompt}
-            ],
-            "max_tokens": 200,
-            "temperature": 0.3
-        }
+llm_client = LLMClient()
+llm_breaker = CircuitBreaker()
+_batch_lock = threading.Lock()
+_batch_counts = {"batches": 0, "articles": 0, "fallbacks": 0}
+
+
+def _call_llm_api_with_retry(payload, timeout, client=None):
+    """LLM API를 재시도 로직과 함께 호출합니다. (기본: 공유 클라이언트, 차단 중이면 즉시 LLMUnavailableError)"""
+    return llm_breaker.call((client or llm_client).complete, payload, timeout)
+
+
+def _summary_request(title, content=None):
+    """요약 요청의 캐시 입력과 payload"""
+    source_text = content if content else title
+
+    prompt = f"""아래의 보안 뉴스 내용을 지식 사전에 등록할 수 있도록 핵심만 요약해줘.
         
-        summary = _call_llm_api_with_retry(payload, timeout=30)
+내용: {source_text[:1500]}
+
+{SUMMARY_RULES}"""
+
+    payload = {
+        "model": LLM_MODEL,
+        "messages": [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "max_tokens": 200,
+        "temperature": 0.3
+    }
+    return [title, source_text[:1500]], payload
+
+
+def summarize_news(title, content=None, client=None):
+    """LM Studio를 사용하여 뉴스 제목과 본문을 기반으로 핵심 요약 생성"""
+    try:
+        inputs, payload = _summary_request(title, content)
+        summary = llm_cache.cached_completion(
+            "news_summary", PROMPT_VERSIONS["news_summary"], inputs, payload,
+            lambda p: _call_llm_api_with_retry(p, timeout=30, client=client)
+        )
         return summary
         
+    except LLMUnavailableError:
+        # 차단 중에는 항목마다 오류를 출력하지 않음 (상태는 llm_breaker.snapshot()으로 확인)
+        return ""
     except Exception as e:
         print(f"로컬 AI 요약 생성 최종 오류: {e}")
         return ""
 
 
-def generate_wiki_content(title, category):
+def stream_summary(title, content=None, client=None):
+    """
+    summarize_news의 스트리밍 버전: 응답 텍스트 조각을 생성하고 끝나면 캐시에 저장
+    캐시에 있으면 전체 요약을 한 조각으로 생성합니다. (실패 시 예외, 차단 중이면 LLMUnavailableError)
+    """
+    inputs, payload = _summary_request(title, content)
+    version = PROMPT_VERSIONS["news_summary"]
+    key = llm_cache.cache_key("news_summary", version, LLM_MODEL, inputs)
+    cached = llm_cache.get(key) if llm_cache.LLM_CACHE_ENABLED else None
+    if cached is not None:
+        yield cached
+        return
+
+    llm_breaker.before_call()
+    pieces = []
+    start = time.perf_counter()
+    try:
+        for piece in (client or llm_client).stream(payload, timeout=30):
+            pieces.append(piece)
+            yield piece
+    except Exception as e:
+        llm_breaker.on_failure(e)
+        raise
+    llm_breaker.on_success()
+    summary = "".join(pieces).strip()
+    if summary and llm_cache.LLM_CACHE_ENABLED:
+        llm_cache.put(key, "news_summary", version, LLM_MODEL, summary, time.perf_counter() - start)
+
+
+def _parse_batch_summaries(text, count):
+    """배치 응답(JSON 배열)에서 {번호: 요약} 추출, 형식이 맞지 않는 항목은 제외"""
+    start, end = text.find("["), text.rfind("]")
+    if start < 0 or end <= start:
+        return {}
+    try:
+        items = json.loads(text[start:end + 1])
+    except ValueError:
+        return {}
+    summaries = {}
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item.get("id"))
+        except (TypeError, ValueError):
+            continue
+        summary = item.get("summary")
+        if 1 <= index <= count and isinstance(summary, str) and summary.strip():
+            summaries[index] = summary.strip()
+    return summaries
+
+
+def summarize_news_batch(articles, client=None):
+    """
+    여러 기사를 한 요청으로 요약 (작성 규칙 등 공통 지시문을 기사마다 반복해 보내지 않음)
+    articles: [(제목, 본문 또는 None), ...] → 같은 순서의 요약 목록
+    캐시에 있는 기사는 제외하고, 응답에서 빠졌거나 JSON 파싱에 실패한 기사는 summarize_news로 하나씩 다시 요청합니다.
+    """
+    sources = [(title, (content if content else title)[:1500]) for title, content in articles]
+    version = PROMPT_VERSIONS["news_summary"]
+    keys = [llm_cache.cache_key("news_summary", version, LLM_MODEL, list(source)) for source in sources]
+    results = [None] * len(articles)
+    if llm_cache.LLM_CACHE_ENABLED:
+        for i, key in enumerate(keys):
+            results[i] = llm_cache.get(key)
+    pending = [i for i, result in enumerate(results) if result is None]
+    with _batch_lock:
+        _batch_counts["articles"] += len(articles)
+
+    if len(pending) > 1:
+        body = "\n\n".join(f"[{n}] {sources[i][1]}" for n, i in enumerate(pending, 1))
+        prompt = f"""아래의 보안 뉴스 {len(pending)}건을 각각 지식 사전에 등록할 수 있도록 핵심만 요약해줘.
+
+{body}
+
+{SUMMARY_RULES}
+6. 다른 설명 없이 JSON 배열로만 답할 것: [{{"id": 기사 번호, "summary": "요약"}}, ...]"""
+        payload = {
+            "model": LLM_MODEL,
+            "messages": [
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 200 * len(pending),
+            "temperature": 0.3
+        }
+        start = time.perf_counter()
+        try:
+            parsed = _parse_batch_summaries(
+                _call_llm_api_with_retry(payload, timeout=30 + 15 * len(pending), client=client), len(pending)
+            )
+        except LLMUnavailableError:
+            return [result or "" for result in results]
+        except Exception as e:
+            print(f"로컬 AI 배치 요약 오류 ({len(pending)}건, 개별 요청으로 전환): {e}")
+            parsed = {}
+        latency = (time.perf_counter() - start) / len(pending)
+        with _batch_lock:
+            _batch_counts["batches"] += 1
+            _batch_counts["fallbacks"] += len(pending) - len(parsed)
+        for n, i in enumerate(pending, 1):
+            if n in parsed:
+                results[i] = parsed[n]
+                if llm_cache.LLM_CACHE_ENABLED:
+                    llm_cache.put(keys[i], "news_summary", version, LLM_MODEL, parsed[n], latency)
+
+    for i in range(len(articles)):
+        if results[i] is None:
+            results[i] = summarize_news(articles[i][0], articles[i][1], client=client)
+    return results
+
+
+def batch_metrics():
+    with _batch_lock:
+        return dict(_batch_counts)
+
+
+def generate_wiki_content(title, category, client=None):
     """LM Studio를 사용하여 지식 사전(Wiki) 상세 내용 생성"""
     try:
         prompt = f"""보안 주제 '{title}'에 대해 지식 사전용 콘텐츠를 전문적이고 상세하게 작성해줘.
@@ -106,7 +543,7 @@ def generate_wiki_content(title, category):
 각 섹션은 명확한 제목과 함께 매끄러운 한국어 문장으로 작성할 것."""
 
         payload = {
-            "model": "local-model",
+            "model": LLM_MODEL,
             "messages": [
                 {"role": "system", "content": "당신은 보안 지식 사전을 집필하는 시니어 보안 아키텍트입니다. 모든 답변은 한자(Chinese characters) 없이 순수 한국어로만 작성해야 합니다. 한자어는 한자를 쓰지 말고 한글로만 표기하십시오."},
                 {"role": "user", "content": prompt}
@@ -115,9 +552,15 @@ def generate_wiki_content(title, category):
             "temperature": 0.5
         }
         
-        content = _call_llm_api_with_retry(payload, timeout=60)
+        content = llm_cache.cached_completion(
+            "wiki_content", PROMPT_VERSIONS["wiki_content"], [title, category], payload,
+            lambda p: _call_llm_api_with_retry(p, timeout=60, client=client)
+        )
         return content
         
+    except LLMUnavailableError:
+        # 차단 중에는 항목마다 오류를 출력하지 않음 (상태는 llm_breaker.snapshot()으로 확인)
+        return None
     except Exception as e:
         print(f"로컬 AI 위키 생성 최종 오류: {e}")
         return None
@@ -0,0 +1,299 @@
+"""
+응답 캐시 (읽기 API 결과 캐싱 + 쓰기 시 태그 단위 무효화)
+
+백엔드:
+    - memory (기본): 프로세스 내 LRU + TTL
+    - local-shared: 공유 캐시(Redis 등)를 흉내내는 로컬 대체 구현 (값을 직렬화하여 저장)
+    - redis: REDIS_URL 로 지정한 Redis (redis 패키지 설치 시)
+
+각 엔트리는 의존하는 테이블 태그('news', 'wiki')를 가지며,
+크롤링/위키 수정/뉴스 삭제 시 해당 태그의 엔트리만 무효화합니다.
+캐시 키에는 태그 테이블의 data_version 값도 들어가므로 다른 프로세스
+(scripts/enrich_worker.py, es_sync.py, reclassify.py 등)가 쓴 변경도 다음 요청부터 반영됩니다.
+"""
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from fastapi import Request, Response
+from fastapi.responses import HTMLResponse
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+# 데이터 변경은 data_version으로 감지하므로 TTL은 오래된 엔트리를 비우는 상한 역할
+CACHE_TTL = int(os.getenv("CACHE_TTL", "60"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "512"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+class LRUBackend:
+    """프로세스 내 LRU + TTL 캐시"""
+
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data = OrderedDict()  # key -> (expires_at, tags, value)
+        self._tags = {}  # tag -> set(key)
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._remove(key)
+                return None
+            self._data.move_to_end(key)
+            return entry[2]
+
+    def set(self, key, value, ttl, tags):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (time.monotonic() + ttl, tags, value)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._data) > self.max_entries:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def invalidate_tags(self, tags):
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys |= self._tags.pop(tag, set())
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._tags.clear()
+
+    def size(self):
+        return len(self._data)
+
+    def _remove(self, key):
+        entry = self._data.pop(key, None)
+        if entry:
+            for tag in entry[1]:
+                keys = self._tags.get(tag)
+                if keys:
+                    keys.discard(key)
+
+
+class LocalSharedBackend:
+    """
+    공유 캐시 백엔드의 로컬 대체 구현
+    Redis와 같은 방식(직렬화된 값 + TTL + 태그 집합)으로 동작하여
+    별도 서버 없이 공유 백엔드 경로를 검증할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._store = {}  # key -> (expires_at, bytes)
+        self._sets = {}  # "tag:<tag>" -> set(key)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None or entry[0] < time.time():
+                self._store.pop(key, None)
+                return None
+            return json.loads(entry[1])
+
+    def set(self, key, value, ttl, tags):
+        payload = json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+        with self._lock:
+            self._store[key] = (time.time() + ttl, payload)
+            for tag in tags:
+                self._sets.setdefault(f"tag:{tag}", set()).add(key)
+
+    def invalidate_tags(self, tags):
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys |= self._sets.pop(f"tag:{tag}", set())
+            for key in keys:
+                self._store.pop(key, None)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
+            self._sets.clear()
+
+    def size(self):
+        return len(self._store)
+
+
+class RedisBackend:
+    """Redis 공유 캐시 백엔드 (여러 워커 프로세스가 캐시를 공유할 때 사용)"""
+
+    def __init__(self, url=REDIS_URL, prefix="respcache:"):
+        import redis
+        self._redis = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key):
+        raw = self._redis.get(self.prefix + key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key, value, ttl, tags):
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        pipe = self._redis.pipeline()
+        pipe.set(self.prefix + key, payload, ex=ttl)
+        for tag in tags:
+            pipe.sadd(f"{self.prefix}tag:{tag}", key)
+        pipe.execute()
+
+    def invalidate_tags(self, tags):
+        keys = set()
+        for tag in tags:
+            tag_key = f"{self.prefix}tag:{tag}"
+            keys |= {k.decode() for k in self._redis.smembers(tag_key)}
+            self._redis.delete(tag_key)
+        if keys:
+            self._redis.delete(*[self.prefix + k for k in keys])
+        return len(keys)
+
+    def clear(self):
+        for key in self._redis.scan_iter(self.prefix + "*"):
+            self._redis.delete(key)
+
+    def size(self):
+        return sum(1 for _ in self._redis.scan_iter(self.prefix + "*"))
+
+
+def _create_backend(name):
+    if name == "redis":
+        try:
+            return RedisBackend()
+        except Exception as e:
+            print(f"[WARNING] Redis 캐시 백엔드 초기화 실패, 메모리 캐시 사용: {e}")
+    elif name == "local-shared":
+        return LocalSharedBackend()
+    return LRUBackend()
+
+
+def _table_versions(tables):
+    """{table_name: version} (조건부 GET 미들웨어가 이미 읽었으면 그 값을 재사용)"""
+    from app.data_version import get_versions, request_versions
+
+    versions = request_versions.get() or {}
+    missing = [t for t in tables if t not in versions]
+    if missing:
+        from app.database import SessionLocal
+        with SessionLocal() as db:
+            versions = {**versions, **get_versions(db, missing)}
+    return {t: versions[t][0] for t in tables}
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+class ResponseCache:
+    """라우트 + 정규화된 파라미터를 키로 하는 응답 캐시"""
+
+    def __init__(self, backend=None, ttl=CACHE_TTL):
+        self.backend = backend or _create_backend(CACHE_BACKEND)
+        self.ttl = ttl
+        self.enabled = ttl > 0
+        self._metrics = {}
+        self._invalidations = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(route, params):
+        items = sorted((k, _normalize(v)) for k, v in params.items())
+        return route + "?" + "&".join(f"{k}={v}" for k, v in items)
+
+    def _count(self, route, field):
+        with self._lock:
+            m = self._metrics.setdefault(route, {"hits": 0, "misses": 0})
+            m[field] += 1
+
+    def get(self, route, key):
+        value = self.backend.get(key) if self.enabled else None
+        self._count(route, "hits" if value is not None else "misses")
+        return value
+
+    def set(self, key, value, tags, ttl=None):
+        if self.enabled:
+            self.backend.set(key, value, ttl or self.ttl, tuple(tags))
+
+    def invalidate(self, *tags):
+        """지정한 태그에 의존하는 엔트리 제거"""
+        removed = self.backend.invalidate_tags(tags)
+        with self._lock:
+            for tag in tags:
+                self._invalidations[tag] = self._invalidations.get(tag, 0) + 1
+        return removed
+
+    def clear(self):
+        self.backend.clear()
+
+    def metrics(self):
+        with self._lock:
+            routes = {r: dict(m) for r, m in self._metrics.items()}
+            invalidations = dict(self._invalidations)
+        hits = sum(m["hits"] for m in routes.values())
+        misses = sum(m["misses"] for m in routes.values())
+        return {
+            "backend": type(self.backend).__name__,
+            "enabled": self.enabled,
+            "ttl": self.ttl,
+            "entries": self.backend.size(),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "routes": routes,
+            "invalidations": invalidations,
+        }
+
+    def cached(self, route, tags, ttl=None):
+        """
+        엔드포인트 데코레이터
+        tags: 튜플 또는 파라미터 dict를 받아 태그 튜플을 반환하는 함수
+        Request/Session 등 값이 아닌 인자는 키에서 제외합니다.
+        """
+        def decorator(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                params = {
+                    k: v for k, v in kwargs.items()
+                    if isinstance(v, (str, int, float, bool)) or v is None
+                }
+                request = next((v for v in kwargs.values() if isinstance(v, Request)), None)
+                if request is not None:
+                    params["_base"] = str(request.base_url)
+                entry_tags = tags(params) if callable(tags) else tags
+                versions = _table_versions(entry_tags)
+                params["_versions"] = ",".join(f"{t}:{versions[t]}" for t in sorted(versions))
+                key = self.make_key(route, params)
+
+                hit = self.get(route, key)
+                if hit is not None:
+                    if hit.get("kind") == "html":
+                        return HTMLResponse(hit["body"])
+                    return hit["data"]
+
+                result = await func(*args, **kwargs)
+                if isinstance(result, Response):
+                    if result.status_code == 200 and result.media_type == "text/html":
+                        self.set(key, {"kind": "html", "body": result.body.decode("utf-8")}, entry_tags, ttl)
+                else:
+                    self.set(key, {"kind": "json", "data": result}, entry_tags, ttl)
+                return result
+            return wrapper
+        return decorator
+
+
+response_cache = ResponseCache()
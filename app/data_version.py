@@ -0,0 +1,59 @@
+"""
+테이블별 데이터 버전 카운터
+
+News/Wiki 행이 바뀌는 플러시마다 같은 트랜잭션 안에서 data_version 의
+해당 테이블 버전을 1 증가시킵니다. ETag 등 캐시 검증자는 이 값만으로 계산됩니다.
+"""
+import contextvars
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from app.models import News, Wiki, DataVersion
+
+VERSIONED = {News: "news", Wiki: "wiki"}
+
+# 조건부 GET 미들웨어가 요청마다 읽은 {table_name: (version, updated_at)} (응답 캐시 키에서 재사용)
+request_versions = contextvars.ContextVar("request_versions", default=None)
+
+
+def bump_versions(connection, tables):
+    """지정한 테이블의 버전 증가 (ORM을 거치지 않는 대량 쓰기 후에도 호출)"""
+    table = DataVersion.__table__
+    now = datetime.now()
+    for name in sorted(set(tables)):
+        stmt = insert(table).values(table_name=name, version=1, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["table_name"],
+            set_={"version": table.c.version + 1, "updated_at": now},
+        )
+        connection.execute(stmt)
+
+
+def touched_tables(session):
+    tables = set()
+    for obj in list(session.new) + list(session.deleted):
+        if type(obj) in VERSIONED:
+            tables.add(VERSIONED[type(obj)])
+    for obj in session.dirty:
+        if type(obj) in VERSIONED and session.is_modified(obj):
+            tables.add(VERSIONED[type(obj)])
+    return tables
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_versions_after_flush(session, flush_context):
+    tables = touched_tables(session)
+    if tables:
+        bump_versions(session.connection(), tables)
+
+
+def get_versions(db, tables):
+    """{table_name: (version, updated_at)}"""
+    rows = db.query(DataVersion).filter(DataVersion.table_name.in_(tables)).all()
+    versions = {name: (0, None) for name in tables}
+    for row in rows:
+        versions[row.table_name] = (row.version, row.updated_at)
+    return versions
@@ -1,23 +1,103 @@
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, AsyncElasticsearch, NotFoundError
 from elasticsearch.helpers import bulk
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
 import os
+import re
+import copy
+import html
+import json
+import base64
+import time
+import threading
+from datetime import datetime
+
+from data_utils import sanitize_html
 
 ES_URL = os.getenv("ELASTICSEARCH_URL", "http://localhost:9200")
+ES_BULK_CHUNK_SIZE = int(os.getenv("ES_BULK_CHUNK_SIZE", "500"))
+ES_BULK_PARALLELISM = int(os.getenv("ES_BULK_PARALLELISM", "2"))
+ES_BULK_MAX_RETRIES = int(os.getenv("ES_BULK_MAX_RETRIES", "3"))
+# 노드당 유지할 keep-alive 연결 수 (bulk 병렬도보다 크게)
+ES_MAX_CONNECTIONS = int(os.getenv("ES_MAX_CONNECTIONS", "10"))
+ES_REQUEST_TIMEOUT = float(os.getenv("ES_REQUEST_TIMEOUT", "5"))
+# 다중 노드 클러스터에서만 켤 것 (도커 단일 노드는 내부 주소를 돌려주므로 끔)
+ES_SNIFF = os.getenv("ES_SNIFF", "false").lower() == "true"
+
+# API 검색 요청의 ES 응답 대기 한도(초)
+ES_SEARCH_TIMEOUT = float(os.getenv("ES_SEARCH_TIMEOUT", "3"))
+ES_SUGGEST_TIMEOUT = float(os.getenv("ES_SUGGEST_TIMEOUT", "0.3"))
+# 기본 검색은 이 건수까지만 정확히 세고 그 이상은 "gte"로 표시 (exact_total=true면 전체 집계)
+ES_TRACK_TOTAL_HITS = int(os.getenv("ES_TRACK_TOTAL_HITS", "10000"))
+# 커서 페이지네이션용 point-in-time 유지 시간 (다음 페이지 요청마다 연장)
+ES_PIT_KEEP_ALIVE = os.getenv("ES_PIT_KEEP_ALIVE", "2m")
+
+_client = None
+_async_client = None
+_client_lock = threading.Lock()
 
 def get_es_client():
-    """Elasticsearch 클라이언트 생성 (연결 타임아웃 설정)"""
-    return Elasticsearch([ES_URL], request_timeout=5)
+    """
+    프로세스 전역 Elasticsearch 클라이언트 반환
+    연결 풀을 재사용하도록 최초 호출 시 한 번만 생성합니다. (스레드 안전)
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                options = {
+                    "request_timeout": ES_REQUEST_TIMEOUT,
+                    "connections_per_node": ES_MAX_CONNECTIONS,
+                    "retry_on_timeout": True,
+                    "max_retries": 2,
+                    "http_compress": True,
+                }
+                if ES_SNIFF:
+                    options.update(sniff_on_start=True, sniff_on_node_failure=True,
+                                   min_delay_between_sniffing=60)
+                _client = Elasticsearch([ES_URL], **options)
+    return _client
 
-def create_indices():
-    """인덱스 생성 (한글 형태소 분석기 nori 사용)"""
-    es = get_es_client()
-    
-    news_index = {
-        "settings": {"analysis": {"analyzer": {"nori_analyzer": {"type": "custom", "tokenizer": "nori_tokenizer", "filter": ["lowercase"]}}}},
+def get_async_es_client():
+    """
+    API 검색 경로용 AsyncElasticsearch (aiohttp) 클라이언트
+    이벤트 루프를 막지 않도록 검색은 이 클라이언트로 수행합니다. 서버 루프 안에서 최초 생성됩니다.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncElasticsearch(
+            [ES_URL], request_timeout=ES_SEARCH_TIMEOUT,
+            connections_per_node=ES_MAX_CONNECTIONS, http_compress=True
+        )
+    return _async_client
+
+async def close_async_es_client():
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+
+def close_es_client():
+    """서버 종료 시 연결 풀 정리"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+# 인덱스 정의 (분석기/매핑 변경 시 여기 수정 후 scripts/reindex_es.py 실행)
+NORI_SETTINGS = {"analysis": {"analyzer": {"nori_analyzer": {"type": "custom", "tokenizer": "nori_tokenizer", "filter": ["lowercase"]}}}}
+
+# 자동완성용 completion 필드 (제목 첫머리 접두어 조회)
+TITLE_SUGGEST_FIELD = {"type": "completion", "analyzer": "simple", "max_input_length": 100}
+
+INDEX_DEFINITIONS = {
+    "news": {
+        "settings": NORI_SETTINGS,
         "mappings": {
             "properties": {
                 "id": {"type": "integer"},
-                "title": {"type": "text", "analyzer": "nori_analyzer", "fields": {"keyword": {"type": "keyword"}}},
+                "title": {"type": "text", "analyzer": "nori_analyzer", "fields": {"keyword": {"type": "keyword"}, "suggest": TITLE_SUGGEST_FIELD}},
                 "source": {"type": "keyword"},
                 "date": {"type": "date", "format": "yyyy-MM-dd"},
                 "summary": {"type": "text", "analyzer": "nori_analyzer"},
@@ -26,14 +106,13 @@ def create_indices():
                 "created_at": {"type": "date"}
             }
         }
-    }
-    
-    wiki_index = {
-        "settings": {"analysis": {"analyzer": {"nori_analyzer": {"type": "custom", "tokenizer": "nori_tokenizer", "filter": ["lowercase"]}}}},
+    },
+    "wiki": {
+        "settings": NORI_SETTINGS,
         "mappings": {
             "properties": {
                 "id": {"type": "integer"},
-                "title": {"type": "text", "analyzer": "nori_analyzer", "fields": {"keyword": {"type": "keyword"}}},
+                "title": {"type": "text", "analyzer": "nori_analyzer", "fields": {"keyword": {"type": "keyword"}, "suggest": TITLE_SUGGEST_FIELD}},
                 "category": {"type": "keyword"},
                 "preview": {"type": "text", "analyzer": "nori_analyzer"},
                 "content": {"type": "text", "analyzer": "nori_analyzer"},
@@ -42,97 +121,391 @@ def create_indices():
                 "created_at": {"type": "date"}
             }
         }
-    }
-    
-    if not es.indices.exists(index="news"):
-        es.indices.create(index="news", body=news_index)
-    if not es.indices.exists(index="wiki"):
-        es.indices.create(index="wiki", body=wiki_index)
+    },
+}
 
-def index_news(news_item):
+# 색인 완료 후 복원할 레플리카 수 (단일 노드 개발 환경은 0 권장)
+ES_NUMBER_OF_REPLICAS = int(os.getenv("ES_NUMBER_OF_REPLICAS", "1"))
+
+def versioned_index_name(alias):
+    """별칭 뒤의 실제 인덱스 이름 (예: news_v20260101120000)"""
+    return f"{alias}_v{datetime.now().strftime('%Y%m%d%H%M%S%f')[:17]}"
+
+def _create_physical_index(es, alias, name, bulk_load=False):
+    body = copy.deepcopy(INDEX_DEFINITIONS[alias])
+    if bulk_load:
+        # 대량 적재 중에는 refresh/레플리카 복제를 끄고 완료 후 복원
+        body["settings"]["index"] = {"refresh_interval": "-1", "number_of_replicas": 0}
+    else:
+        body["settings"]["index"] = {"number_of_replicas": ES_NUMBER_OF_REPLICAS}
+    es.indices.create(index=name, body=body)
+
+def alias_targets(alias, es=None):
+    """별칭이 가리키는 실제 인덱스 목록"""
+    es = es or get_es_client()
+    if not es.indices.exists_alias(name=alias):
+        return []
+    return sorted(es.indices.get_alias(name=alias).keys())
+
+def create_indices():
+    """
+    news/wiki 별칭과 버전 인덱스 생성 (한글 형태소 분석기 nori 사용)
+    이미 있으면 그대로 둡니다. 별칭이 아닌 예전 고정 인덱스는 reindex 시 별칭으로 전환됩니다.
+    """
+    es = get_es_client()
+    for alias in INDEX_DEFINITIONS:
+        if es.indices.exists(index=alias):
+            if not es.indices.exists_alias(name=alias):
+                print(f"ℹ️ '{alias}'는 예전 방식의 고정 인덱스입니다. scripts/reindex_es.py로 별칭 방식으로 전환하세요.")
+            continue
+        name = versioned_index_name(alias)
+        _create_physical_index(es, alias, name)
+        es.indices.put_alias(index=name, name=alias)
+
+def rebuild_index(alias, chunk_size=None, parallelism=None, keep=1):
+    """
+    무중단 재색인
+    1) 새 버전 인덱스를 refresh 비활성, 레플리카 0으로 생성해 DB 전체를 bulk 적재
+    2) 설정 복원 후 별칭을 원자적으로 새 인덱스로 전환 (검색은 전환 직전까지 이전 인덱스 사용)
+    3) 이전 버전은 최근 keep개만 남기고 삭제
+    적재 중 들어온 변경은 이전 인덱스로 반영되므로 전환 후 정합성 검사로 대기열에 재등록합니다.
+    """
     es = get_es_client()
-    doc = {
+    new_index = versioned_index_name(alias)
+    _create_physical_index(es, alias, new_index, bulk_load=True)
+    try:
+        stats = reindex_from_db(alias, chunk_size=chunk_size, parallelism=parallelism, target_index=new_index)
+        es.indices.put_settings(index=new_index, settings={
+            "index": {"refresh_interval": None, "number_of_replicas": ES_NUMBER_OF_REPLICAS}
+        })
+        es.indices.refresh(index=new_index)
+    except Exception:
+        es.indices.delete(index=new_index, ignore_unavailable=True)
+        raise
+
+    old_indices = alias_targets(alias, es)
+    actions = [{"remove": {"index": old, "alias": alias}} for old in old_indices]
+    actions.append({"add": {"index": new_index, "alias": alias}})
+    if not old_indices and es.indices.exists(index=alias):
+        # 예전 고정 인덱스를 같은 요청에서 삭제해야 같은 이름의 별칭을 만들 수 있음
+        actions.append({"remove_index": {"index": alias}})
+    es.indices.update_aliases(actions=actions)
+
+    versions = sorted(name for name in es.indices.get(index=f"{alias}_v*").keys() if name != new_index)
+    expired = versions[:max(len(versions) - keep, 0)]
+    for name in expired:
+        es.indices.delete(index=name, ignore_unavailable=True)
+
+    stats.update(index=new_index, previous=old_indices, deleted=expired)
+    return stats
+
+_BR_TAG = re.compile(r"<br\s*/?>", re.IGNORECASE)
+
+
+def _plain_text(value):
+    """색인용 일반 텍스트 (태그 제거, 엔티티 복원) - 강조 조각은 html 인코더가 다시 이스케이프함"""
+    text = html.unescape(sanitize_html(_BR_TAG.sub(" ", value or "")))
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def news_document(news_item):
+    # 요약의 <br>은 강조 조각에서 &lt;br&gt;로 이스케이프되므로 색인 전에 공백으로 바꿈
+    return {
         "id": news_item.id, "title": news_item.title, "source": news_item.source,
-        "date": news_item.date, "summary": news_item.summary or "", "category": news_item.category,
+        "date": news_item.date, "summary": _BR_TAG.sub(" ", news_item.summary or ""), "category": news_item.category,
         "url": news_item.url, "created_at": news_item.created_at
     }
-    es.index(index="news", id=news_item.id, document=doc)
 
-def index_wiki(wiki_item):
-    es = get_es_client()
-    doc = {
+def wiki_document(wiki_item):
+    return {
         "id": wiki_item.id, "title": wiki_item.title, "category": wiki_item.category,
-        "preview": wiki_item.preview or "", "content": wiki_item.content or "",
+        # 본문은 LLM이 만든 HTML이므로 태그를 뺀 텍스트로 색인 (검색/강조 조각용, _source로는 반환하지 않음)
+        "preview": wiki_item.preview or "", "content": _plain_text(wiki_item.content),
         "type": wiki_item.type, "tags": [tag.strip() for tag in (wiki_item.tags or "").split(",") if tag.strip()],
         "created_at": wiki_item.created_at
     }
-    es.index(index="wiki", id=wiki_item.id, document=doc)
 
-def _build_query_dsl(query, fields, category, page, limit):
-    """검색어, 필터, 페이지네이션을 포함한 Elasticsearch DSL을 생성합니다."""
+def index_news(news_item):
+    es = get_es_client()
+    es.index(index="news", id=news_item.id, document=news_document(news_item))
+
+def index_wiki(wiki_item):
+    es = get_es_client()
+    es.index(index="wiki", id=wiki_item.id, document=wiki_document(wiki_item))
+
+def _send_bulk_chunk(es, index, docs, max_retries):
+    """_bulk 요청 1회분 전송, 실패한 문서만 지수 백오프로 재시도. (성공 수, 실패 수) 반환"""
+    pending = {doc["id"]: doc for doc in docs}
+    indexed = 0
+    failed = 0
+    for attempt in range(max_retries + 1):
+        actions = [{"_index": index, "_id": doc_id, "_source": doc} for doc_id, doc in pending.items()]
+        try:
+            success, errors = bulk(es, actions, raise_on_error=False, stats_only=False)
+        except Exception as e:
+            # 연결 오류 등 요청 전체 실패 → 청크 전체 재시도
+            print(f"bulk 요청 오류 ({index}, {len(pending)}건): {e}")
+            success, errors = 0, [{"index": {"_id": doc_id, "status": 503}} for doc_id in pending]
+
+        indexed += success
+        retryable = {}
+        for err in errors:
+            item = next(iter(err.values()))
+            doc_id = int(item["_id"])
+            # 429/5xx만 재시도, 매핑 오류 등 4xx는 영구 실패
+            if item.get("status", 500) == 429 or item.get("status", 500) >= 500:
+                retryable[doc_id] = pending[doc_id]
+        permanent = len(errors) - len(retryable)
+        if permanent:
+            print(f"bulk 색인 영구 실패 {permanent}건 ({index})")
+            failed += permanent
+        if not retryable:
+            return indexed, failed
+        pending = retryable
+        if attempt < max_retries:
+            time.sleep(min(0.5 * (2 ** attempt), 10))
+    return indexed, failed + len(pending)
+
+def bulk_index(index, documents, chunk_size=None, parallelism=None, max_retries=None, es=None):
+    """
+    문서 스트림을 chunk_size 단위 _bulk 요청으로 병렬 색인
+    동시에 처리 중인 청크 수를 parallelism으로 제한해 메모리 사용량을 일정하게 유지합니다.
+    """
+    chunk_size = chunk_size or ES_BULK_CHUNK_SIZE
+    parallelism = parallelism or ES_BULK_PARALLELISM
+    max_retries = ES_BULK_MAX_RETRIES if max_retries is None else max_retries
+    es = es or get_es_client()
+
+    stats = {"index": index, "indexed": 0, "failed": 0}
+    start = time.perf_counter()
+    docs = iter(documents)
+    with ThreadPoolExecutor(max_workers=parallelism) as pool:
+        in_flight = set()
+        while True:
+            chunk = list(islice(docs, chunk_size))
+            if chunk:
+                in_flight.add(pool.submit(_send_bulk_chunk, es, index, chunk, max_retries))
+            if in_flight and (len(in_flight) >= parallelism or not chunk):
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    ok, failed = future.result()
+                    stats["indexed"] += ok
+                    stats["failed"] += failed
+            if not chunk and not in_flight:
+                break
+
+    stats["elapsed"] = round(time.perf_counter() - start, 3)
+    stats["docs_per_sec"] = round(stats["indexed"] / stats["elapsed"], 1) if stats["elapsed"] else 0.0
+    return stats
+
+def reindex_from_db(index, chunk_size=None, parallelism=None, target_index=None):
+    """SQLite의 뉴스/위키 전체를 yield_per로 스트리밍하며 bulk 색인"""
+    from app.database import SessionLocal
+    from app.models import News, Wiki
+
+    model, to_doc = {"news": (News, news_document), "wiki": (Wiki, wiki_document)}[index]
+    chunk_size = chunk_size or ES_BULK_CHUNK_SIZE
+    db = SessionLocal()
+    try:
+        rows = db.query(model).order_by(model.id).yield_per(chunk_size)
+        return bulk_index(target_index or index, (to_doc(row) for row in rows),
+                          chunk_size=chunk_size, parallelism=parallelism)
+    finally:
+        db.close()
+
+# 인덱스별 검색 설정
+# - fields: 검색 대상 필드와 가중치
+# - source: 결과 목록이 실제로 그리는 필드만 반환 (위키 본문 content 등은 제외)
+# - highlight: 본문 대신 돌려줄 검색어 강조 조각 (html 인코딩 후 <mark> 태그, 색인된 텍스트에 HTML 태그가 없어야 함)
+# - facets: 같은 요청에서 집계할 terms 필터 항목
+SEARCH_SPECS = {
+    "news": {
+        "fields": ["title^3", "summary"],
+        "source": ["id", "title", "source", "date", "summary", "category", "url"],
+        "highlight": {
+            "title": {"number_of_fragments": 0},
+            "summary": {"fragment_size": 150, "number_of_fragments": 1},
+        },
+        "facets": ["category", "source"],
+    },
+    "wiki": {
+        "fields": ["title^3", "preview", "content", "tags"],
+        "source": ["id", "title", "category", "type", "tags", "preview"],
+        "highlight": {
+            "title": {"number_of_fragments": 0},
+            "content": {"fragment_size": 150, "number_of_fragments": 1},
+        },
+        "facets": ["category", "type"],
+    },
+}
+FACET_SIZE = 20
+
+def _build_query_dsl(query, index, category, page, limit, exact_total=False, search_after=None, facets=True):
+    """
+    검색어, 필터, 정렬, 페이지네이션을 포함한 Elasticsearch DSL을 생성합니다.
+    search_after가 주어지면 from 대신 커서 위치부터 조회합니다. (id를 타이브레이커로 사용)
+    전체 건수는 기본적으로 ES_TRACK_TOTAL_HITS까지만 세고, exact_total=True일 때만 정확히 셉니다.
+    카테고리는 post_filter로 적용하여 facets 집계에는 다른 카테고리 건수도 함께 나오게 합니다.
+    """
+    spec = SEARCH_SPECS[index]
     if query:
-        base_query = {"multi_match": {"query": query, "fields": fields, "type": "best_fields"}}
+        base_query = {"multi_match": {"query": query, "fields": spec["fields"], "type": "best_fields"}}
+        sort = [{"_score": "desc"}, {"id": "asc"}]
     else:
         base_query = {"match_all": {}}
+        sort = [{"created_at": "desc"}, {"id": "desc"}]
 
-    must_clauses = [base_query]
+    dsl = {
+        "query": base_query,
+        "_source": spec["source"],
+        "size": limit,
+        "sort": sort,
+        "track_total_hits": True if exact_total else ES_TRACK_TOTAL_HITS
+    }
     if category:
-         must_clauses.append({"term": {"category": category}})
+        dsl["post_filter"] = {"term": {"category": category}}
+    if query:
+        dsl["highlight"] = {
+            "encoder": "html", "pre_tags": ["<mark>"], "post_tags": ["</mark>"],
+            "fields": spec["highlight"]
+        }
+    if facets:
+        dsl["aggs"] = {name: {"terms": {"field": name, "size": FACET_SIZE}} for name in spec["facets"]}
+    if search_after is None:
+        dsl["from"] = (page - 1) * limit
+    else:
+        dsl["search_after"] = search_after
+    return dsl
+
+class InvalidCursor(ValueError):
+    pass
 
+def encode_cursor(state):
+    raw = json.dumps(state, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor):
+    """커서 문자열 → 상태 dict (형식이 잘못되면 InvalidCursor)"""
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except Exception:
+        raise InvalidCursor("잘못된 커서입니다")
+    if not isinstance(state, dict) or "after" not in state or state.get("i") not in SEARCH_SPECS:
+        raise InvalidCursor("잘못된 커서입니다")
+    return state
+
+def _result_item(hit):
+    doc = hit["_source"]
+    if isinstance(doc.get("tags"), list):
+        # SQLite 결과와 같은 쉼표 구분 문자열로 통일
+        doc["tags"] = ",".join(doc["tags"])
+    if "highlight" in hit:
+        doc["highlight"] = {field: " … ".join(parts) for field, parts in hit["highlight"].items()}
+    return doc
+
+def _hits(result):
+    total = result["hits"]["total"]
     return {
-        "query": {"bool": {"must": must_clauses}},
-        "from": (page - 1) * limit,
-        "size": limit,
-        "track_total_hits": True
+        "results": [_result_item(hit) for hit in result["hits"]["hits"]],
+        "total": total["value"],
+        "total_relation": total.get("relation", "eq"),
+        "facets": {
+            name: [{"key": b["key"], "count": b["doc_count"]} for b in agg["buckets"]]
+            for name, agg in result.get("aggregations", {}).items()
+        },
     }
 
-def search_news(query, page=1, limit=20, category=None):
+async def _pit_search(es, index, dsl, pit_id):
+    """PIT로 검색, PIT가 만료되었으면 새로 열어 같은 search_after 위치부터 재시도"""
+    if pit_id is None:
+        pit_id = (await es.open_point_in_time(index=index, keep_alive=ES_PIT_KEEP_ALIVE))["id"]
+    try:
+        return await es.search(body={**dsl, "pit": {"id": pit_id, "keep_alive": ES_PIT_KEEP_ALIVE}}), pit_id
+    except NotFoundError:
+        pit_id = (await es.open_point_in_time(index=index, keep_alive=ES_PIT_KEEP_ALIVE))["id"]
+        return await es.search(body={**dsl, "pit": {"id": pit_id, "keep_alive": ES_PIT_KEEP_ALIVE}}), pit_id
+
+async def search_index(index, query, page=1, limit=20, category=None, cursor=None, exact_total=False, timeout=None):
+    """
+    단일 인덱스 검색
+    - cursor 없음: from/size로 page 조회 (첫 페이지 등 얕은 페이지용, PIT 비용 없음)
+    - cursor 있음: point-in-time + search_after로 다음 페이지 조회 (깊이와 무관하게 일정한 비용)
+    결과에 다음 페이지 커서(next_cursor)를 포함합니다. 커서는 원래 검색어/카테고리를 담고 있습니다.
+    """
+    es = get_async_es_client().options(request_timeout=timeout or ES_SEARCH_TIMEOUT)
+    pit_id = None
+    if cursor:
+        state = decode_cursor(cursor)
+        if state["i"] != index:
+            raise InvalidCursor("커서의 인덱스가 요청과 다릅니다")
+        query, category, page = state.get("q", ""), state.get("c"), state.get("n", 1)
+        # 집계는 첫 페이지에서만 (커서 페이지는 결과만 조회)
+        dsl = _build_query_dsl(query, index, category, page, limit, exact_total, state["after"], facets=False)
+        result, pit_id = await _pit_search(es, index, dsl, state.get("pit"))
+        pit_id = result.get("pit_id", pit_id)
+    else:
+        dsl = _build_query_dsl(query, index, category, page, limit, exact_total)
+        result = await es.search(index=index, body=dsl)
+
+    hits = result["hits"]["hits"]
+    response = _hits(result)
+    response["page"] = page
+    response["next_cursor"] = None
+    if len(hits) == limit:
+        # 첫 커서에는 PIT가 없고, 커서로 처음 넘어갈 때 PIT를 엽니다.
+        response["next_cursor"] = encode_cursor({
+            "i": index, "q": query, "c": category, "n": page + 1,
+            "after": hits[-1]["sort"], "pit": pit_id
+        })
+    elif pit_id:
+        # 마지막 페이지 → PIT 즉시 해제
+        try:
+            await es.close_point_in_time(id=pit_id)
+        except Exception:
+            pass
+    return response
+
+async def search_news(query, page=1, limit=20, category=None, cursor=None, exact_total=False, timeout=None):
     """뉴스 인덱스만 검색합니다."""
-    es = get_es_client()
-    dsl = _build_query_dsl(query, ["title^3", "summary"], category, page, limit)
-    results = es.search(index="news", body=dsl)
-    
-    return {
-        "results": [hit["_source"] for hit in results["hits"]["hits"]],
-        "total": results["hits"]["total"]["value"]
-    }
+    return await search_index("news", query, page, limit, category, cursor, exact_total, timeout)
 
-def search_wiki(query, page=1, limit=20, category=None):
+async def search_wiki(query, page=1, limit=20, category=None, cursor=None, exact_total=False, timeout=None):
     """위키 인덱스만 검색합니다."""
-    es = get_es_client()
-    dsl = _build_query_dsl(query, ["title^3", "preview", "content", "tags"], category, page, limit)
-    results = es.search(index="wiki", body=dsl)
-    
+    return await search_index("wiki", query, page, limit, category, cursor, exact_total, timeout)
+
+async def search_all(query, page=1, limit=20, category=None, exact_total=False, timeout=None):
+    """뉴스와 위키 통합 검색 (msearch 한 번으로 결과, 강조 조각, 필터 집계를 함께 조회)"""
+    es = get_async_es_client().options(request_timeout=timeout or ES_SEARCH_TIMEOUT)
+
+    # msearch 요청 생성 (뉴스, 위키 순서)
+    request_body = [
+        {"index": "news"}, _build_query_dsl(query, "news", category, page, limit, exact_total),
+        {"index": "wiki"}, _build_query_dsl(query, "wiki", category, page, limit, exact_total),
+    ]
+    responses = await es.msearch(body=request_body)
+
+    news = _hits(responses["responses"][0])
+    wiki = _hits(responses["responses"][1])
     return {
-        "results": [hit["_source"] for hit in results["hits"]["hits"]],
-        "total": results["hits"]["total"]["value"]
+        "news": news["results"],
+        "news_total": news["total"],
+        "news_total_relation": news["total_relation"],
+        "wiki": wiki["results"],
+        "wiki_total": wiki["total"],
+        "facets": {"news": news["facets"], "wiki": wiki["facets"]},
     }
 
-def search_all(query, page=1, limit=20, category=None):
-    """뉴스와 위키 통합 검색 (msearch를 사용하여 단일 요청으로 최적화)"""
-    es = get_es_client()
-    
-    # 뉴스 검색 DSL
-    news_dsl = _build_query_dsl(query, ["title^3", "summary"], category, page, limit)
-    
-    # 위키 검색 DSL
-    wiki_dsl = _build_query_dsl(query, ["title^3", "preview", "content", "tags"], category, page, limit)
-
-    # msearch 요청 생성
-    request_body = []
-    request_body.append({"index": "news"})
-    request_body.append(news_dsl)
-    request_body.append({"index": "wiki"})
-    request_body.append(wiki_dsl)
-    
-    responses = es.msearch(body=request_body)
-    
-    news_results = responses['responses'][0]
-    wiki_results = responses['responses'][1]
-    
-    return {
-        "news": [hit["_source"] for hit in news_results["hits"]["hits"]],
-        "news_total": news_results["hits"]["total"]["value"],
-        "wiki": [hit["_source"] for hit in wiki_results["hits"]["hits"]],
-        "wiki_total": wiki_results["hits"]["total"]["value"],
-    }
\ No newline at end of file
+async def suggest_titles(prefix, limit=8, timeout=None):
+    """news/wiki 제목 completion suggester 조회 (문서 본문 없이 id/title만)"""
+    es = get_async_es_client().options(request_timeout=timeout or ES_SUGGEST_TIMEOUT)
+    result = await es.search(index="news,wiki", body={
+        "_source": ["id", "title"],
+        "suggest": {"title": {"prefix": prefix, "completion": {
+            "field": "title.suggest", "size": limit, "skip_duplicates": True
+        }}}
+    })
+    return [
+        # _index는 버전 인덱스 이름(news_v...)이므로 별칭 이름으로 변환
+        {"type": option["_index"].split("_v")[0], "id": option["_source"]["id"], "title": option["_source"]["title"]}
+        for option in result["suggest"]["title"][0]["options"]
+    ]
@@ -0,0 +1,276 @@
+"""
+LLM 보강 작업 대기열
+
+크롤러는 원문 기반 요약/폴백 본문으로 뉴스와 위키를 즉시 저장하고
+AI 요약(news_summary)과 위키 본문 생성(wiki_content) 작업만 enrichment_jobs에 기록합니다.
+EnrichmentWorkerPool이 작업을 가져가 LLM을 호출한 뒤 결과를 반영하며,
+반영은 ORM 수정이므로 통계/ETag/ES 동기화 훅이 그대로 적용됩니다.
+
+LLM 회로 차단기(ai_summarizer.llm_breaker)가 열려 있으면 작업을 가져가지 않고,
+처리 도중 차단된 작업은 시도 횟수를 소모하지 않고 차단 해제 시각 이후로 미룹니다.
+
+작업은 available_at 임대 방식으로 가져가므로 서버 내 워커와
+scripts/enrich_worker.py를 동시에 실행해도 같은 작업을 중복 처리하지 않습니다.
+"""
+import os
+import json
+import threading
+from datetime import datetime, timedelta
+
+import bleach
+from sqlalchemy import event, func, update, delete, or_
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import News, Wiki, EnrichmentJob
+from app.llm_scheduler import llm_priority
+
+ENRICH_WORKERS = int(os.getenv("ENRICH_WORKERS", "1"))
+ENRICH_MAX_ATTEMPTS = int(os.getenv("ENRICH_MAX_ATTEMPTS", "5"))
+ENRICH_POLL_INTERVAL = float(os.getenv("ENRICH_POLL_INTERVAL", "5"))
+# 처리 중 워커가 죽었을 때 다른 워커가 다시 가져갈 수 있게 되는 시간(초)
+ENRICH_LEASE_SECONDS = int(os.getenv("ENRICH_LEASE_SECONDS", "600"))
+ENRICH_MAX_BACKOFF = 3600
+
+WIKI_ALLOWED_TAGS = ['p', 'a', 'strong', 'em', 'ul', 'li', 'h1', 'h2', 'h3']
+
+# 엔티티별 작업 종류 (작업은 (kind, entity_id)로 유일)
+JOB_KINDS = {News: "news_summary", Wiki: "wiki_content"}
+
+
+class EnrichmentFailed(Exception):
+    pass
+
+
+class EnrichmentDeferred(Exception):
+    """LLM 사용 불가로 나중에 다시 처리할 작업"""
+
+
+def _llm_unavailable():
+    from app.ai_summarizer import llm_breaker
+    return llm_breaker.state != "closed"
+
+
+def _llm_ready():
+    from app.ai_summarizer import llm_breaker
+    return llm_breaker.ready()
+
+
+def _llm_retry_after():
+    from app.ai_summarizer import llm_breaker
+    return llm_breaker.retry_after()
+
+
+def enqueue(db, kind, entity_id, payload):
+    """작업 추가 (호출한 쪽의 트랜잭션에 포함되어 뉴스/위키 저장과 함께 커밋됨)"""
+    db.add(EnrichmentJob(
+        kind=kind, entity_id=entity_id, status="pending", attempts=0,
+        payload=json.dumps(payload, ensure_ascii=False), available_at=datetime.now()
+    ))
+
+
+def requeue(db, kind, entity_id, payload):
+    """작업이 이미 있으면(완료/실패 포함) 다시 대기 상태로, 없으면 새로 추가 (커밋은 호출한 쪽에서)"""
+    job = db.query(EnrichmentJob).filter(EnrichmentJob.kind == kind, EnrichmentJob.entity_id == entity_id).first()
+    if job is None:
+        enqueue(db, kind, entity_id, payload)
+        return
+    if job.status == "running":
+        return
+    job.status = "pending"
+    job.attempts = 0
+    job.payload = json.dumps(payload, ensure_ascii=False)
+    job.available_at = datetime.now()
+    job.finished_at = None
+
+
+@event.listens_for(Session, "after_flush")
+def _delete_jobs_of_deleted(session, flush_context):
+    # SQLite는 삭제된 최대 id를 다음 행에 다시 쓰므로, 남은 작업이 새 행의 작업 등록과 충돌하지 않게 함께 삭제
+    ids = {}
+    for obj in session.deleted:
+        if type(obj) in JOB_KINDS and obj.id is not None:
+            ids.setdefault(JOB_KINDS[type(obj)], []).append(obj.id)
+    for kind, entity_ids in ids.items():
+        session.connection().execute(
+            delete(EnrichmentJob).where(EnrichmentJob.kind == kind, EnrichmentJob.entity_id.in_(entity_ids))
+        )
+
+
+def claim_job(db):
+    """처리 가능한 작업 하나를 임대하여 반환 (없으면 None)"""
+    now = datetime.now()
+    while True:
+        job = db.query(EnrichmentJob).filter(
+            or_(EnrichmentJob.status == "pending", EnrichmentJob.status == "running"),
+            EnrichmentJob.available_at <= now
+        ).order_by(EnrichmentJob.available_at, EnrichmentJob.id).first()
+        if job is None:
+            db.rollback()
+            return None
+        # 다른 워커가 먼저 가져갔다면 rowcount가 0 → 다음 후보 시도
+        claimed = db.execute(update(EnrichmentJob).where(
+            EnrichmentJob.id == job.id,
+            EnrichmentJob.status == job.status,
+            EnrichmentJob.available_at == job.available_at
+        ).values(
+            status="running", attempts=EnrichmentJob.attempts + 1,
+            available_at=now + timedelta(seconds=ENRICH_LEASE_SECONDS)
+        )).rowcount
+        db.commit()
+        if claimed:
+            db.refresh(job)
+            return job
+
+
+def _preview(summary):
+    return (bleach.clean(summary[:200]) + '...') if len(summary) > 200 else bleach.clean(summary)
+
+
+def _enrich_news_summary(db, job, payload):
+    from app.ai_summarizer import summarize_news
+
+    summary = summarize_news(payload["title"], payload.get("text") or None)
+    if not summary:
+        if _llm_unavailable():
+            raise EnrichmentDeferred("LLM 사용 불가")
+        raise EnrichmentFailed("AI 요약 생성 실패")
+
+    news = db.get(News, job.entity_id)
+    if news is not None:
+        news.summary = bleach.clean(summary)
+    # 함께 생성된 자동 위키의 미리보기도 AI 요약으로 교체
+    wiki = db.get(Wiki, payload["wiki_id"]) if payload.get("wiki_id") else None
+    if wiki is not None and wiki.type == "auto":
+        wiki.preview = _preview(summary)
+    return {"news"} | ({"wiki"} if wiki is not None else set())
+
+
+def _enrich_wiki_content(db, job, payload):
+    from app.ai_summarizer import generate_wiki_content
+
+    content = generate_wiki_content(payload["title"], payload["category"])
+    if not content:
+        if _llm_unavailable():
+            raise EnrichmentDeferred("LLM 사용 불가")
+        raise EnrichmentFailed("AI 위키 본문 생성 실패")
+
+    wiki = db.get(Wiki, job.entity_id)
+    if wiki is not None:
+        wiki.content = bleach.clean(content, tags=WIKI_ALLOWED_TAGS)
+    return {"wiki"}
+
+
+HANDLERS = {
+    "news_summary": _enrich_news_summary,
+    "wiki_content": _enrich_wiki_content,
+}
+
+
+def process_job(db, job):
+    """작업 1건 처리, 변경된 테이블 집합 반환 (실패 시 백오프 후 재시도, 한도 초과 시 failed)"""
+    try:
+        # LLM 호출 동안에는 DB 트랜잭션을 열어두지 않음 (화면 요청보다 뒤, 일괄 도구보다 앞 순서)
+        with llm_priority("enrichment", job.kind):
+            changed = HANDLERS[job.kind](db, job, json.loads(job.payload or "{}"))
+        job.status = "done"
+        job.last_error = None
+        job.finished_at = datetime.now()
+        db.commit()
+        return changed
+    except EnrichmentDeferred as e:
+        # 시도 횟수를 되돌리고 차단 해제 예정 시각 이후로 미룸
+        db.rollback()
+        job = db.get(EnrichmentJob, job.id)
+        job.status = "pending"
+        job.attempts = max(job.attempts - 1, 0)
+        job.last_error = str(e)
+        job.available_at = datetime.now() + timedelta(seconds=max(_llm_retry_after(), 1))
+        db.commit()
+        return set()
+    except Exception as e:
+        db.rollback()
+        job = db.get(EnrichmentJob, job.id)
+        job.last_error = str(e)[:500]
+        if job.attempts >= ENRICH_MAX_ATTEMPTS:
+            job.status = "failed"
+            job.finished_at = datetime.now()
+        else:
+            job.status = "pending"
+            job.available_at = datetime.now() + timedelta(seconds=min(60 * 2 ** (job.attempts - 1), ENRICH_MAX_BACKOFF))
+        db.commit()
+        print(f"보강 작업 실패 ({job.kind} #{job.entity_id}, {job.attempts}회): {e}")
+        return set()
+
+
+def drain(max_jobs=None, on_done=None):
+    """현재 처리 가능한 작업을 모두(또는 max_jobs건) 처리하고 처리 건수 반환"""
+    db = SessionLocal()
+    processed = 0
+    try:
+        while max_jobs is None or processed < max_jobs:
+            if not _llm_ready():
+                # 차단 중에는 작업을 가져가지 않음 (대기열에 그대로 남김)
+                break
+            job = claim_job(db)
+            if job is None:
+                break
+            changed = process_job(db, job)
+            processed += 1
+            if changed and on_done:
+                on_done(changed)
+    finally:
+        db.close()
+    return processed
+
+
+def queue_stats(db):
+    counts = dict(db.query(EnrichmentJob.status, func.count(EnrichmentJob.id)).group_by(EnrichmentJob.status).all())
+    return {status: counts.get(status, 0) for status in ("pending", "running", "done", "failed")}
+
+
+def retry_failed(db):
+    """failed 작업을 다시 대기 상태로 되돌림"""
+    count = db.query(EnrichmentJob).filter(EnrichmentJob.status == "failed").update({
+        "status": "pending", "attempts": 0, "available_at": datetime.now(), "finished_at": None
+    })
+    db.commit()
+    return count
+
+
+class EnrichmentWorkerPool:
+    """백그라운드 스레드 workers개로 대기열을 처리 (LLM 서버 처리 속도와 크롤링을 분리)"""
+
+    def __init__(self, workers=ENRICH_WORKERS, on_done=None, poll_interval=ENRICH_POLL_INTERVAL):
+        self.workers = workers
+        self.on_done = on_done
+        self.poll_interval = poll_interval
+        self.processed = 0
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        if any(t.is_alive() for t in self._threads):
+            return
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"enrichment-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                count = drain(max_jobs=1, on_done=self.on_done)
+            except Exception as e:
+                print(f"보강 워커 오류: {e}")
+                count = 0
+            if count:
+                self.processed += count
+                continue
+            self._stop.wait(self.poll_interval)
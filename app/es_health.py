@@ -0,0 +1,97 @@
+"""
+Elasticsearch 상태 모니터
+
+백그라운드 스레드가 주기적으로 ping하여 상태를 캐시합니다.
+요청 처리 경로(/health, 검색)는 ES에 직접 묻지 않고 캐시된 상태만 읽으며,
+장애 후 복구되면 on_up 콜백(인덱스 생성, 동기화 워커 시작 등)을 다시 실행해
+검색 기능을 자동으로 재활성화합니다.
+"""
+import os
+import time
+import threading
+from datetime import datetime
+
+ES_HEALTH_INTERVAL = float(os.getenv("ES_HEALTH_INTERVAL", "10"))
+ES_HEALTH_TIMEOUT = float(os.getenv("ES_HEALTH_TIMEOUT", "2"))
+
+
+class ESHealthMonitor:
+    def __init__(self, interval=ES_HEALTH_INTERVAL, timeout=ES_HEALTH_TIMEOUT):
+        self.interval = interval
+        self.timeout = timeout
+        self.on_up = None
+        self.status = "disabled"
+        self.available = False
+        self.last_check = None
+        self.last_ok = None
+        self.latency_ms = None
+        self.consecutive_failures = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, on_up=None):
+        """모니터링 시작 (on_up: ES가 사용 가능해질 때마다 호출, 예외 시 다음 주기에 재시도)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self.on_up = on_up
+        self.status = "starting"
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="es-health-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def check(self):
+        """ping 1회 수행 후 상태 갱신, 사용 가능 여부 반환"""
+        from app.elasticsearch_client import get_es_client
+
+        start = time.perf_counter()
+        try:
+            ok = get_es_client().options(request_timeout=self.timeout, max_retries=0).ping()
+        except Exception:
+            ok = False
+        self.last_check = datetime.now()
+
+        if not ok:
+            self.consecutive_failures += 1
+            if self.available:
+                print("⚠️ Elasticsearch 연결이 끊겨 SQLite 검색으로 전환합니다.")
+            self.available = False
+            self.status = "error"
+            self.latency_ms = None
+            return False
+
+        self.latency_ms = round((time.perf_counter() - start) * 1000, 1)
+        self.last_ok = self.last_check
+        self.consecutive_failures = 0
+        if not self.available:
+            # 처음 연결되었거나 장애에서 복구됨
+            try:
+                if self.on_up:
+                    self.on_up()
+            except Exception as e:
+                print(f"Elasticsearch 초기화 오류 (다음 점검 시 재시도): {e}")
+                self.status = "error"
+                return False
+            print("✅ Elasticsearch 사용 가능")
+        self.available = True
+        self.status = "ok"
+        return True
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.check()
+            self._stop.wait(self.interval)
+
+    def snapshot(self):
+        return {
+            "status": self.status,
+            "last_check": self.last_check.isoformat() if self.last_check else None,
+            "last_ok": self.last_ok.isoformat() if self.last_ok else None,
+            "latency_ms": self.latency_ms,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+es_monitor = ESHealthMonitor()
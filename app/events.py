@@ -0,0 +1,125 @@
+"""
+신규 뉴스/위키 이벤트 프로세스 내 pub/sub
+
+크롤러 등에서 News/Wiki 행이 커밋되면 세션 훅이 이벤트를 발행하고,
+EventBroker가 구독자별 asyncio.Queue로 팬아웃합니다.
+구독자는 DB 연결을 점유하지 않으며, 최근 이벤트는 링 버퍼에 보관되어
+Last-Event-ID로 재접속 시 놓친 이벤트를 다시 받을 수 있습니다.
+"""
+import asyncio
+import threading
+from collections import deque
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import News, Wiki
+
+HISTORY_SIZE = 1000
+QUEUE_SIZE = 256
+
+
+def _news_payload(n):
+    return {
+        "id": n.id, "title": n.title, "source": n.source, "date": n.date,
+        "summary": n.summary, "category": n.category, "url": n.url,
+    }
+
+
+def _wiki_payload(w):
+    return {
+        "id": w.id, "title": w.title, "category": w.category, "tags": w.tags,
+        "preview": w.preview, "preview_medium": w.preview_medium, "type": w.type,
+    }
+
+
+PUBLISHED = {News: ("news", _news_payload), Wiki: ("wiki", _wiki_payload)}
+
+
+class Subscription:
+    def __init__(self, broker):
+        self.broker = broker
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.lagging = False
+
+    async def get(self, timeout):
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class EventBroker:
+    def __init__(self, history_size=HISTORY_SIZE):
+        self._seq = 0
+        self._history = deque(maxlen=history_size)
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._loop = None
+
+    def bind_loop(self, loop):
+        """이벤트를 전달할 이벤트 루프 지정 (서버 시작 시 호출)"""
+        self._loop = loop
+
+    def publish(self, kind, data):
+        """스레드 안전 발행 (크롤러 스레드에서도 호출 가능)"""
+        if self._loop is None:
+            return
+        with self._lock:
+            self._seq += 1
+            evt = {"id": self._seq, "type": kind, "data": data}
+            self._history.append(evt)
+        self._loop.call_soon_threadsafe(self._dispatch, evt)
+
+    def _dispatch(self, evt):
+        for sub in list(self._subscribers):
+            try:
+                sub.queue.put_nowait(evt)
+            except asyncio.QueueFull:
+                # 너무 느린 구독자는 끊고 재접속(Last-Event-ID)으로 따라잡게 함
+                sub.lagging = True
+                self._subscribers.discard(sub)
+
+    def subscribe(self, last_event_id=None):
+        """
+        구독 등록, (구독, 재전송할 이벤트 목록, 재전송 가능 여부) 반환
+        last_event_id가 링 버퍼보다 오래되었으면 재전송 불가(False)
+        """
+        sub = Subscription(self)
+        with self._lock:
+            self._subscribers.add(sub)
+            backlog = []
+            complete = True
+            if last_event_id is not None:
+                backlog = [e for e in self._history if e["id"] > last_event_id]
+                oldest = self._history[0]["id"] if self._history else self._seq + 1
+                # 서버 재시작 등으로 번호가 초기화된 경우도 재전송 불가로 취급
+                complete = oldest - 1 <= last_event_id <= self._seq
+        return sub, backlog, complete
+
+    def unsubscribe(self, sub):
+        self._subscribers.discard(sub)
+
+    def stats(self):
+        return {"subscribers": len(self._subscribers), "last_event_id": self._seq}
+
+
+event_broker = EventBroker()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_new_rows(session, flush_context):
+    pending = session.info.setdefault("pending_events", [])
+    for obj in session.new:
+        spec = PUBLISHED.get(type(obj))
+        if spec:
+            kind, payload = spec
+            pending.append((kind, payload(obj)))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session):
+    for kind, data in session.info.pop("pending_events", []):
+        event_broker.publish(kind, data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    session.info.pop("pending_events", None)
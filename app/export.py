@@ -0,0 +1,70 @@
+"""
+뉴스/위키 NDJSON 스트리밍 내보내기
+
+행을 yield_per 단위로 읽어 한 줄씩 직렬화하므로 테이블 크기와 무관하게
+메모리 사용량이 일정합니다. id 오름차순으로 내보내며, 마지막으로 받은 id를
+after_id로 넘기면 중단된 지점부터 이어받을 수 있습니다.
+"""
+import zlib
+from datetime import datetime, timedelta
+
+from app.models import News, Wiki
+from app.responses import dumps
+
+EXPORT_COLUMNS = {
+    "news": (News, ("id", "title", "source", "date", "summary", "category", "url", "created_at")),
+    "wiki": (Wiki, ("id", "title", "category", "tags", "preview", "content", "type", "created_at")),
+}
+
+FLUSH_BYTES = 64 * 1024
+
+
+def parse_bound(value, upper=False):
+    """'YYYY-MM-DD' 또는 ISO 8601 문자열을 datetime으로 변환 (날짜만 주어진 상한은 해당 일 포함)"""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if upper and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed
+
+
+def iter_export_rows(db, entity, since=None, until=None, category=None, after_id=0, chunk_size=500):
+    """내보낼 행을 dict로 순회 (ORM 객체를 만들지 않고 컬럼만 조회)"""
+    model, names = EXPORT_COLUMNS[entity]
+    query = db.query(*[getattr(model, n) for n in names]).filter(model.id > (after_id or 0))
+    if since:
+        query = query.filter(model.created_at >= parse_bound(since))
+    if until:
+        query = query.filter(model.created_at < parse_bound(until, upper=True))
+    if category:
+        query = query.filter(model.category == category)
+
+    for row in query.order_by(model.id).yield_per(chunk_size):
+        item = dict(zip(names, row))
+        if item.get("created_at") is not None:
+            item["created_at"] = item["created_at"].isoformat()
+        yield item
+
+
+def iter_ndjson(rows):
+    """dict 행을 NDJSON 바이트 청크로 변환 (FLUSH_BYTES 단위로 묶어서 전달)"""
+    buffer = bytearray()
+    for row in rows:
+        buffer += dumps(row)
+        buffer += b"\n"
+        if len(buffer) >= FLUSH_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_gzip(chunks, level=6):
+    """바이트 청크 스트림을 gzip 스트림으로 압축"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,106 @@
+"""
+HTTP 조건부 요청 처리 (ETag / Last-Modified / 304)
+
+라우트마다 의존하는 테이블을 지정해 두면, data_version 값만으로 검증자를 계산합니다.
+클라이언트의 If-None-Match(또는 If-Modified-Since)가 일치하면
+핸들러를 호출하지 않고(DB 조회/직렬화 없이) 304를 바로 반환합니다.
+"""
+import hashlib
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import parse_qsl
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.database import SessionLocal
+from app.data_version import get_versions, request_versions
+
+
+def make_etag(path, params, versions):
+    """경로 + 정렬된 쿼리 파라미터 + 테이블 버전으로 약한 ETag 생성"""
+    raw = path + "?" + "&".join(f"{k}={v}" for k, v in sorted(params)) + "|" + ",".join(
+        f"{name}:{versions[name][0]}" for name in sorted(versions)
+    )
+    return 'W/"' + hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def _last_modified(versions):
+    stamps = [updated_at for _, updated_at in versions.values() if updated_at]
+    if not stamps:
+        return None
+    return int(max(stamps).astimezone().timestamp())
+
+
+def _etag_matches(if_none_match, etag):
+    if if_none_match.strip() == "*":
+        return True
+    # 약한 비교: W/ 접두사는 무시
+    candidates = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+
+class ConditionalGetMiddleware:
+    """
+    routes: {경로: 테이블 튜플 또는 쿼리 파라미터 dict를 받아 테이블 튜플을 반환하는 함수}
+    """
+
+    def __init__(self, app, routes, cache_control="no-cache"):
+        self.app = app
+        self.routes = routes
+        self.cache_control = cache_control
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        spec = self.routes.get(scope["path"])
+        if spec is None:
+            await self.app(scope, receive, send)
+            return
+
+        params = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+        tables = spec(dict(params)) if callable(spec) else spec
+        with SessionLocal() as db:
+            versions = get_versions(db, tables)
+
+        etag = make_etag(scope["path"], params, versions)
+        last_modified = _last_modified(versions)
+        validator_headers = [
+            (b"etag", etag.encode("latin-1")),
+            (b"cache-control", self.cache_control.encode("latin-1")),
+        ]
+        if last_modified is not None:
+            validator_headers.append((b"last-modified", formatdate(last_modified, usegmt=True).encode("latin-1")))
+
+        if self._not_modified(Headers(scope=scope), etag, last_modified):
+            await send({"type": "http.response.start", "status": 304, "headers": validator_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_validators(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                for key, value in validator_headers:
+                    headers[key.decode()] = value.decode("latin-1")
+            await send(message)
+
+        # 같은 요청의 응답 캐시가 버전을 다시 조회하지 않도록 전달
+        token = request_versions.set(versions)
+        try:
+            await self.app(scope, receive, send_with_validators)
+        finally:
+            request_versions.reset(token)
+
+    @staticmethod
+    def _not_modified(headers, etag, last_modified):
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            return _etag_matches(if_none_match, etag)
+
+        if_modified_since = headers.get("if-modified-since")
+        if if_modified_since and last_modified is not None:
+            try:
+                return last_modified <= int(parsedate_to_datetime(if_modified_since).timestamp())
+            except (TypeError, ValueError):
+                return False
+        return False
@@ -0,0 +1,176 @@
+"""
+LLM 응답 캐시
+
+(모델, 프롬프트 템플릿, 템플릿 버전, 입력)의 sha256 해시를 키로 llm_cache 테이블에 응답을 저장합니다.
+같은 제목/본문으로 크롤러, tools/batch_summarize.py, tools/regenerate_wiki.py를 다시 실행해도
+LLM을 다시 호출하지 않습니다.
+
+- 프롬프트를 고치면 ai_summarizer.PROMPT_VERSIONS의 버전을 올림 → 이전 버전 항목은 키가 달라져 사용되지 않고
+  purge_stale()(scripts/llm_cache.py purge-stale)로 삭제
+- LLM_CACHE_TTL_DAYS가 지난 항목은 사용하지 않음
+- 항목 수가 LLM_CACHE_MAX_ENTRIES를 넘으면 마지막 사용 시각이 오래된 순(LRU)으로 삭제
+- 적중률과 절약된 LLM 호출 시간(최초 생성에 걸린 시간의 합)을 집계
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+
+from app.database import SessionLocal
+from app.models import LLMCacheEntry
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_TTL_DAYS = float(os.getenv("LLM_CACHE_TTL_DAYS", "30"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "20000"))
+# 한도 초과 시 한 번에 비울 비율 (매 저장마다 축출 쿼리가 돌지 않도록 여유를 둠)
+EVICT_FRACTION = 0.1
+
+_lock = threading.Lock()
+_counters = {"hits": 0, "misses": 0, "saved_seconds": 0.0, "evicted": 0}
+
+
+def cache_key(template, version, model, inputs):
+    raw = json.dumps([template, version, model, inputs], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _expired(entry, now):
+    return LLM_CACHE_TTL_DAYS > 0 and entry.created_at < now - timedelta(days=LLM_CACHE_TTL_DAYS)
+
+
+def get(key):
+    """캐시된 응답 반환 (없거나 만료되었으면 None)"""
+    db = SessionLocal()
+    try:
+        entry = db.get(LLMCacheEntry, key)
+        now = datetime.now()
+        if entry is None or _expired(entry, now):
+            with _lock:
+                _counters["misses"] += 1
+            return None
+        entry.hits += 1
+        entry.last_used_at = now
+        response, latency = entry.response, entry.latency
+        db.commit()
+        with _lock:
+            _counters["hits"] += 1
+            _counters["saved_seconds"] += latency
+        return response
+    except Exception as e:
+        # 캐시 오류로 LLM 호출 자체가 막히지 않도록 미적중으로 처리
+        db.rollback()
+        print(f"LLM 캐시 조회 오류: {e}")
+        return None
+    finally:
+        db.close()
+
+
+def put(key, template, version, model, response, latency):
+    """응답 저장 (이미 있으면 갱신) 후 필요하면 LRU 축출"""
+    db = SessionLocal()
+    try:
+        now = datetime.now()
+        entry = db.get(LLMCacheEntry, key)
+        if entry is None:
+            entry = LLMCacheEntry(key=key, hits=0)
+            db.add(entry)
+        entry.template = template
+        entry.template_version = version
+        entry.model = model
+        entry.response = response
+        entry.latency = latency
+        entry.created_at = now
+        entry.last_used_at = now
+        db.commit()
+        _evict_if_needed(db)
+    except Exception as e:
+        db.rollback()
+        print(f"LLM 캐시 저장 오류: {e}")
+    finally:
+        db.close()
+
+
+def _evict_if_needed(db):
+    count = db.query(func.count(LLMCacheEntry.key)).scalar()
+    if count <= LLM_CACHE_MAX_ENTRIES:
+        return 0
+    target = int(LLM_CACHE_MAX_ENTRIES * (1 - EVICT_FRACTION))
+    oldest = db.query(LLMCacheEntry.key).order_by(LLMCacheEntry.last_used_at).limit(count - target).subquery()
+    removed = db.query(LLMCacheEntry).filter(LLMCacheEntry.key.in_(oldest.select())).delete(synchronize_session=False)
+    db.commit()
+    with _lock:
+        _counters["evicted"] += removed
+    return removed
+
+
+def cached_completion(template, version, inputs, payload, call):
+    """
+    캐시를 확인한 뒤 없으면 call(payload)로 생성하여 저장
+    빈 응답(생성 실패)은 저장하지 않습니다.
+    """
+    if not LLM_CACHE_ENABLED:
+        return call(payload)
+    model = payload.get("model", "")
+    key = cache_key(template, version, model, inputs)
+    cached = get(key)
+    if cached is not None:
+        return cached
+    start = time.perf_counter()
+    response = call(payload)
+    if response:
+        put(key, template, version, model, response, time.perf_counter() - start)
+    return response
+
+
+def purge_stale(db, current_versions):
+    """현재 템플릿 버전이 아니거나 TTL이 지난 항목 삭제, 삭제 건수 반환"""
+    removed = 0
+    for template, version in current_versions.items():
+        removed += db.query(LLMCacheEntry).filter(
+            LLMCacheEntry.template == template, LLMCacheEntry.template_version != version
+        ).delete(synchronize_session=False)
+    if LLM_CACHE_TTL_DAYS > 0:
+        removed += db.query(LLMCacheEntry).filter(
+            LLMCacheEntry.created_at < datetime.now() - timedelta(days=LLM_CACHE_TTL_DAYS)
+        ).delete(synchronize_session=False)
+    db.commit()
+    return removed
+
+
+def invalidate(db, template=None):
+    """템플릿 하나(또는 전체)의 캐시 삭제"""
+    query = db.query(LLMCacheEntry)
+    if template:
+        query = query.filter(LLMCacheEntry.template == template)
+    removed = query.delete(synchronize_session=False)
+    db.commit()
+    return removed
+
+
+def stats(db=None):
+    """이 프로세스의 적중률/절약 시간과 테이블 현황"""
+    with _lock:
+        result = dict(_counters)
+    lookups = result["hits"] + result["misses"]
+    result["hit_rate"] = round(result["hits"] / lookups, 3) if lookups else None
+    result["saved_seconds"] = round(result["saved_seconds"], 1)
+    if db is not None:
+        rows = db.query(
+            LLMCacheEntry.template, func.count(LLMCacheEntry.key),
+            func.coalesce(func.sum(LLMCacheEntry.hits), 0),
+            func.coalesce(func.sum(LLMCacheEntry.hits * LLMCacheEntry.latency), 0.0)
+        ).group_by(LLMCacheEntry.template).all()
+        result["entries"] = {template: count for template, count, _, _ in rows}
+        # 테이블에 누적된 적중 기록 기준 (프로세스 재시작과 무관)
+        result["total_hits"] = sum(int(hits) for _, _, hits, _ in rows)
+        result["total_saved_seconds"] = round(sum(float(saved) for _, _, _, saved in rows), 1)
+    return result
+
+
+def reset_stats():
+    with _lock:
+        _counters.update({"hits": 0, "misses": 0, "saved_seconds": 0.0, "evicted": 0})
@@ -0,0 +1,130 @@
+"""
+LLM 요청 스케줄러
+
+로컬 모델 하나를 화면 요청(interactive), 크롤링 후 보강(enrichment), 일괄 도구(batch)가 함께 쓰므로
+빈 슬롯이 생기면 항상 우선순위가 높은 등급의 요청부터 보냅니다.
+- 등급별 동시 요청 한도 (LLM_CLASS_LIMITS, 예: "batch=1,enrichment=1")
+  LLM_MAX_IN_FLIGHT=2, batch=1로 두면 일괄 작업 중에도 화면 요청용 슬롯 하나가 항상 비어 있습니다.
+- 같은 등급 안에서는 작업(job) 이름별로 번갈아 보내 한 작업이 슬롯을 독점하지 않게 함
+- 등급별 대기열 길이, 실행 중 요청 수, 대기 시간 백분위 집계
+
+요청의 등급은 llm_priority()로 지정하며, 지정하지 않으면 batch로 처리합니다.
+"""
+import os
+import time
+import threading
+import contextvars
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+PRIORITY_CLASSES = ("interactive", "enrichment", "batch")
+DEFAULT_PRIORITY = ("batch", "default")
+
+_priority = contextvars.ContextVar("llm_priority", default=DEFAULT_PRIORITY)
+
+
+def parse_class_limits(value):
+    """"batch=1,enrichment=2" → {"batch": 1, "enrichment": 2}"""
+    limits = {}
+    for part in (value or "").split(","):
+        name, _, limit = part.partition("=")
+        if name.strip() in PRIORITY_CLASSES and limit.strip().isdigit():
+            limits[name.strip()] = int(limit)
+    return limits
+
+
+LLM_CLASS_LIMITS = parse_class_limits(os.getenv("LLM_CLASS_LIMITS", ""))
+
+
+@contextmanager
+def llm_priority(priority, job=None):
+    """블록 안의 LLM 요청을 priority 등급, job 작업으로 스케줄링"""
+    if priority not in PRIORITY_CLASSES:
+        raise ValueError(f"알 수 없는 LLM 우선순위: {priority}")
+    token = _priority.set((priority, job or priority))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority():
+    return _priority.get()
+
+
+class _Ticket:
+    __slots__ = ("priority", "job", "enqueued")
+
+    def __init__(self, priority, job):
+        self.priority = priority
+        self.job = job
+        self.enqueued = time.monotonic()
+
+
+class LLMScheduler:
+    def __init__(self, capacity, class_limits=None):
+        self.capacity = max(capacity, 1)
+        self.limits = {cls: min((class_limits or {}).get(cls, self.capacity), self.capacity) for cls in PRIORITY_CLASSES}
+        self._cond = threading.Condition()
+        # 등급 → (작업 → 대기 중인 티켓 deque), 작업 순서가 곧 라운드 로빈 순서
+        self._queues = {cls: OrderedDict() for cls in PRIORITY_CLASSES}
+        self._running = {cls: 0 for cls in PRIORITY_CLASSES}
+        self._waits = {cls: deque(maxlen=1000) for cls in PRIORITY_CLASSES}
+        self._granted = {cls: 0 for cls in PRIORITY_CLASSES}
+
+    def _next_ticket(self):
+        """다음에 슬롯을 받을 티켓 (없으면 None)"""
+        if sum(self._running.values()) >= self.capacity:
+            return None
+        for cls in PRIORITY_CLASSES:
+            jobs = self._queues[cls]
+            if jobs and self._running[cls] < self.limits[cls]:
+                return jobs[next(iter(jobs))][0]
+        return None
+
+    @contextmanager
+    def slot(self, priority=None, job=None):
+        """슬롯을 받을 때까지 대기 후 블록 실행 (priority 생략 시 llm_priority로 지정된 등급)"""
+        if priority is None:
+            priority, job = current_priority()
+        ticket = _Ticket(priority, job or priority)
+        with self._cond:
+            self._queues[priority].setdefault(ticket.job, deque()).append(ticket)
+            while self._next_ticket() is not ticket:
+                self._cond.wait()
+            jobs = self._queues[priority]
+            jobs[ticket.job].popleft()
+            if jobs[ticket.job]:
+                jobs.move_to_end(ticket.job)
+            else:
+                del jobs[ticket.job]
+            self._running[priority] += 1
+            self._granted[priority] += 1
+            self._waits[priority].append(time.monotonic() - ticket.enqueued)
+            # 슬롯이 남아 있으면 다음 티켓도 깨움
+            self._cond.notify_all()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._running[priority] -= 1
+                self._cond.notify_all()
+
+    def metrics(self):
+        with self._cond:
+            result = {"capacity": self.capacity, "classes": {}}
+            for cls in PRIORITY_CLASSES:
+                waits = sorted(self._waits[cls])
+
+                def pct(p):
+                    return round(waits[min(len(waits) - 1, int(len(waits) * p))] * 1000, 1) if waits else None
+
+                result["classes"][cls] = {
+                    "limit": self.limits[cls],
+                    "running": self._running[cls],
+                    "queued": sum(len(tickets) for tickets in self._queues[cls].values()),
+                    "jobs": list(self._queues[cls].keys()),
+                    "granted": self._granted[cls],
+                    "wait_ms": {"p50": pct(0.5), "p95": pct(0.95), "max": pct(1.0)},
+                }
+        return result
@@ -1,22 +1,39 @@
 import bleach
-from fastapi import FastAPI, Depends, Request, BackgroundTasks, HTTPException
+from fastapi import FastAPI, Depends, Request, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse, Response
 from sqlalchemy.orm import Session
-from app.database import engine, get_db, Base
+from app.database import get_db, ensure_schema, SessionLocal
 from app.models import News, Wiki, CrawlSource
+from app import stats as stat_store
+from app.cache import response_cache
+from app.http_cache import ConditionalGetMiddleware
+from app.responses import default_response_class, add_compression
+from app.export import iter_export_rows, iter_ndjson, iter_gzip, parse_bound
+from app.events import event_broker
+from app.search_sync import OutboxWorker, pending_count
+from app.es_health import es_monitor
+from app.suggest import prefix_index
+from app.summary_stream import summary_streams
+from app.enrichment import EnrichmentWorkerPool, queue_stats as enrichment_stats
+from app import llm_cache
+from app.ai_summarizer import llm_breaker, llm_client
+from app.responses import dumps as json_dumps
 from crawler.crawler import crawl_all
 import time # Add this import
 from data_utils import get_wiki_preview, get_wiki_highlights, clean_news_summary
 from datetime import datetime
+from typing import Optional
 import os
 import math
+import asyncio
 
 
 # Elasticsearch와 AI 요약 임포트 (선택적)
 try:
-    from app.elasticsearch_client import create_indices, index_news, index_wiki, search_all, get_es_client, search_news, search_wiki
+    from app.elasticsearch_client import create_indices, search_all, close_es_client, close_async_es_client, search_news, search_wiki, InvalidCursor, suggest_titles
     from app.ai_summarizer import summarize_news
     # 기본적으로 켜져 있으나 USE_ELASTICSEARCH=false 설정 시 비활성화
     ES_ENABLED = os.getenv("USE_ELASTICSEARCH", "true").lower() == "true"
@@ -25,10 +42,12 @@ except Exception as e:
         print(f"[WARNING] Elasticsearch/AI components load failed: {e}")
     ES_ENABLED = False
 
-# DB 테이블 생성
-Base.metadata.create_all(bind=engine)
+# DB 테이블 생성 (누락 컬럼 보정 포함)
+ensure_schema()
+with SessionLocal() as _db:
+    stat_store.ensure_stats(_db)
 
-app = FastAPI(title="보안 뉴스 플랫폼")
+app = FastAPI(title="보안 뉴스 플랫폼", default_response_class=default_response_class())
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -45,53 +64,108 @@ static_path = os.path.join(BASE_DIR, "static")
 if os.path.exists(static_path):
     app.mount("/static", StaticFiles(directory=static_path), name="static")
 
+def _search_cache_tags(params):
+    """검색 대상 인덱스에 따라 의존 테이블 결정"""
+    index = params.get("index", "all")
+    if index == "news":
+        return ("news",)
+    if index == "wiki":
+        return ("wiki",)
+    return ("news", "wiki")
+
+def _daily_stats_tags(params):
+    return (params.get("entity", "news"),)
+
+# 조건부 GET(ETag/Last-Modified/304) 대상 라우트와 의존 테이블
+VALIDATED_ROUTES = {
+    "/": ("news", "wiki"),
+    "/api/news": ("news",),
+    "/api/wiki": ("wiki",),
+    "/api/search": _search_cache_tags,
+    "/api/stats/sources": ("news",),
+    "/api/stats/categories": ("news",),
+    "/api/stats/daily": _daily_stats_tags,
+}
+app.add_middleware(ConditionalGetMiddleware, routes=VALIDATED_ROUTES)
+
+# 응답 압축 (최소 크기 이상 응답만, 조건부 GET 바깥쪽에서 동작, SSE 스트림 제외)
+add_compression(app, exclude_paths=("/api/stream",))
+
+# ES 증분 동기화 워커 (ES 사용 가능할 때만 처리, 동기화된 테이블의 캐시 무효화)
+outbox_worker = OutboxWorker(
+    on_synced=lambda entities: response_cache.invalidate(*entities),
+    ready=lambda: es_monitor.available
+)
+
+# LLM 보강(AI 요약/위키 본문) 워커 (크롤링과 분리, 반영된 테이블의 캐시 무효화)
+enrichment_pool = EnrichmentWorkerPool(on_done=lambda tables: response_cache.invalidate(*tables))
+
+def es_active():
+    """설정상 켜져 있고 상태 모니터가 마지막 점검에서 응답을 확인한 경우"""
+    return ES_ENABLED and es_monitor.available
+
+def _on_es_up():
+    """ES 최초 연결 및 장애 복구 시 실행"""
+    create_indices()
+    outbox_worker.start()
+    # ES 장애 동안 SQLite 결과로 캐시된 검색 응답 폐기
+    response_cache.invalidate("news", "wiki")
+
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 Elasticsearch 인덱스 생성 (비동기 수행)"""
+    # 신규 뉴스/위키 이벤트를 SSE 구독자에게 전달할 루프 지정
+    event_broker.bind_loop(asyncio.get_running_loop())
+
+    if enrichment_pool.workers > 0:
+        enrichment_pool.start()
+
     if ES_ENABLED:
-        import threading
-        def init_es():
-            global ES_ENABLED # Declare intent to modify the global variable
-            try:
-                # Give Elasticsearch a moment to fully start up
-                time.sleep(10) # Add a delay to allow ES to become fully ready
-                create_indices()
-                print("✅ Elasticsearch 인덱스 준비 완료")
-            except Exception as e:
-                print(f"ℹ️ Elasticsearch가 실행 중이지 않아 검색 엔진 기능이 비활성화되었습니다. (SQLite는 정상 작동함)")
-                ES_ENABLED = False # Explicitly disable ES if initialization fails
-        
-        # 메인 루프를 방해하지 않도록 별도 스레드에서 실행
-        threading.Thread(target=init_es, daemon=True).start()
+        # 상태 모니터가 별도 스레드에서 연결을 확인하고, 연결되면 인덱스 생성 및 동기화 워커 시작
+        # (ES가 늦게 뜨거나 중간에 재시작되어도 자동으로 검색 기능 복구)
+        es_monitor.start(on_up=_on_es_up)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    enrichment_pool.stop()
+    if ES_ENABLED:
+        es_monitor.stop()
+        outbox_worker.stop()
+        close_es_client()
+        await close_async_es_client()
 
 @app.get("/", response_class=HTMLResponse)
+@response_cache.cached("home", tags=("news", "wiki"))
 async def home(
     request: Request, 
     db: Session = Depends(get_db),
     page: int = 1,
-    limit: int = 20
+    limit: int = 20,
+    wiki_limit: int = 12
 ):
     """메인 페이지"""
     news_query = db.query(News).order_by(News.created_at.desc())
     
-    total_news = news_query.count()
+    total_news = stat_store.get_total(db, "news")
     total_pages = math.ceil(total_news / limit) if total_news > 0 else 1
     
     offset = (page - 1) * limit
     news_list = news_query.offset(offset).limit(limit).all()
     
-    wiki_list = db.query(Wiki).order_by(Wiki.created_at.desc()).all()
+    # 위키는 첫 페이지만 렌더링하고 나머지는 /api/wiki로 지연 로드
+    wiki_list = db.query(Wiki).order_by(Wiki.created_at.desc()).limit(wiki_limit).all()
     
     stats = {
         "news_count": total_news,
-        "wiki_count": db.query(Wiki).count(),
-        "es_enabled": ES_ENABLED
+        "wiki_count": stat_store.get_total(db, "wiki"),
+        "es_enabled": es_active()
     }
     
     return templates.TemplateResponse("index.html", {
         "request": request,
         "news_list": news_list,
         "wiki_list": wiki_list,
+        "wiki_limit": wiki_limit,
         "stats": stats,
         "pagination": {
             "page": page,
@@ -102,6 +176,7 @@ async def home(
     })
 
 @app.get("/api/news")
+@response_cache.cached("api_news", tags=("news",))
 async def get_news(
     db: Session = Depends(get_db),
     page: int = 1,
@@ -110,7 +185,7 @@ async def get_news(
     """뉴스 API"""
     news_query = db.query(News).order_by(News.created_at.desc())
     
-    total_news = news_query.count()
+    total_news = stat_store.get_total(db, "news")
     total_pages = math.ceil(total_news / limit) if total_news > 0 else 1
     
     offset = (page - 1) * limit
@@ -148,44 +223,51 @@ async def delete_news_item(news_id: int, db: Session = Depends(get_db)):
     
     db.delete(news_item)
     db.commit()
-    
-    # ES에서도 삭제 (필요 시)
-    if ES_ENABLED:
-        try:
-            get_es_client().delete(index="news", id=news_id, ignore=[404])
-        except Exception as e:
-            print(f"ES 뉴스 삭제 오류: {e}")
+    response_cache.invalidate("news")
+    # ES 삭제는 같은 트랜잭션에 기록된 outbox를 통해 동기화 워커가 처리
 
     return {"message": "뉴스가 성공적으로 삭제되었습니다."}
 
 @app.get("/api/wiki")
-async def get_wiki(db: Session = Depends(get_db)):
-    """위키 API"""
-    wikis = db.query(Wiki).order_by(Wiki.created_at.desc()).all()
+@response_cache.cached("api_wiki", tags=("wiki",))
+async def get_wiki(
+    db: Session = Depends(get_db),
+    offset: int = 0,
+    limit: Optional[int] = None
+):
+    """위키 API (offset/limit 지정 시 해당 구간만 반환)"""
+    wiki_query = db.query(Wiki).order_by(Wiki.created_at.desc())
+    if offset:
+        wiki_query = wiki_query.offset(offset)
+    if limit:
+        wiki_query = wiki_query.limit(limit)
+    wikis = wiki_query.all()
     return [
         {
             "id": w.id,
             "title": w.title,
             "category": w.category,
             "preview": w.preview,
+            "preview_medium": w.preview_medium,
+            "tags": w.tags,
             "type": w.type
         }
         for w in wikis
     ]
 
 @app.post("/api/crawl")
-async def run_crawler(background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
-    """크롤링 실행"""
+async def run_crawler(db: Session = Depends(get_db)):
+    """크롤링 실행 (AI 요약/위키 본문은 보강 워커, ES 색인은 outbox 동기화 워커가 처리)"""
     try:
-        count = crawl_all(db)
-        
-        # Elasticsearch에 인덱싱
-        if ES_ENABLED:
-            background_tasks.add_task(reindex_all_news)
+        # 크롤링 중에도 이벤트 루프(SSE 전달 등)가 멈추지 않도록 스레드풀에서 실행
+        count = await run_in_threadpool(crawl_all, db)
         
         return {"success": True, "count": count}
     except Exception as e:
         return {"success": False, "error": "str(e)"}
+    finally:
+        # 크롤링 도중 실패해도 이미 커밋된 항목이 있으므로 항상 무효화
+        response_cache.invalidate("news", "wiki")
 
 @app.post("/api/news/{news_id}/summarize")
 async def summarize_news_endpoint(news_id: int, db: Session = Depends(get_db)):
@@ -200,78 +282,137 @@ async def summarize_news_endpoint(news_id: int, db: Session = Depends(get_db)):
     if news.summary:
         return {"success": True, "summary": news.summary}
     
-    # AI 요약 생성
-    summary = summarize_news(news.title, news.url)
+    # AI 요약 생성 (같은 뉴스의 스트리밍 요청과 LLM 생성을 공유, 저장까지 완료된 후 응답)
+    summary, error = await summary_streams.result(summary_streams.join(news.id, news.title, news.url))
     if summary:
-        news.summary = summary
-        db.commit()
-        
-        # ES 업데이트
-        if ES_ENABLED:
-            index_news(news)
-        
         return {"success": True, "summary": summary}
     else:
         return {"success": False, "error": "요약 생성 실패"}
 
+@app.get("/api/stream/summary/{news_id}")
+async def summarize_news_stream(news_id: int, db: Session = Depends(get_db)):
+    """
+    뉴스 AI 요약 SSE 스트림
+    token 이벤트로 생성 중인 텍스트 조각을, done 이벤트로 저장된 최종 요약을 보냅니다. (실패 시 error)
+    """
+    if not ES_ENABLED:
+        return {"success": False, "error": "AI 기능이 비활성화되어 있습니다"}
+
+    news = db.query(News).filter(News.id == news_id).first()
+    if not news:
+        return {"success": False, "error": "뉴스를 찾을 수 없습니다"}
+
+    def format_event(kind, data):
+        return f"event: {kind}\ndata: {json_dumps(data).decode('utf-8')}\n\n"
+
+    existing = news.summary
+    flight = None if existing else summary_streams.join(news.id, news.title, news.url)
+
+    async def generate():
+        # 헤더와 함께 바로 첫 바이트를 보내 생성 대기 중임을 알림
+        yield ": generating\n\n"
+        if flight is None:
+            yield format_event("done", {"summary": existing})
+            return
+        async for kind, value in summary_streams.follow(flight):
+            if kind == "token":
+                yield format_event("token", {"text": value})
+            elif kind == "done":
+                yield format_event("done", {"summary": value})
+            else:
+                yield format_event("error", {"error": value})
+
+    return StreamingResponse(generate(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
+class ClientDisconnected(Exception):
+    pass
+
+async def _unless_disconnected(request: Request, coro):
+    """ES 검색을 기다리는 동안 클라이언트 연결이 끊기면 요청을 취소"""
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=0.1)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                raise ClientDisconnected()
+    finally:
+        if not task.done():
+            task.cancel()
+
 @app.get("/api/search")
+@response_cache.cached("api_search", tags=_search_cache_tags)
 async def search(
+    request: Request,
     q: str = "",
     db: Session = Depends(get_db),
     page: int = 1,
     limit: int = 20,
     category: str = "",
-    index: str = "all"  # 'news', 'wiki', or 'all'
+    index: str = "all",  # 'news', 'wiki', or 'all'
+    cursor: str = "",  # 이전 응답의 pagination.next_cursor (index=news/wiki 깊은 페이지용)
+    exact_total: bool = False  # 전체 건수를 정확히 셀지 여부 (기본은 근사치)
 ):
     """통합 검색 (Elasticsearch 사용)"""
-    if not ES_ENABLED:
+    if cursor and index not in ('news', 'wiki'):
+        raise HTTPException(status_code=400, detail="cursor는 index=news 또는 index=wiki와 함께 사용해야 합니다")
+
+    if not es_active():
         # Fallback to SQLite if ES is disabled
         pass  # The original SQLite fallback logic will be executed at the end
 
     else:
         try:
-            # 뉴스만 검색
-            if index == 'news':
-                es_results = search_news(q, page=page, limit=limit, category=category)
+            # 뉴스 또는 위키만 검색 (커서 페이지네이션 지원)
+            if index in ('news', 'wiki'):
+                search_fn = search_news if index == 'news' else search_wiki
+                es_results = await _unless_disconnected(request, search_fn(
+                    q, page=page, limit=limit, category=category, cursor=cursor or None, exact_total=exact_total
+                ))
                 total_pages = math.ceil(es_results["total"] / limit) if es_results["total"] > 0 else 1
                 return {
-                    "news": es_results["results"],
-                    "wiki": [],
+                    "news": es_results["results"] if index == 'news' else [],
+                    "wiki": es_results["results"] if index == 'wiki' else [],
+                    "facets": {index: es_results["facets"]},
                     "pagination": {
-                        "page": page, "limit": limit, "total_pages": total_pages, "total_items": es_results["total"]
-                    }
-                }
-
-            # 위키만 검색
-            elif index == 'wiki':
-                es_results = search_wiki(q, page=page, limit=limit, category=category)
-                total_pages = math.ceil(es_results["total"] / limit) if es_results["total"] > 0 else 1
-                return {
-                    "news": [],
-                    "wiki": es_results["results"],
-                    "pagination": {
-                        "page": page, "limit": limit, "total_pages": total_pages, "total_items": es_results["total"]
+                        "page": es_results["page"], "limit": limit, "total_pages": total_pages,
+                        "total_items": es_results["total"], "total_relation": es_results["total_relation"],
+                        "next_cursor": es_results["next_cursor"]
                     }
                 }
 
             # 기본: 전체 검색
             else: # index == 'all'
-                es_results = search_all(q, page=page, limit=limit, category=category)
+                es_results = await _unless_disconnected(request, search_all(
+                    q, page=page, limit=limit, category=category, exact_total=exact_total
+                ))
                 total_news = es_results["news_total"]
                 total_pages = math.ceil(total_news / limit) if total_news > 0 else 1
                 
                 return {
                     "news": es_results["news"],
                     "wiki": es_results["wiki"],
+                    "facets": es_results["facets"],
                     "pagination": {
                         "page": page,
                         "limit": limit,
                         "total_pages": total_pages,
-                        "total_items": total_news
+                        "total_items": total_news,
+                        "total_relation": es_results["news_total_relation"]
                     }
                 }
+        except InvalidCursor as e:
+            # 잘못되었거나 다른 인덱스의 커서
+            raise HTTPException(status_code=400, detail=str(e))
+        except ClientDisconnected:
+            # 클라이언트가 떠났으므로 응답할 필요 없음 (캐시에도 저장되지 않음)
+            return Response(status_code=499)
         except Exception:
-            pass  # Fallback to SQLite
+            pass  # Fallback to SQLite (타임아웃 포함)
 
     # Fallback: SQLite 검색
     if index == 'news' or index == 'all':
@@ -309,14 +450,35 @@ async def search(
     return {
         "news": news_data,
         "wiki": wiki_data,
+        "facets": {},
         "pagination": {
             "page": page,
             "limit": limit,
             "total_pages": total_pages,
-            "total_items": total_news
+            "total_items": total_news,
+            "total_relation": "eq"
         }
     }
 
+@app.get("/api/suggest")
+@response_cache.cached("suggest", tags=("news", "wiki"), ttl=int(os.getenv("SUGGEST_CACHE_TTL", "60")))
+async def suggest(q: str = "", limit: int = 8, db: Session = Depends(get_db)):
+    """검색어 자동완성 (입력 중 키 입력마다 호출되는 가벼운 경로, 자주 쓰는 접두어는 캐시)"""
+    q = q.strip()
+    limit = max(1, min(limit, 20))
+    if not q:
+        return {"query": q, "suggestions": []}
+
+    if es_active():
+        try:
+            return {"query": q, "suggestions": await suggest_titles(q, limit)}
+        except Exception:
+            pass  # completion 필드가 없는 예전 인덱스 등 → 로컬 접두어 인덱스
+
+    # 데이터가 바뀐 직후에만 재빌드가 일어나므로 스레드풀에서 수행해 이벤트 루프를 막지 않음
+    await run_in_threadpool(prefix_index.ensure_fresh, db)
+    return {"query": q, "suggestions": prefix_index.lookup(q, limit)}
+
 @app.post("/api/wiki/add")
 async def add_wiki(request: Request, db: Session = Depends(get_db)):
     """위키 추가"""
@@ -331,13 +493,7 @@ async def add_wiki(request: Request, db: Session = Depends(get_db)):
     )
     db.add(wiki)
     db.commit()
-    
-    # ES 인덱싱
-    if ES_ENABLED:
-        try:
-            index_wiki(wiki)
-        except Exception as e:
-            pass  # ES 비활성화 시 조용히 무시
+    response_cache.invalidate("wiki")
     
     return JSONResponse({
         "success": True, 
@@ -372,30 +528,16 @@ async def wiki_edit(wiki_id: int, request: Request, db: Session = Depends(get_db
     wiki.type = "manual" # 수동 수정됨
     
     db.commit()
-    
-    if ES_ENABLED:
-        try:
-            index_wiki(wiki)
-        except Exception as e:
-            pass  # ES 비활성화 시 조용히 무시
+    response_cache.invalidate("wiki")
             
     return JSONResponse({"success": True, "message": "수정되었습니다."})
 
-def delete_es_wiki_background(wiki_id: int):
-    """백그라운드에서 Elasticsearch의 위키 문서를 삭제합니다."""
-    try:
-        get_es_client().delete(index="wiki", id=wiki_id, ignore=[404])
-        print(f"✅ ES에서 위키 ID {wiki_id}가 삭제되었습니다.")
-    except Exception as e:
-        print(f"❌ ES 위키 삭제 오류 (ID: {wiki_id}): {e}")
-
 @app.post("/api/wiki/{wiki_id}/delete")
 async def wiki_delete(
     wiki_id: int, 
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
-    """위키 삭제 처리 (ES 삭제는 백그라운드 수행)"""
+    """위키 삭제 처리 (ES 삭제는 outbox 동기화 워커가 수행)"""
     wiki = db.query(Wiki).filter(Wiki.id == wiki_id).first()
     if not wiki:
         return JSONResponse({"success": False, "error": "위키를 찾을 수 없습니다"})
@@ -403,10 +545,7 @@ async def wiki_delete(
     # DB에서 즉시 삭제
     db.delete(wiki)
     db.commit()
-    
-    # ES 삭제는 백그라운드 작업으로 위임하여 응답 속도 개선
-    if ES_ENABLED:
-        background_tasks.add_task(delete_es_wiki_background, wiki_id)
+    response_cache.invalidate("wiki")
     
     return JSONResponse({"success": True, "message": "삭제되었습니다."})
 
@@ -449,61 +588,44 @@ async def wiki_detail(wiki_id: int, request: Request, db: Session = Depends(get_
         "wiki": wiki
     })
 
-def reindex_all_news():
-    """모든 뉴스를 Elasticsearch에 재인덱싱"""
-    if not ES_ENABLED:
-        return
-    
-    db = next(get_db())
-    try:
-        news_list = db.query(News).all()
-        for news in news_list:
-            index_news(news)
-        print(f"✅ {len(news_list)}개 뉴스 인덱싱 완료")
-    except Exception as e:
-        print(f"인덱싱 오류: {e}")
-    finally:
-        db.close()
-
 @app.get("/health")
 async def health_check():
-    """헬스 체크"""
-    es_status = "disabled"
-    if ES_ENABLED:
-        try:
-            es = get_es_client()
-            if es.ping():
-                es_status = "ok"
-            else:
-                es_status = "error"
-        except:
-            es_status = "error"
-    
+    """헬스 체크 (모니터/차단기/스케줄러가 메모리에 들고 있는 상태만 반환, DB나 ES에 묻지 않음)"""
     return {
         "status": "ok",
-        "elasticsearch": es_status
+        "elasticsearch": es_monitor.status,
+        "elasticsearch_detail": es_monitor.snapshot(),
+        "llm": llm_breaker.snapshot(),
+        "llm_scheduler": llm_client.scheduler.metrics(),
+        "llm_cache": llm_cache.stats()
     }
+
+@app.get("/api/metrics")
+async def get_metrics(db: Session = Depends(get_db)):
+    """대기열/캐시 테이블 집계 (테이블 크기에 비례하는 조회이므로 헬스 체크와 분리)"""
+    return {
+        "search_outbox_pending": pending_count(db),
+        "enrichment_queue": enrichment_stats(db),
+        "llm_cache": llm_cache.stats(db)
+    }
+
+@app.get("/api/cache/stats")
+async def cache_stats():
+    """응답 캐시 적중/미스 통계"""
+    return response_cache.metrics()
+
 @app.get("/api/stats/sources")
+@response_cache.cached("stats_sources", tags=("news",))
 async def get_source_stats(db: Session = Depends(get_db)):
     """소스별 뉴스 통계"""
-    from sqlalchemy import func
-    
-    stats = db.query(
-        News.source,
-        func.count(News.id).label('count')
-    ).group_by(News.source).order_by(func.count(News.id).desc()).all()
-    
-    return [{"source": s.source, "count": s.count} for s in stats]
+    stats = stat_store.get_breakdown(db, "news", "source")
+    return [{"source": source, "count": count} for source, count in stats]
 
 @app.get("/api/stats/categories")
+@response_cache.cached("stats_categories", tags=("news",))
 async def get_category_stats(db: Session = Depends(get_db)):
     """카테고리별 뉴스 통계"""
-    from sqlalchemy import func
-    
-    stats = db.query(
-        News.category,
-        func.count(News.id).label('count')
-    ).group_by(News.category).order_by(func.count(News.id).desc()).all()
+    stats = stat_store.get_breakdown(db, "news", "category")
     
     category_labels = {
         'malware': '악성코드',
@@ -516,14 +638,125 @@ async def get_category_stats(db: Session = Depends(get_db)):
     
     return [
         {
-            "category": s.category,
-            "label": category_labels.get(s.category, s.category),
-            "count": s.count
+            "category": category,
+            "label": category_labels.get(category, category),
+            "count": count
         } 
-        for s in stats
+        for category, count in stats
+    ]
+
+@app.get("/api/stats/daily")
+@response_cache.cached("stats_daily", tags=_daily_stats_tags)
+async def get_daily_stats(
+    db: Session = Depends(get_db),
+    entity: str = "news",
+    dimension: str = "total",
+    days: int = 30
+):
+    """일별 추이 통계 (dimension: total, source, category)"""
+    if entity not in ("news", "wiki") or dimension not in ("total", "source", "category"):
+        raise HTTPException(status_code=400, detail="지원하지 않는 통계 유형입니다.")
+    
+    daily = stat_store.get_daily(db, entity, days=min(max(days, 1), 365), dimension=dimension)
+    return [
+        {
+            "day": day,
+            "counts": [{"key": key, "count": count} for key, count in buckets.items()]
+        }
+        for day, buckets in daily.items()
     ]
 
 
+@app.get("/api/export/{entity}.ndjson")
+async def export_ndjson(
+    entity: str,
+    since: str = "",
+    until: str = "",
+    category: str = "",
+    after_id: int = 0,
+    gzip: bool = False
+):
+    """뉴스/위키 NDJSON 스트리밍 내보내기 (after_id로 이어받기 가능)"""
+    if entity not in ("news", "wiki"):
+        raise HTTPException(status_code=404, detail="지원하지 않는 내보내기 대상입니다.")
+    try:
+        parse_bound(since)
+        parse_bound(until)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="since/until은 YYYY-MM-DD 또는 ISO 8601 형식이어야 합니다.")
+
+    def generate():
+        # 스트리밍 도중 요청 스코프 세션이 닫히지 않도록 전용 세션 사용
+        db = SessionLocal()
+        try:
+            rows = iter_export_rows(db, entity, since=since, until=until, category=category, after_id=after_id)
+            yield from iter_ndjson(rows)
+        finally:
+            db.close()
+
+    body = iter_gzip(generate()) if gzip else generate()
+    headers = {"Content-Disposition": f'attachment; filename="{entity}.ndjson"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
+
+
+@app.get("/api/stream")
+async def stream_events(
+    request: Request,
+    types: str = "news,wiki",
+    category: str = "",
+    source: str = "",
+    last_event_id: Optional[int] = None
+):
+    """신규 뉴스/위키 SSE 스트림 (Last-Event-ID 헤더 또는 last_event_id로 재개)"""
+    wanted = {t.strip() for t in types.split(",") if t.strip()}
+    header_id = request.headers.get("last-event-id")
+    if header_id and header_id.isdigit():
+        last_event_id = int(header_id)
+
+    def matches(evt):
+        data = evt["data"]
+        if evt["type"] not in wanted:
+            return False
+        if category and data.get("category") != category:
+            return False
+        if source and evt["type"] == "news" and data.get("source") != source:
+            return False
+        return True
+
+    def format_event(evt):
+        return f"id: {evt['id']}\nevent: {evt['type']}\ndata: {json_dumps(evt['data']).decode('utf-8')}\n\n"
+
+    async def generate():
+        sub, backlog, complete = event_broker.subscribe(last_event_id)
+        try:
+            yield "retry: 3000\n\n"
+            if not complete:
+                # 놓친 이벤트를 재전송할 수 없으면 클라이언트가 목록을 새로 불러오도록 알림
+                yield f"event: reset\ndata: {{}}\n\n"
+            for evt in backlog:
+                if matches(evt):
+                    yield format_event(evt)
+            while True:
+                try:
+                    evt = await sub.get(timeout=15)
+                except asyncio.TimeoutError:
+                    if sub.lagging or await request.is_disconnected():
+                        break
+                    yield ": ping\n\n"
+                    continue
+                if matches(evt):
+                    yield format_event(evt)
+        finally:
+            event_broker.unsubscribe(sub)
+
+    return StreamingResponse(generate(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
+
 # 크롤링 소스 관리 API
 @app.get("/sources/manage", response_class=HTMLResponse)
 async def sources_manage(request: Request, db: Session = Depends(get_db)):
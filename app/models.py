@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, Float, String, Text, DateTime, Boolean, UniqueConstraint, event, inspect
 from datetime import datetime
 from app.database import Base
+from data_utils import build_wiki_derived_fields
 
 class News(Base):
     __tablename__ = "news"
@@ -13,6 +14,15 @@ class News(Base):
     category = Column(String)
     url = Column(String)
     created_at = Column(DateTime, default=datetime.now)
+    rules_version = Column(String)  # 카테고리를 계산한 분류 규칙 버전 (None이면 재분류 대상)
+
+@event.listens_for(News, "before_update")
+def _news_before_update(mapper, connection, target):
+    # 분류 입력(제목/요약)이 바뀌면 다음 재분류 때 다시 계산
+    attrs = inspect(target).attrs
+    if ((attrs.title.history.has_changes() or attrs.summary.history.has_changes())
+            and not attrs.rules_version.history.has_changes()):
+        target.rules_version = None
 
 class Wiki(Base):
     __tablename__ = "wiki"
@@ -25,6 +35,34 @@ class Wiki(Base):
     content = Column(Text)
     type = Column(String)
     created_at = Column(DateTime, default=datetime.now)
+    # 쓰기 시점에 미리 계산해 두는 표시용 파생 필드
+    preview_short = Column(Text)
+    preview_medium = Column(Text)
+    preview_long = Column(Text)
+    concept = Column(Text)
+    highlights = Column(Text)  # JSON 형태의 get_wiki_highlights 결과
+    rules_version = Column(String)  # 카테고리/태그를 계산한 분류 규칙 버전 (None이면 재분류 대상)
+
+def apply_wiki_derived_fields(wiki):
+    """위키 본문으로부터 미리보기/하이라이트 파생 필드를 계산해 채움"""
+    for key, value in build_wiki_derived_fields(wiki).items():
+        setattr(wiki, key, value)
+
+@event.listens_for(Wiki, "before_insert")
+def _wiki_before_insert(mapper, connection, target):
+    apply_wiki_derived_fields(target)
+
+@event.listens_for(Wiki, "before_update")
+def _wiki_before_update(mapper, connection, target):
+    # 본문/미리보기가 바뀌었거나 아직 계산되지 않은 경우에만 다시 계산
+    attrs = inspect(target).attrs
+    if (attrs.content.history.has_changes() or attrs.preview.history.has_changes()
+            or target.preview_medium is None):
+        apply_wiki_derived_fields(target)
+    # 분류 입력(제목/미리보기/본문)이 바뀌면 다음 재분류 때 다시 계산
+    if ((attrs.title.history.has_changes() or attrs.content.history.has_changes()
+            or attrs.preview.history.has_changes()) and not attrs.rules_version.history.has_changes()):
+        target.rules_version = None
 
 class CrawlLog(Base):
     __tablename__ = "crawl_log"
@@ -48,3 +86,72 @@ class CrawlSource(Base):
     is_active = Column(Boolean, default=True)  # 활성화 여부
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+class StatBucket(Base):
+    """뉴스/위키 건수 집계 테이블 (쓰기 시점에 증분 갱신)"""
+    __tablename__ = "stat_bucket"
+    __table_args__ = (UniqueConstraint("entity", "dimension", "key", "day", name="uq_stat_bucket"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity = Column(String, nullable=False)  # 'news' 또는 'wiki'
+    dimension = Column(String, nullable=False)  # 'total', 'source', 'category'
+    key = Column(String, nullable=False, default="")  # 소스명/카테고리 ('total'이면 '')
+    day = Column(String, nullable=False, default="")  # 'YYYY-MM-DD' ('' = 전체 기간)
+    count = Column(Integer, nullable=False, default=0)
+
+class DataVersion(Base):
+    """테이블별 데이터 버전 (쓰기마다 증가, HTTP 검증자 계산에 사용)"""
+    __tablename__ = "data_version"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.now)
+
+class SearchOutbox(Base):
+    """Elasticsearch 동기화 대기열 (News/Wiki 변경과 같은 트랜잭션에서 기록)"""
+    __tablename__ = "search_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity = Column(String, nullable=False)  # 'news' 또는 'wiki'
+    entity_id = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)  # 'upsert' 또는 'delete'
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+    available_at = Column(DateTime, default=datetime.now, index=True)  # 재시도 대기 시각
+    created_at = Column(DateTime, default=datetime.now)
+
+class EnrichmentJob(Base):
+    """LLM 보강 작업 대기열 (크롤링과 분리된 요약/위키 본문 생성)"""
+    __tablename__ = "enrichment_jobs"
+    __table_args__ = (UniqueConstraint("kind", "entity_id", name="uq_enrichment_job"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False)  # 'news_summary' 또는 'wiki_content'
+    entity_id = Column(Integer, nullable=False)
+    payload = Column(Text)  # JSON 형태의 LLM 입력 (원문 요약, 카테고리 등)
+    status = Column(String, nullable=False, default="pending", index=True)  # pending/running/done/failed
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text)
+    available_at = Column(DateTime, default=datetime.now, index=True)  # 재시도 대기 또는 처리 임대 만료 시각
+    created_at = Column(DateTime, default=datetime.now)
+    finished_at = Column(DateTime)
+
+class LLMCacheEntry(Base):
+    """LLM 응답 캐시 (모델 + 프롬프트 템플릿 버전 + 입력의 해시를 키로 사용)"""
+    __tablename__ = "llm_cache"
+
+    key = Column(String, primary_key=True)  # sha256 hex
+    template = Column(String, nullable=False, index=True)  # 'news_summary', 'wiki_content'
+    template_version = Column(Integer, nullable=False)
+    model = Column(String, nullable=False)
+    response = Column(Text, nullable=False)
+    latency = Column(Float, nullable=False, default=0.0)  # 최초 생성에 걸린 시간(초), 적중 시 절약 시간
+    hits = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.now)
+    last_used_at = Column(DateTime, default=datetime.now, index=True)  # LRU 축출 기준
+
+# 쓰기 훅 등록 (모든 모델 정의 이후에 임포트)
+import app.stats  # noqa: E402,F401
+import app.data_version  # noqa: E402,F401
+import app.events  # noqa: E402,F401
+import app.search_sync  # noqa: E402,F401
@@ -0,0 +1,135 @@
+"""
+분류 규칙 버전 기반 증분 재분류
+
+뉴스/위키 행마다 카테고리(위키는 태그도)를 계산할 때 쓴 규칙 버전(rules_version)을 저장해 두고,
+저장된 버전이 현재 규칙 버전(crawler.crawler.NEWS_RULES_VERSION / WIKI_RULES_VERSION)과 다른 행만
+다시 분류합니다. 키워드 하나를 고쳐도 전체를 ORM으로 읽어 한 번에 커밋하지 않습니다.
+- 대상 행의 필요한 컬럼만 id 순으로 yield_per 청크 단위 스트리밍
+- 청크별 키워드 매칭은 프로세스 풀에서 병렬 실행 (진행 중인 청크 수를 제한해 메모리 일정)
+- 결과가 바뀐 행은 값과 버전을, 그대로인 행은 버전만 executemany UPDATE로 기록
+- 청크마다 커밋하므로 중단해도 다음 실행은 남은 행부터 이어감
+
+ORM을 거치지 않는 UPDATE이므로 통계 버킷, 데이터 버전(ETag), ES 동기화 대기열은 직접 반영합니다.
+제목/요약/본문이 ORM으로 수정되면 models의 before_update 훅이 rules_version을 비워 다시 대상이 됩니다.
+스트리밍 중에는 읽기 잠금을 잡고 있으므로 크롤링과 겹치지 않는 시간에 실행하는 것이 좋습니다.
+"""
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import bindparam, or_, select
+
+from app.database import engine
+from app.models import News, Wiki
+from app import stats, data_version, search_sync
+
+# entity → (모델, 분류 입력 컬럼, 분류 결과 컬럼)
+TARGETS = {
+    "news": (News, ("title", "summary"), ("category",)),
+    "wiki": (Wiki, ("title", "preview", "content"), ("category", "tags")),
+}
+
+
+def current_version(entity):
+    from crawler.crawler import NEWS_RULES_VERSION, WIKI_RULES_VERSION
+    return {"news": NEWS_RULES_VERSION, "wiki": WIKI_RULES_VERSION}[entity]
+
+
+def classify_chunk(entity, rows):
+    """[(id, 입력값...)] → [(id, 결과값...)] (프로세스 풀 워커에서 실행)"""
+    from crawler.crawler import classify_news, classify_wiki
+    if entity == "news":
+        return [(row[0], classify_news(*row[1:])) for row in rows]
+    return [(row[0], *classify_wiki(*row[1:])) for row in rows]
+
+
+def stale_count(db, entity):
+    model, _, _ = TARGETS[entity]
+    version = current_version(entity)
+    return db.query(model).filter(or_(model.rules_version.is_(None), model.rules_version != version)).count()
+
+
+def _write_chunk(conn, entity, version, chunk, results):
+    """분류 결과 기록 + 통계/데이터 버전/ES 대기열 반영, 값이 바뀐 행 수 반환"""
+    model, inputs, outputs = TARGETS[entity]
+    table = model.__table__
+    _, dims = stats.TRACKED[model]
+
+    changed, unchanged, deltas = [], [], Counter()
+    for (row_id, *new), old in zip(results, chunk):
+        new = dict(zip(outputs, new))
+        if all((old[name] or "") == new[name] for name in outputs):
+            unchanged.append({"_id": row_id})
+            continue
+        changed.append({"_id": row_id, **new})
+        if any((old[d] or "") != (new.get(d, old[d]) or "") for d in dims):
+            for key in stats.bucket_keys(entity, old, dims):
+                deltas[key] -= 1
+            for key in stats.bucket_keys(entity, {**old, **new}, dims):
+                deltas[key] += 1
+
+    by_id = table.c.id == bindparam("_id")
+    if changed:
+        values = {name: bindparam(name) for name in outputs}
+        conn.execute(table.update().where(by_id).values(rules_version=version, **values), changed)
+    if unchanged:
+        conn.execute(table.update().where(by_id).values(rules_version=version), unchanged)
+    if changed:
+        deltas = {k: v for k, v in deltas.items() if v}
+        if deltas:
+            stats.apply_deltas(conn, deltas)
+        data_version.bump_versions(conn, [entity])
+        if search_sync.OUTBOX_ENABLED:
+            search_sync.enqueue(conn, [(entity, row["_id"], "upsert") for row in changed])
+    conn.commit()
+    return len(changed)
+
+
+def reclassify(entity, workers=None, chunk_size=2000, full=False):
+    """entity 테이블의 오래된 분류를 다시 계산, {"scanned", "changed", "elapsed"} 반환
+
+    workers가 1 이하이면 프로세스 풀 없이 현재 프로세스에서 처리하고,
+    full이면 저장된 버전과 관계없이 모든 행을 다시 분류합니다.
+    """
+    model, inputs, outputs = TARGETS[entity]
+    table = model.__table__
+    version = current_version(entity)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    _, dims = stats.TRACKED[model]
+    # 입력 컬럼만 워커로 보내고 기존 값(통계 차원 포함)은 현재 프로세스에 보관
+    kept = list(dict.fromkeys(outputs + ("created_at",) + dims))
+    query = select(table.c.id, *[table.c[n] for n in inputs], *[table.c[n] for n in kept]).order_by(table.c.id)
+    if not full:
+        query = query.where(or_(table.c.rules_version.is_(None), table.c.rules_version != version))
+
+    start = time.perf_counter()
+    scanned = changed = 0
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    pending = deque()
+    try:
+        with engine.connect() as conn:
+            def finish_oldest():
+                future, chunk = pending.popleft()
+                results = future.result() if pool else future
+                return _write_chunk(conn, entity, version, chunk, results)
+
+            result = conn.execution_options(yield_per=chunk_size).execute(query)
+            for part in result.partitions():
+                rows = [tuple(row[:len(inputs) + 1]) for row in part]
+                chunk = [dict(zip(kept, row[len(inputs) + 1:])) for row in part]
+                scanned += len(rows)
+                if pool:
+                    pending.append((pool.submit(classify_chunk, entity, rows), chunk))
+                    # 진행 중인 청크를 워커 수의 2배로 제한 (스트리밍 메모리 상한)
+                    while len(pending) > workers * 2:
+                        changed += finish_oldest()
+                else:
+                    pending.append((classify_chunk(entity, rows), chunk))
+                    changed += finish_oldest()
+            while pending:
+                changed += finish_oldest()
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+    return {"scanned": scanned, "changed": changed, "elapsed": round(time.perf_counter() - start, 3)}
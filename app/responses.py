@@ -0,0 +1,89 @@
+"""
+응답 직렬화/압축 설정
+
+- FAST_JSON=true: orjson 기반 FastJSONResponse를 기본 응답 클래스로 사용
+  (orjson 미설치 시 표준 json으로 대체)
+- COMPRESSION=gzip|br|off: 응답 압축 (기본 gzip, br은 brotli-asgi 설치 시)
+- COMPRESSION_MIN_SIZE: 이 크기(byte) 미만 응답은 압축하지 않음
+- SSE(text/event-stream) 스트림은 압축 버퍼에 이벤트가 묶이지 않도록 압축에서 제외
+"""
+import os
+import json
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+FAST_JSON = os.getenv("FAST_JSON", "false").lower() == "true"
+COMPRESSION = os.getenv("COMPRESSION", "gzip").lower()
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", "6"))
+
+
+def dumps(content):
+    """JSON bytes 직렬화 (orjson 우선, 없으면 표준 json)"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson으로 렌더링하는 JSON 응답 (한글을 이스케이프하지 않음)"""
+
+    def render(self, content):
+        return dumps(content)
+
+
+def default_response_class():
+    return FastJSONResponse if FAST_JSON else JSONResponse
+
+
+class SelectiveCompression:
+    """지정한 경로/이벤트 스트림 요청은 압축 미들웨어를 건너뜀"""
+
+    def __init__(self, app, middleware_cls, exclude_paths=(), **options):
+        self.app = app
+        self.compressed = middleware_cls(app, **options)
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and self._excluded(scope):
+            await self.app(scope, receive, send)
+        else:
+            await self.compressed(scope, receive, send)
+
+    def _excluded(self, scope):
+        if scope["path"].startswith(self.exclude_paths):
+            return True
+        accept = Headers(scope=scope).get("accept", "")
+        return "text/event-stream" in accept
+
+
+def add_compression(app, exclude_paths=()):
+    """압축 미들웨어 등록, 적용된 방식 반환"""
+    if COMPRESSION == "off":
+        return "off"
+
+    if COMPRESSION == "br":
+        try:
+            from brotli_asgi import BrotliMiddleware
+            app.add_middleware(
+                SelectiveCompression, middleware_cls=BrotliMiddleware, exclude_paths=exclude_paths,
+                minimum_size=COMPRESSION_MIN_SIZE, gzip_fallback=True
+            )
+            return "br"
+        except ImportError:
+            print("[WARNING] brotli-asgi가 설치되어 있지 않아 gzip 압축을 사용합니다.")
+
+    app.add_middleware(
+        SelectiveCompression, middleware_cls=GZipMiddleware, exclude_paths=exclude_paths,
+        minimum_size=COMPRESSION_MIN_SIZE, compresslevel=COMPRESSION_LEVEL
+    )
+    return "gzip"
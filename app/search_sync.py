@@ -0,0 +1,276 @@
+"""
+Transactional outbox 기반 Elasticsearch 증분 동기화
+
+- 세션 훅: News/Wiki 추가/수정/삭제가 플러시될 때 같은 트랜잭션에서 search_outbox에 기록
+- OutboxWorker: 대기열을 배치 단위로 읽어 _bulk 요청으로 반영, 실패 시 백오프 후 재시도
+- reconcile(): id 구간별 체크섬으로 SQLite와 ES를 비교하고 불일치 문서를 대기열에 재등록
+
+동기화 비용은 전체 테이블 크기가 아니라 변경된 행 수에 비례합니다.
+"""
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, insert, delete, update
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import News, Wiki, SearchOutbox
+from app.data_version import bump_versions
+
+OUTBOX_ENABLED = os.getenv("USE_ELASTICSEARCH", "true").lower() == "true"
+OUTBOX_BATCH_SIZE = int(os.getenv("ES_OUTBOX_BATCH_SIZE", "500"))
+OUTBOX_POLL_INTERVAL = float(os.getenv("ES_OUTBOX_POLL_INTERVAL", "2"))
+OUTBOX_MAX_BACKOFF = 300
+
+SYNCED = {News: "news", Wiki: "wiki"}
+MODELS = {"news": News, "wiki": Wiki}
+
+
+# ---------------------------------------------------------------------------
+# 대기열 기록 (세션 훅)
+# ---------------------------------------------------------------------------
+
+def enqueue(connection, items):
+    """[(entity, entity_id, op)] 를 대기열에 추가 (ORM을 거치지 않는 쓰기 후에도 호출)"""
+    if not items:
+        return
+    now = datetime.now()
+    connection.execute(insert(SearchOutbox.__table__), [
+        {"entity": entity, "entity_id": entity_id, "op": op, "attempts": 0,
+         "available_at": now, "created_at": now}
+        for entity, entity_id, op in items
+    ])
+
+
+@event.listens_for(Session, "after_flush")
+def _record_outbox(session, flush_context):
+    if not OUTBOX_ENABLED:
+        return
+    items = []
+    for obj in session.new:
+        if type(obj) in SYNCED:
+            items.append((SYNCED[type(obj)], obj.id, "upsert"))
+    for obj in session.dirty:
+        if type(obj) in SYNCED and session.is_modified(obj) and obj not in session.deleted:
+            items.append((SYNCED[type(obj)], obj.id, "upsert"))
+    for obj in session.deleted:
+        if type(obj) in SYNCED:
+            items.append((SYNCED[type(obj)], obj.id, "delete"))
+    enqueue(session.connection(), items)
+
+
+def pending_count(db):
+    return db.query(SearchOutbox.id).count()
+
+
+# ---------------------------------------------------------------------------
+# 대기열 처리
+# ---------------------------------------------------------------------------
+
+def _documents(entity):
+    from app.elasticsearch_client import news_document, wiki_document
+    return {"news": news_document, "wiki": wiki_document}[entity]
+
+
+def _entity_of(index):
+    """bulk 응답의 _index(버전 인덱스 이름 news_v... 또는 별칭) → 엔티티 이름"""
+    return index if index in MODELS else index.rsplit("_v", 1)[0]
+
+
+def drain_once(es=None, batch_size=OUTBOX_BATCH_SIZE):
+    """
+    대기열을 한 배치 처리하고 반영된 엔티티 종류 집합과 처리 건수를 반환
+    같은 문서에 대한 여러 변경은 마지막 상태 한 번으로 합쳐서 보냅니다.
+    """
+    from elasticsearch.helpers import bulk
+    from app.elasticsearch_client import get_es_client
+
+    es = es or get_es_client()
+    db = SessionLocal()
+    try:
+        rows = db.query(SearchOutbox).filter(
+            SearchOutbox.available_at <= datetime.now()
+        ).order_by(SearchOutbox.id).limit(batch_size).all()
+        if not rows:
+            return set(), 0
+
+        # 문서별 최신 outbox 행만 유지
+        latest = {}
+        for row in rows:
+            latest[(row.entity, row.entity_id)] = row
+
+        actions = []
+        for entity, model in MODELS.items():
+            ids = [eid for (ent, eid), row in latest.items() if ent == entity and row.op == "upsert"]
+            found = {obj.id: obj for obj in db.query(model).filter(model.id.in_(ids)).all()} if ids else {}
+            to_doc = _documents(entity)
+            for (ent, eid), row in latest.items():
+                if ent != entity:
+                    continue
+                if row.op == "upsert" and eid in found:
+                    actions.append({"_op_type": "index", "_index": entity, "_id": eid, "_source": to_doc(found[eid])})
+                else:
+                    # 삭제되었거나 이미 사라진 행
+                    actions.append({"_op_type": "delete", "_index": entity, "_id": eid})
+
+        try:
+            _, errors = bulk(es, actions, raise_on_error=False, stats_only=False)
+        except Exception as e:
+            errors = [{"index": {"_index": a["_index"], "_id": a["_id"], "status": 503, "error": str(e)}} for a in actions]
+
+        failed = {}
+        for err in errors:
+            op, item = next(iter(err.items()))
+            if op == "delete" and item.get("status") == 404:
+                continue  # 이미 없는 문서 삭제는 성공으로 간주
+            # 별칭으로 보내도 응답의 _index는 실제 버전 인덱스 이름
+            failed[(_entity_of(item["_index"]), int(item["_id"]))] = str(item.get("error") or item.get("status"))
+
+        done_ids = [row.id for row in rows if (row.entity, row.entity_id) not in failed]
+        if done_ids:
+            db.execute(delete(SearchOutbox).where(SearchOutbox.id.in_(done_ids)))
+
+        now = datetime.now()
+        for row in rows:
+            key = (row.entity, row.entity_id)
+            if key in failed:
+                backoff = min(2 ** row.attempts, OUTBOX_MAX_BACKOFF)
+                db.execute(update(SearchOutbox).where(SearchOutbox.id == row.id).values(
+                    attempts=row.attempts + 1, last_error=failed[key][:500],
+                    available_at=now + timedelta(seconds=backoff)
+                ))
+
+        # 검색 결과가 바뀌었으므로 해당 테이블의 ETag도 갱신
+        synced = {entity for entity, entity_id in latest if (entity, entity_id) not in failed}
+        if synced:
+            bump_versions(db.connection(), synced)
+        db.commit()
+
+        if failed:
+            print(f"ES 동기화 실패 {len(failed)}건 (재시도 예정)")
+        return synced, len(done_ids)
+    finally:
+        db.close()
+
+
+class OutboxWorker:
+    """백그라운드 스레드에서 대기열을 주기적으로 비우는 워커"""
+
+    def __init__(self, on_synced=None, ready=None, poll_interval=OUTBOX_POLL_INTERVAL, batch_size=OUTBOX_BATCH_SIZE):
+        self.on_synced = on_synced
+        self.ready = ready
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.synced_total = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="es-outbox-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self.ready and not self.ready():
+                # ES 장애 중에는 재시도 횟수를 소모하지 않고 대기
+                self._stop.wait(self.poll_interval)
+                continue
+            try:
+                entities, count = drain_once(batch_size=self.batch_size)
+            except Exception as e:
+                print(f"ES 동기화 워커 오류: {e}")
+                entities, count = set(), 0
+            if count:
+                self.synced_total += count
+                if entities and self.on_synced:
+                    self.on_synced(entities)
+                continue  # 밀린 작업이 있으면 바로 다음 배치
+            self._stop.wait(self.poll_interval)
+
+
+# ---------------------------------------------------------------------------
+# 정합성 검사 (id 구간 체크섬)
+# ---------------------------------------------------------------------------
+
+def document_hash(doc):
+    """문서 내용 해시 (SQLite 행과 ES _source 양쪽에서 동일하게 계산)"""
+    normalized = {k: (v.isoformat() if isinstance(v, datetime) else v) for k, v in doc.items()}
+    raw = json.dumps(normalized, ensure_ascii=False, sort_keys=True)
+    return int(hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16], 16)
+
+
+def _bucket_digests(pairs, bucket_size):
+    """(id, hash) 스트림 → {구간 시작 id: (건수, XOR 체크섬)}"""
+    digests = {}
+    for doc_id, h in pairs:
+        bucket = doc_id // bucket_size * bucket_size
+        count, xor = digests.get(bucket, (0, 0))
+        digests[bucket] = (count + 1, xor ^ h)
+    return digests
+
+
+def _db_hashes(db, entity, lo=None, hi=None, chunk_size=1000):
+    model = MODELS[entity]
+    to_doc = _documents(entity)
+    query = db.query(model)
+    if lo is not None:
+        query = query.filter(model.id >= lo, model.id < hi)
+    for obj in query.order_by(model.id).yield_per(chunk_size):
+        yield obj.id, document_hash(to_doc(obj))
+
+
+def _es_hashes(es, entity, lo=None, hi=None):
+    from elasticsearch.helpers import scan
+    query = {"query": {"range": {"id": {"gte": lo, "lt": hi}}}} if lo is not None else {"query": {"match_all": {}}}
+    for hit in scan(es, index=entity, query=query, size=1000):
+        yield int(hit["_id"]), document_hash(hit["_source"])
+
+
+def reconcile(entity, bucket_size=1000, repair=False, es=None):
+    """
+    SQLite와 ES를 id 구간 체크섬으로 비교
+    불일치 구간만 문서 단위로 비교하여 (누락, 초과, 불일치) id 목록을 반환하고,
+    repair=True이면 대기열에 재등록합니다.
+    """
+    from app.elasticsearch_client import get_es_client
+
+    es = es or get_es_client()
+    db = SessionLocal()
+    try:
+        db_digests = _bucket_digests(_db_hashes(db, entity), bucket_size)
+        es_digests = _bucket_digests(_es_hashes(es, entity), bucket_size)
+        bad_buckets = sorted(b for b in set(db_digests) | set(es_digests) if db_digests.get(b) != es_digests.get(b))
+
+        missing, extra, changed = [], [], []
+        for lo in bad_buckets:
+            hi = lo + bucket_size
+            db_side = dict(_db_hashes(db, entity, lo, hi))
+            es_side = dict(_es_hashes(es, entity, lo, hi))
+            missing += [i for i in db_side if i not in es_side]
+            extra += [i for i in es_side if i not in db_side]
+            changed += [i for i in db_side if i in es_side and db_side[i] != es_side[i]]
+
+        if repair:
+            with SessionLocal.begin() as tx:
+                enqueue(tx.connection(), [(entity, i, "upsert") for i in missing + changed]
+                        + [(entity, i, "delete") for i in extra])
+
+        return {
+            "entity": entity,
+            "buckets": len(set(db_digests) | set(es_digests)),
+            "mismatched_buckets": len(bad_buckets),
+            "missing": sorted(missing),
+            "extra": sorted(extra),
+            "changed": sorted(changed),
+        }
+    finally:
+        db.close()
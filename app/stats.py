@@ -0,0 +1,209 @@
+"""
+통계 집계 테이블 (StatBucket) 증분 관리
+
+News/Wiki 행이 추가, 삭제되거나 카테고리/소스가 바뀔 때마다 같은 트랜잭션 안에서
+stat_bucket 카운터를 갱신합니다. 통계 API는 GROUP BY 없이 이 테이블만 읽습니다.
+
+버킷 구성: (entity, dimension, key, day)
+    - dimension: 'total' | 'source' | 'category'
+    - day: '' 는 전체 기간, 'YYYY-MM-DD' 는 일별 버킷, created_at이 없는 행은 NO_DAY
+
+주의: ORM을 거치지 않는 대량 UPDATE/DELETE는 훅이 동작하지 않으므로
+apply_deltas()로 직접 반영하거나 rebuild_stats()로 재계산해야 합니다.
+"""
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, func
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session, attributes
+
+from app.models import News, Wiki, StatBucket
+
+TRACKED = {
+    News: ("news", ("source", "category")),
+    Wiki: ("wiki", ("category",)),
+}
+
+
+# created_at이 없는 행의 일별 버킷 키 (증분 갱신과 재집계가 같은 키를 쓰도록 고정값,
+# 실제 날짜보다 앞서 정렬되므로 최근 N일 조회에는 나오지 않음)
+NO_DAY = "0000-00-00"
+
+
+def _day_of(value):
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    return NO_DAY
+
+
+def bucket_keys(entity, values, dimensions):
+    """행 하나가 기여하는 버킷 키 목록"""
+    day = _day_of(values.get("created_at"))
+    keys = [(entity, "total", "", ""), (entity, "total", "", day)]
+    for dim in dimensions:
+        key = values.get(dim) or ""
+        keys.append((entity, dim, key, ""))
+        keys.append((entity, dim, key, day))
+    return keys
+
+
+def _committed_values(obj, names):
+    """플러시 이전(DB에 저장되어 있던) 속성값"""
+    values = {}
+    for name in names:
+        hist = attributes.get_history(obj, name)
+        if hist.deleted:
+            values[name] = hist.deleted[0]
+        elif hist.unchanged:
+            values[name] = hist.unchanged[0]
+        else:
+            values[name] = getattr(obj, name)
+    return values
+
+
+def _current_values(obj, names):
+    return {name: getattr(obj, name) for name in names}
+
+
+def collect_deltas(session):
+    """세션의 new/dirty/deleted 상태로부터 버킷 증감량 계산"""
+    deltas = Counter()
+    for obj in session.new:
+        spec = TRACKED.get(type(obj))
+        if spec:
+            entity, dims = spec
+            for k in bucket_keys(entity, _current_values(obj, ("created_at",) + dims), dims):
+                deltas[k] += 1
+
+    for obj in session.deleted:
+        spec = TRACKED.get(type(obj))
+        if spec:
+            entity, dims = spec
+            for k in bucket_keys(entity, _committed_values(obj, ("created_at",) + dims), dims):
+                deltas[k] -= 1
+
+    for obj in session.dirty:
+        spec = TRACKED.get(type(obj))
+        if not spec or obj in session.deleted:
+            continue
+        entity, dims = spec
+        if not any(attributes.get_history(obj, d).has_changes() for d in dims):
+            continue
+        names = ("created_at",) + dims
+        for k in bucket_keys(entity, _committed_values(obj, names), dims):
+            deltas[k] -= 1
+        for k in bucket_keys(entity, _current_values(obj, names), dims):
+            deltas[k] += 1
+
+    return {k: v for k, v in deltas.items() if v}
+
+
+def apply_deltas(connection, deltas):
+    """버킷 증감량을 UPSERT로 반영"""
+    table = StatBucket.__table__
+    for (entity, dimension, key, day), delta in deltas.items():
+        stmt = insert(table).values(entity=entity, dimension=dimension, key=key, day=day, count=delta)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["entity", "dimension", "key", "day"],
+            set_={"count": table.c.count + delta},
+        )
+        connection.execute(stmt)
+
+
+@event.listens_for(Session, "after_flush")
+def _update_stats_after_flush(session, flush_context):
+    deltas = collect_deltas(session)
+    if deltas:
+        apply_deltas(session.connection(), deltas)
+
+
+# ---------------------------------------------------------------------------
+# 조회
+# ---------------------------------------------------------------------------
+
+def get_total(db, entity):
+    """전체 건수"""
+    row = db.query(StatBucket.count).filter(
+        StatBucket.entity == entity, StatBucket.dimension == "total",
+        StatBucket.key == "", StatBucket.day == ""
+    ).first()
+    return row[0] if row else 0
+
+
+def get_breakdown(db, entity, dimension):
+    """소스/카테고리별 전체 기간 건수 (많은 순)"""
+    rows = db.query(StatBucket.key, StatBucket.count).filter(
+        StatBucket.entity == entity, StatBucket.dimension == dimension,
+        StatBucket.day == "", StatBucket.count > 0
+    ).order_by(StatBucket.count.desc()).all()
+    return [(key or None, count) for key, count in rows]
+
+
+def get_daily(db, entity, days=30, dimension="total"):
+    """최근 N일 일별 건수 ({day: {key: count}})"""
+    since = (datetime.now() - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    rows = db.query(StatBucket.day, StatBucket.key, StatBucket.count).filter(
+        StatBucket.entity == entity, StatBucket.dimension == dimension,
+        StatBucket.day >= since, StatBucket.count > 0
+    ).order_by(StatBucket.day).all()
+
+    daily = {}
+    for day, key, count in rows:
+        daily.setdefault(day, {})[key or None] = count
+    return daily
+
+
+# ---------------------------------------------------------------------------
+# 정합성 검사 / 재구축
+# ---------------------------------------------------------------------------
+
+def compute_expected(db):
+    """원본 테이블을 GROUP BY로 집계한 기대값"""
+    expected = Counter()
+    for model, (entity, dims) in TRACKED.items():
+        day_expr = func.strftime("%Y-%m-%d", model.created_at)
+        for dim_values in [()] + [(d,) for d in dims]:
+            cols = [getattr(model, d) for d in dim_values]
+            rows = db.query(day_expr, *cols, func.count(model.id)).group_by(day_expr, *cols).all()
+            for row in rows:
+                day, count = row[0] or NO_DAY, row[-1]
+                dimension = dim_values[0] if dim_values else "total"
+                key = (row[1] or "") if dim_values else ""
+                expected[(entity, dimension, key, "")] += count
+                expected[(entity, dimension, key, day)] += count
+    return expected
+
+
+def check_stats(db):
+    """집계 테이블과 원본 테이블 비교, 불일치 목록 반환 [(bucket, stored, expected)]"""
+    expected = compute_expected(db)
+    stored = {
+        (b.entity, b.dimension, b.key, b.day): b.count
+        for b in db.query(StatBucket).all()
+    }
+    mismatches = []
+    for bucket in set(expected) | set(stored):
+        if stored.get(bucket, 0) != expected.get(bucket, 0):
+            mismatches.append((bucket, stored.get(bucket, 0), expected.get(bucket, 0)))
+    return sorted(mismatches)
+
+
+def rebuild_stats(db):
+    """집계 테이블 전체 재구축"""
+    expected = compute_expected(db)
+    db.query(StatBucket).delete()
+    db.bulk_insert_mappings(StatBucket, [
+        {"entity": e, "dimension": d, "key": k, "day": day, "count": c}
+        for (e, d, k, day), c in expected.items()
+    ])
+    db.commit()
+    return len(expected)
+
+
+def ensure_stats(db):
+    """집계 테이블이 비어있으면(최초 배포) 재구축"""
+    if db.query(StatBucket.id).first() is None and (
+        db.query(News.id).first() is not None or db.query(Wiki.id).first() is not None
+    ):
+        rebuild_stats(db)
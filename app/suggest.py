@@ -0,0 +1,81 @@
+"""
+검색어 자동완성 (search-as-you-type)
+
+- ES 사용 시: news/wiki 제목의 completion 필드(title.suggest)로 접두어 조회
+- ES 미사용/오류 시: 메모리 내 제목 접두어 인덱스 (정렬 배열 + 이진 탐색)
+  제목 전체와 각 단어 시작 위치부터의 접미어를 키로 두어 중간 단어로도 찾을 수 있습니다.
+  news/wiki 데이터 버전이 바뀌면 다음 요청 시 다시 빌드합니다.
+"""
+import bisect
+import threading
+
+from app.models import News, Wiki
+from app.data_version import get_versions
+
+SUGGEST_TABLES = ("news", "wiki")
+# 짧은 접두어에서 후보를 끝까지 훑지 않도록 limit의 몇 배까지만 살펴봄
+SCAN_FACTOR = 10
+
+
+def normalize(text):
+    return " ".join((text or "").lower().split())
+
+
+class TitlePrefixIndex:
+    def __init__(self):
+        self._keys = []
+        self._entries = []
+        self._versions = None
+        self._lock = threading.Lock()
+
+    def build(self, db):
+        entries = []
+        for entity, model in (("news", News), ("wiki", Wiki)):
+            for doc_id, title in db.query(model.id, model.title).yield_per(2000):
+                words = normalize(title).split(" ")
+                if not words[0]:
+                    continue
+                for pos in range(len(words)):
+                    entries.append((" ".join(words[pos:]), pos, entity, doc_id, title))
+        entries.sort()
+        # 검색 중인 요청이 있어도 안전하도록 한 번에 교체
+        self._keys, self._entries = [e[0] for e in entries], entries
+
+    def ensure_fresh(self, db):
+        """news/wiki 데이터 버전이 바뀌었으면 다시 빌드"""
+        versions = get_versions(db, SUGGEST_TABLES)
+        if versions == self._versions:
+            return
+        with self._lock:
+            if versions != self._versions:
+                self.build(db)
+                self._versions = versions
+
+    def lookup(self, prefix, limit=8):
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        keys, entries = self._keys, self._entries
+        start = bisect.bisect_left(keys, prefix)
+        candidates = {}
+        for i in range(start, min(start + limit * SCAN_FACTOR, len(keys))):
+            if not keys[i].startswith(prefix):
+                break
+            _, pos, entity, doc_id, title = entries[i]
+            best = candidates.get((entity, doc_id))
+            if best is None or pos < best[0]:
+                candidates[(entity, doc_id)] = (pos, title)
+        # 제목 첫머리 일치 → 짧은 제목 순, 같은 제목은 한 번만
+        ranked = sorted(candidates.items(), key=lambda item: (item[1][0], len(item[1][1])))
+        results, seen = [], set()
+        for (entity, doc_id), (_, title) in ranked:
+            if title in seen:
+                continue
+            seen.add(title)
+            results.append({"type": entity, "id": doc_id, "title": title})
+            if len(results) >= limit:
+                break
+        return results
+
+
+prefix_index = TitlePrefixIndex()
@@ -0,0 +1,120 @@
+"""
+뉴스 AI 요약 스트리밍 (single-flight)
+
+같은 뉴스에 대한 요약 요청이 동시에 여러 개 들어와도 LLM 생성은 하나만 실행하고,
+나중에 들어온 요청은 그때까지 생성된 조각부터 이어서 받습니다.
+생성은 스레드 풀에서 interactive 우선순위로 실행되어 이벤트 루프를 막지 않으며,
+완료되면 요약을 ORM으로 저장하므로 ETag/SSE/ES 동기화 훅이 그대로 적용됩니다.
+요청한 클라이언트가 모두 끊겨도 생성과 저장은 끝까지 진행합니다.
+"""
+import asyncio
+
+import bleach
+
+from app.database import SessionLocal
+from app.models import News
+from app.cache import response_cache
+from app.llm_scheduler import llm_priority
+
+
+class _Flight:
+    """뉴스 1건의 진행 중인 생성 (상태 변경은 모두 이벤트 루프 스레드에서)"""
+
+    def __init__(self):
+        self.pieces = []
+        self.done = False
+        self.summary = None
+        self.error = None
+        self.updated = asyncio.Event()
+
+    def _notify(self):
+        updated, self.updated = self.updated, asyncio.Event()
+        updated.set()
+
+    def push(self, piece):
+        self.pieces.append(piece)
+        self._notify()
+
+    def finish(self, summary, error):
+        self.summary = summary
+        self.error = error
+        self.done = True
+        self._notify()
+
+
+class SummaryStreams:
+    def __init__(self):
+        self._flights = {}
+
+    def join(self, news_id, title, content):
+        """진행 중인 생성에 합류하거나 새로 시작 (이벤트 루프에서 호출)"""
+        flight = self._flights.get(news_id)
+        if flight is None:
+            flight = _Flight()
+            self._flights[news_id] = flight
+            loop = asyncio.get_running_loop()
+            loop.run_in_executor(None, self._generate, loop, news_id, flight, title, content)
+        return flight
+
+    def in_flight(self):
+        return len(self._flights)
+
+    def _generate(self, loop, news_id, flight, title, content):
+        from app.ai_summarizer import stream_summary
+
+        pieces = []
+        try:
+            with llm_priority("interactive", "summarize"):
+                for piece in stream_summary(title, content):
+                    pieces.append(piece)
+                    loop.call_soon_threadsafe(flight.push, piece)
+            summary = bleach.clean("".join(pieces).strip())
+            if not summary:
+                raise Exception("요약 생성 실패")
+            _save_summary(news_id, summary)
+            loop.call_soon_threadsafe(self._finish, news_id, flight, summary, None)
+        except Exception as e:
+            print(f"AI 요약 스트리밍 오류 (뉴스 #{news_id}): {e}")
+            loop.call_soon_threadsafe(self._finish, news_id, flight, None, str(e)[:200] or "요약 생성 실패")
+
+    def _finish(self, news_id, flight, summary, error):
+        if self._flights.get(news_id) is flight:
+            del self._flights[news_id]
+        if summary:
+            response_cache.invalidate("news")
+        flight.finish(summary, error)
+
+    async def follow(self, flight):
+        """("token", 조각)들을 생성한 뒤 ("done", 요약) 또는 ("error", 메시지)"""
+        index = 0
+        while True:
+            while index < len(flight.pieces):
+                yield "token", flight.pieces[index]
+                index += 1
+            if flight.done:
+                if flight.error:
+                    yield "error", flight.error
+                else:
+                    yield "done", flight.summary
+                return
+            await flight.updated.wait()
+
+    async def result(self, flight):
+        """생성 완료까지 기다려 (요약, 오류) 반환"""
+        while not flight.done:
+            await flight.updated.wait()
+        return flight.summary, flight.error
+
+
+def _save_summary(news_id, summary):
+    db = SessionLocal()
+    try:
+        news = db.get(News, news_id)
+        if news is not None:
+            news.summary = summary
+            db.commit()
+    finally:
+        db.close()
+
+
+summary_streams = SummaryStreams()
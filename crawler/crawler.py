@@ -4,7 +4,8 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 from sqlalchemy.orm import Session
 from app.models import News, Wiki
-from app.ai_summarizer import summarize_news, generate_wiki_content
+from app.enrichment import requeue as requeue_enrichment
+from crawler.keyword_matcher import KeywordMatcher, rules_version
 import time
 import re
 
@@ -18,28 +19,23 @@ SECURITY_KEYWORDS = {
     '정보보호': ['정보보호', 'security', '보안', '정보유출', '데이터유출', 'leak', 'breach', '노출', 'exposure', '침해', '침입', 'intrusion', '방어', '대응'],
 }
 
+# 보안 키워드 매처 (규칙 세트당 한 번 컴파일, 텍스트는 한 번만 스캔)
+_SECURITY_MATCHER = KeywordMatcher(SECURITY_KEYWORDS.items())
+
+
+def keyword_frequencies(text):
+    """보안 키워드별 실제 등장 횟수"""
+    return _SECURITY_MATCHER.frequencies(text)
+
+
 # 간단 키워드 추출기 (보안 키워드만 필터링)
 def extract_keywords(text, top_n=5):
     if not text:
         return []
-    t = text.lower()
-    # 보안 키워드 추출
-    found_keywords = []
-    for category, keywords_list in SECURITY_KEYWORDS.items():
-        for kw in keywords_list:
-            if kw in t:
-                found_keywords.append(kw)
-    
-    # 중복 제거 및 빈도 계산
-    freq = {}
-    for kw in found_keywords:
-        freq[kw] = freq.get(kw, 0) + 1
-    
-    # 상위 top_n 선택
-    if freq:
-        items = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-        return [w for w, _ in items[:top_n]]
-    return []
+    freq = keyword_frequencies(text)
+    # 빈도 내림차순, 같으면 SECURITY_KEYWORDS에 나온 순서
+    ranked = sorted(freq, key=lambda kw: (-freq[kw], _SECURITY_MATCHER.rank[kw]))
+    return ranked[:top_n]
 
 
 # 텍스트 요약 함수 (3-5줄로 자동 요약)
@@ -101,16 +97,42 @@ CATEGORY_LABELS = {
 }
 
 
+_CATEGORY_MATCHER = KeywordMatcher(CATEGORY_KEYWORDS)
+
+
+def category_hits(text):
+    """카테고리별 키워드 적중 수"""
+    return _CATEGORY_MATCHER.label_hits(_CATEGORY_MATCHER.frequencies(text))
+
+
 def determine_category(text: str) -> str:
     if not text:
         return 'trend'
-    t = text.lower()
-    for cat, keys in CATEGORY_KEYWORDS:
-        for k in keys:
-            if k in t:
-                return cat
+    # 적중한 카테고리 중 CATEGORY_KEYWORDS 우선순위가 가장 높은 것
+    hits = category_hits(text)
+    for cat, _ in CATEGORY_KEYWORDS:
+        if hits.get(cat):
+            return cat
     return 'trend'
 
+
+# 분류 규칙 버전 (키워드를 고치면 값이 바뀌어 기존 행이 재분류 대상이 됨, scripts/reclassify.py)
+WIKI_TAG_TOP_N = 6
+NEWS_RULES_VERSION = rules_version(CATEGORY_KEYWORDS)
+WIKI_RULES_VERSION = rules_version(CATEGORY_KEYWORDS, list(SECURITY_KEYWORDS.items()), WIKI_TAG_TOP_N)
+
+
+def classify_news(title, summary):
+    """뉴스 카테고리"""
+    return determine_category(f"{title} {summary or ''}")
+
+
+def classify_wiki(title, preview, content):
+    """위키 (카테고리, 쉼표로 구분한 태그)"""
+    category = determine_category(f"{title} {preview or ''} {content or ''}")
+    tags = ','.join(extract_keywords(f"{preview or ''} {content or ''}", top_n=WIKI_TAG_TOP_N))
+    return category, tags
+
 def crawl_boannews(db: Session):
     """보안뉴스 크롤링"""
     url = "https://www.boannews.com/media/t_list.asp"
@@ -197,12 +219,8 @@ def crawl_boannews(db: Session):
                 if existing:
                     continue
 
-                # AI 요약 시도
-                ai_summary = summarize_news(title, summary)
-                if ai_summary:
-                    processed_summary = ai_summary
-                elif summary and len(summary) > 50:
-                    # AI 실패 시 기존 텍스트 기반 요약
+                # 우선 텍스트 기반 요약으로 저장하고 AI 요약은 보강 작업 대기열에서 처리
+                if summary and len(summary) > 50:
                     processed_summary = summarize_text(summary)
                 else:
                     processed_summary = summary or ""
@@ -216,21 +234,18 @@ def crawl_boannews(db: Session):
                     url=link
                 )
                 db.add(news)
-                db.commit()
+                db.flush()
                 
                 # Wiki 테이블에 자동 추가 (제목 기준 중복 방지)
                 # 위키는 뉴스와 동일한 콘텐츠가 되지 않도록 템플릿화하여 생성
                 # 카테고리 라벨은 전역 매핑 사용
 
+                wiki_id = None
                 wiki_existing = db.query(Wiki).filter(Wiki.title == title).first()
                 if not wiki_existing:
-                    # AI 위키 콘텐츠 생성
+                    # AI 위키 본문은 보강 작업에서 생성, 그 전까지는 폴백 본문 표시
                     wiki_cat = CATEGORY_LABELS.get(category, category or '기타')
-                    wiki_content = generate_wiki_content(title, wiki_cat)
-                    
-                    if not wiki_content:
-                        # AI 실패 시 폴백
-                        wiki_content = f"출처: 보안뉴스\n원문: {link}\n\n요약:\n{(processed_summary or '요약 없음')}"
+                    wiki_content = f"출처: 보안뉴스\n원문: {link}\n\n요약:\n{(processed_summary or '요약 없음')}"
                     
                     wiki = Wiki(
                         title=bleach.clean(title),
@@ -240,13 +255,20 @@ def crawl_boannews(db: Session):
                         type="auto"
                     )
                     db.add(wiki)
-                    db.commit()
+                    db.flush()
+                    wiki_id = wiki.id
+                    requeue_enrichment(db, "wiki_content", wiki.id, {"title": title, "category": wiki_cat})
+
+                requeue_enrichment(db, "news_summary", news.id, {"title": title, "text": summary, "wiki_id": wiki_id})
+                # 뉴스/위키/보강 작업을 한 트랜잭션으로 저장 (LLM 응답을 기다리지 않음)
+                db.commit()
                 
                 count += 1
                 print(f"추가: {title[:50]}...")
                 
             except Exception as e:
                 print(f"항목 파싱 오류: {e}")
+                db.rollback()  # 저장 도중 실패한 항목의 뉴스/위키/작업을 함께 취소
                 continue
         
         db.commit()
@@ -560,12 +582,8 @@ def _generic_crawl(db: Session, list_url: str, domain: str, source_label: str,
                 existing = db.query(News).filter(News.url == link).first()
                 if existing: continue
 
-                # AI 요약 시도
-                ai_summary = summarize_news(title, summary)
-                if ai_summary:
-                    processed_summary = ai_summary
-                else:
-                    processed_summary = summarize_text(summary) if summary else ""
+                # 우선 텍스트 기반 요약으로 저장하고 AI 요약은 보강 작업 대기열에서 처리
+                processed_summary = summarize_text(summary) if summary else ""
 
                 news = News(
                     title=bleach.clean(title), source=source_label, date=datetime.now().strftime("%Y-%m-%d"),
@@ -573,16 +591,14 @@ def _generic_crawl(db: Session, list_url: str, domain: str, source_label: str,
                     category=category, url=link
                 )
                 db.add(news)
-                db.commit()
+                db.flush()
 
-                # 위키 자동 생성
+                # 위키 자동 생성 (AI 본문은 보강 작업에서 생성, 그 전까지는 폴백 본문 표시)
+                wiki_id = None
                 wiki_existing = db.query(Wiki).filter(Wiki.title == title).first()
                 if not wiki_existing:
                     wiki_cat = CATEGORY_LABELS.get(category, '기타')
-                    wiki_content = generate_wiki_content(title, wiki_cat)
-                    
-                    if not wiki_content:
-                        wiki_content = f"출처: {source_label}\n원문: {link}\n\n요약:\n{processed_summary or '요약 없음'}"
+                    wiki_content = f"출처: {source_label}\n원문: {link}\n\n요약:\n{processed_summary or '요약 없음'}"
                         
                     wiki = Wiki(
                         title=bleach.clean(title), category=wiki_cat,
@@ -591,13 +607,19 @@ def _generic_crawl(db: Session, list_url: str, domain: str, source_label: str,
                         type="auto"
                     )
                     db.add(wiki)
-                    db.commit()
+                    db.flush()
+                    wiki_id = wiki.id
+                    requeue_enrichment(db, "wiki_content", wiki.id, {"title": title, "category": wiki_cat})
+
+                requeue_enrichment(db, "news_summary", news.id, {"title": title, "text": summary, "wiki_id": wiki_id})
+                db.commit()
 
                 added += 1
                 print(f"{source_label} 추가: {title[:50]}...")
                 time.sleep(0.5)
             except Exception as e:
                 print(f"{source_label} 항목 오류: {e}")
+                db.rollback()  # 저장 도중 실패한 항목의 뉴스/위키/작업을 함께 취소
                 continue
         return added
     except Exception as e:
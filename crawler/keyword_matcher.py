@@ -0,0 +1,128 @@
+"""
+다중 키워드 매처 (Aho-Corasick)
+
+규칙 세트([(라벨, [키워드, ...]), ...])를 한 번 컴파일해 두고 텍스트를 한 번만 훑어
+키워드별 실제 등장 횟수와 라벨별 적중 수를 계산합니다.
+- 텍스트는 소문자로 바꿔 비교하고 키워드는 적힌 그대로 사용 (기존 `kw in text.lower()` 판정과 동일)
+- '취약'과 '취약점'처럼 겹치는 키워드는 각각 셈
+- pyahocorasick(ahocorasick 모듈)이 설치되어 있으면 C 구현을, 없으면 순수 파이썬 DFA를 사용
+
+rules_version()은 규칙 세트로부터 버전 문자열을 만들어, 저장된 분류 결과가
+현재 규칙으로 계산된 것인지 행 단위로 판별할 수 있게 합니다.
+"""
+import json
+import hashlib
+from collections import deque
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# 매칭/판정 방식 자체가 바뀌면 올려서 모든 규칙 버전을 무효화
+MATCHER_REVISION = 1
+
+
+def rules_version(*rule_sets):
+    """규칙 세트(리스트/튜플/숫자 등 JSON 직렬화 가능한 값) 내용으로 계산한 12자리 버전"""
+    raw = json.dumps([MATCHER_REVISION, *rule_sets], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:12]
+
+
+class KeywordMatcher:
+    def __init__(self, groups, native=None):
+        self.labels = []
+        self.keywords = []
+        self.labels_of = {}
+        for label, keywords in groups:
+            self.labels.append(label)
+            for kw in keywords:
+                if not kw:
+                    continue
+                if kw not in self.labels_of:
+                    self.labels_of[kw] = []
+                    self.keywords.append(kw)
+                if label not in self.labels_of[kw]:
+                    self.labels_of[kw].append(label)
+        # 규칙에 처음 나온 순서 (빈도가 같을 때 정렬 기준)
+        self.rank = {kw: i for i, kw in enumerate(self.keywords)}
+
+        self.native = (ahocorasick is not None) if native is None else (native and ahocorasick is not None)
+        if self.native:
+            self._automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                self._automaton.add_word(kw, kw)
+            self._automaton.make_automaton()
+        else:
+            self._build_dfa()
+
+    def _build_dfa(self):
+        """트라이 + 실패 링크를 만든 뒤 상태별 전이표로 펼쳐 스캔 시 실패 링크를 따라가지 않게 함"""
+        goto, fail, output = [{}], [0], [[]]
+        for kw in self.keywords:
+            state = 0
+            for ch in kw:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    goto.append({})
+                    fail.append(0)
+                    output.append([])
+                    nxt = len(goto) - 1
+                    goto[state][ch] = nxt
+                state = nxt
+            output[state].append(kw)
+
+        # BFS 순서로 실패 링크 계산 (부모가 항상 먼저 처리됨)
+        order = []
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                if state == 0:
+                    continue
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                output[nxt] = output[nxt] + output[fail[nxt]]
+
+        delta = [None] * len(goto)
+        for state in order:
+            table = dict(delta[fail[state]]) if state else {}
+            table.update(goto[state])
+            delta[state] = table
+        self._delta = delta
+        self._output = [tuple(out) for out in output]
+
+    def frequencies(self, text):
+        """{키워드: 등장 횟수} (등장한 키워드만)"""
+        freq = {}
+        if not text:
+            return freq
+        text = text.lower()
+        if self.native:
+            for _, kw in self._automaton.iter(text):
+                freq[kw] = freq.get(kw, 0) + 1
+            return freq
+        delta, output, state = self._delta, self._output, 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if output[state]:
+                for kw in output[state]:
+                    freq[kw] = freq.get(kw, 0) + 1
+        return freq
+
+    def label_hits(self, freq):
+        """키워드 빈도 → {라벨: 적중 수}"""
+        hits = {}
+        for kw, count in freq.items():
+            for label in self.labels_of[kw]:
+                hits[label] = hits.get(label, 0) + count
+        return hits
+
+    def scan(self, text):
+        """(키워드 빈도, 라벨별 적중 수)"""
+        freq = self.frequencies(text)
+        return freq, self.label_hits(freq)
@@ -3,6 +3,7 @@
 위키 콘텐츠에서 핵심 정보만 추출
 """
 import re
+import json
 import bleach
 
 def sanitize_html(text):
@@ -116,6 +117,20 @@ def get_wiki_highlights(wiki):
     
     return highlights
 
+def build_wiki_derived_fields(wiki):
+    """
+    쓰기 시점에 저장할 위키 파생 필드 계산
+    (페이지 렌더링마다 bleach/정규식을 반복하지 않도록 미리 계산해 둠)
+    """
+    highlights = get_wiki_highlights(wiki)
+    return {
+        'preview_short': get_wiki_preview(wiki, 'short'),
+        'preview_medium': get_wiki_preview(wiki, 'medium'),
+        'preview_long': get_wiki_preview(wiki, 'long'),
+        'concept': highlights['concept'],
+        'highlights': json.dumps(highlights, ensure_ascii=False),
+    }
+
 def format_for_display(text, remove_technical=False):
     """화면 표시용 텍스트 포맷팅"""
     if not text:
@@ -0,0 +1,54 @@
+"""
+기존 위키 행의 미리보기/하이라이트 파생 필드를 채우는 백필 스크립트
+
+사용법:
+    python scripts/backfill_wiki_previews.py          # 비어있는 행만
+    python scripts/backfill_wiki_previews.py --all    # 전체 재계산
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.database import SessionLocal, ensure_schema
+from app.models import Wiki, apply_wiki_derived_fields
+
+
+def backfill(recompute_all=False, chunk_size=200):
+    """id 순서로 chunk 단위 처리 후 커밋"""
+    ensure_schema()
+    db = SessionLocal()
+    updated = 0
+    last_id = 0
+    try:
+        while True:
+            query = db.query(Wiki).filter(Wiki.id > last_id)
+            if not recompute_all:
+                query = query.filter(Wiki.preview_medium == None)
+            rows = query.order_by(Wiki.id).limit(chunk_size).all()
+            if not rows:
+                break
+
+            for w in rows:
+                apply_wiki_derived_fields(w)
+            db.commit()
+
+            updated += len(rows)
+            last_id = rows[-1].id
+            print(f"  {updated}개 처리 (마지막 ID: {last_id})")
+    except Exception as e:
+        print(f"❌ 백필 오류: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+    print(f"✅ 위키 미리보기 백필 완료: {updated}개")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="위키 미리보기 파생 필드 백필")
+    parser.add_argument('--all', action='store_true', help='이미 채워진 행도 다시 계산')
+    parser.add_argument('--chunk-size', type=int, default=200)
+    args = parser.parse_args()
+    backfill(recompute_all=args.all, chunk_size=args.chunk_size)
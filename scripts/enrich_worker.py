@@ -0,0 +1,66 @@
+"""
+LLM 보강 작업(AI 요약, 위키 본문 생성) 처리 CLI
+
+서버 내 워커(ENRICH_WORKERS)와 별도로 실행할 수 있으며, 작업 임대 방식이라 중복 처리되지 않습니다.
+
+사용법:
+    python scripts/enrich_worker.py status              # 상태별 작업 수
+    python scripts/enrich_worker.py run --workers 2     # 대기열을 계속 처리
+    python scripts/enrich_worker.py run --once          # 현재 처리 가능한 작업만 처리하고 종료
+    python scripts/enrich_worker.py retry-failed        # 실패 작업 재시도 대기열로 복귀
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.database import SessionLocal, ensure_schema
+from app.enrichment import EnrichmentWorkerPool, drain, queue_stats, retry_failed
+from app.ai_summarizer import llm_breaker
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 보강 작업 처리")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_run = sub.add_parser('run', help='대기열 처리')
+    p_run.add_argument('--workers', type=int, default=1)
+    p_run.add_argument('--once', action='store_true', help='처리 가능한 작업이 없으면 종료')
+    sub.add_parser('status', help='상태별 작업 수')
+    sub.add_parser('retry-failed', help='실패 작업을 다시 대기 상태로')
+    args = parser.parse_args()
+
+    ensure_schema()
+    db = SessionLocal()
+    try:
+        if args.command == 'status':
+            print(queue_stats(db))
+            print(f"LLM 서버({llm_breaker.probe_url}): {'응답' if llm_breaker.probe() else '응답 없음'}")
+        elif args.command == 'retry-failed':
+            print(f"✅ {retry_failed(db)}건을 다시 대기열에 넣었습니다.")
+    finally:
+        db.close()
+
+    if args.command != 'run':
+        return
+
+    if args.once:
+        start = time.time()
+        count = drain()
+        print(f"✅ {count}건 처리 ({time.time() - start:.1f}초)")
+        return
+
+    pool = EnrichmentWorkerPool(workers=args.workers)
+    pool.start()
+    print(f"보강 워커 {args.workers}개 실행 중 (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(10)
+    except KeyboardInterrupt:
+        pool.stop()
+        print(f"\n총 {pool.processed}건 처리")
+
+
+if __name__ == '__main__':
+    main()
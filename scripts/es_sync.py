@@ -0,0 +1,73 @@
+"""
+Elasticsearch 증분 동기화(outbox) 관리 CLI
+
+사용법:
+    python scripts/es_sync.py status                      # 대기 중인 변경 건수
+    python scripts/es_sync.py drain                       # 대기열 처리 (계속 실행)
+    python scripts/es_sync.py drain --once                # 현재 대기열만 비우고 종료
+    python scripts/es_sync.py reconcile all --repair      # 체크섬 비교 후 불일치 문서 재등록
+"""
+import sys
+import os
+import time
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.database import SessionLocal
+from app.search_sync import drain_once, pending_count, reconcile, OUTBOX_POLL_INTERVAL
+
+
+def cmd_status(args):
+    db = SessionLocal()
+    try:
+        print(f"대기 중인 변경: {pending_count(db)}건")
+    finally:
+        db.close()
+
+
+def cmd_drain(args):
+    total = 0
+    while True:
+        entities, count = drain_once(batch_size=args.batch_size)
+        total += count
+        if count:
+            print(f"  {count}건 반영 ({', '.join(sorted(entities)) or '-'})")
+            continue
+        if args.once:
+            break
+        time.sleep(OUTBOX_POLL_INTERVAL)
+    print(f"✅ 총 {total}건 반영")
+
+
+def cmd_reconcile(args):
+    targets = ['news', 'wiki'] if args.entity == 'all' else [args.entity]
+    for entity in targets:
+        result = reconcile(entity, bucket_size=args.bucket_size, repair=args.repair)
+        print(f"{entity}: 구간 {result['buckets']}개 중 불일치 {result['mismatched_buckets']}개, "
+              f"누락 {len(result['missing'])} / 초과 {len(result['extra'])} / 변경 {len(result['changed'])}")
+        if args.repair and (result['missing'] or result['extra'] or result['changed']):
+            print("  → 불일치 문서를 대기열에 재등록했습니다. drain으로 반영하세요.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Elasticsearch 증분 동기화 관리")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('status', help='대기열 현황')
+
+    p_drain = sub.add_parser('drain', help='대기열을 ES에 반영')
+    p_drain.add_argument('--once', action='store_true', help='대기열이 비면 종료')
+    p_drain.add_argument('--batch-size', type=int, default=500)
+
+    p_rec = sub.add_parser('reconcile', help='SQLite와 ES 정합성 검사')
+    p_rec.add_argument('entity', nargs='?', choices=['news', 'wiki', 'all'], default='all')
+    p_rec.add_argument('--bucket-size', type=int, default=1000, help='체크섬 구간 크기(id 개수)')
+    p_rec.add_argument('--repair', action='store_true', help='불일치 문서를 대기열에 재등록')
+
+    args = parser.parse_args()
+    {'status': cmd_status, 'drain': cmd_drain, 'reconcile': cmd_reconcile}[args.command](args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+LLM 응답 캐시 관리 CLI
+
+사용법:
+    python scripts/llm_cache.py stats                     # 항목 수, 누적 적중/절약 시간
+    python scripts/llm_cache.py purge-stale               # 현재 템플릿 버전이 아니거나 TTL이 지난 항목 삭제
+    python scripts/llm_cache.py clear [news_summary|wiki_content]   # 템플릿 캐시(또는 전체) 삭제
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.database import SessionLocal, ensure_schema
+from app import llm_cache
+from app.ai_summarizer import PROMPT_VERSIONS
+
+
+def cmd_stats(args, db):
+    result = llm_cache.stats(db)
+    for template, count in sorted(result["entries"].items()):
+        print(f"{template} (현재 버전 {PROMPT_VERSIONS.get(template, '-')}): {count}건")
+    print(f"누적 적중 {result['total_hits']}건, 절약된 LLM 시간 {result['total_saved_seconds']}초")
+
+
+def cmd_purge_stale(args, db):
+    print(f"✅ {llm_cache.purge_stale(db, PROMPT_VERSIONS)}건 삭제")
+
+
+def cmd_clear(args, db):
+    print(f"✅ {llm_cache.invalidate(db, args.template)}건 삭제")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 응답 캐시 관리")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('stats', help='캐시 현황')
+    sub.add_parser('purge-stale', help='이전 템플릿 버전/만료 항목 삭제')
+    p_clear = sub.add_parser('clear', help='캐시 삭제')
+    p_clear.add_argument('template', nargs='?', choices=sorted(PROMPT_VERSIONS), help='생략 시 전체')
+
+    args = parser.parse_args()
+    ensure_schema()
+    db = SessionLocal()
+    try:
+        {'stats': cmd_stats, 'purge-stale': cmd_purge_stale, 'clear': cmd_clear}[args.command](args, db)
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+통계 집계 테이블(stat_bucket) 정합성 검사 및 재구축
+
+사용법:
+    python scripts/rebuild_stats.py --check   # 불일치 항목만 출력 (불일치 시 종료 코드 1)
+    python scripts/rebuild_stats.py           # 전체 재구축
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.database import SessionLocal, ensure_schema
+from app.stats import check_stats, rebuild_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통계 집계 테이블 검사/재구축")
+    parser.add_argument('--check', action='store_true', help='재구축 없이 정합성만 검사')
+    args = parser.parse_args()
+
+    ensure_schema()
+    db = SessionLocal()
+    try:
+        if args.check:
+            mismatches = check_stats(db)
+            for bucket, stored, expected in mismatches:
+                print(f"  불일치 {bucket}: 저장값 {stored}, 기대값 {expected}")
+            if mismatches:
+                print(f"❌ 불일치 {len(mismatches)}건 (재구축: python scripts/rebuild_stats.py)")
+                sys.exit(1)
+            print("✅ 통계 테이블이 원본과 일치합니다.")
+        else:
+            count = rebuild_stats(db)
+            print(f"✅ 통계 테이블 재구축 완료: {count}개 버킷")
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,63 +1,54 @@
+"""
+뉴스/위키 카테고리·태그 재분류
+
+저장된 분류 규칙 버전(rules_version)이 현재 규칙과 다른 행만 다시 분류합니다 (app/reclassify.py).
+crawler/crawler.py의 CATEGORY_KEYWORDS/SECURITY_KEYWORDS를 고친 뒤 실행하면 됩니다.
+
+사용법:
+    python scripts/reclassify.py [--entity all|news|wiki] [--workers N] [--chunk-size 2000] [--full]
+"""
 import sys
 import os
+import argparse
 
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database import SessionLocal
-from app.models import News, Wiki
-from crawler.crawler import determine_category, extract_keywords
+from app.database import SessionLocal, ensure_schema
+from app.reclassify import TARGETS, current_version, reclassify, stale_count
 
 
 def main():
+    parser = argparse.ArgumentParser(description="뉴스/위키 증분 재분류")
+    parser.add_argument('--entity', choices=('all',) + tuple(TARGETS), default='all')
+    parser.add_argument('--workers', type=int, default=None, help='분류 프로세스 수 (기본: CPU 수, 1이면 단일 프로세스)')
+    parser.add_argument('--chunk-size', type=int, default=2000, help='한 번에 읽고 기록할 행 수')
+    parser.add_argument('--full', action='store_true', help='규칙 버전과 관계없이 전체 재분류')
+    args = parser.parse_args()
+
+    ensure_schema()
+    entities = list(TARGETS) if args.entity == 'all' else [args.entity]
     db = SessionLocal()
     try:
-        news_rows = db.query(News).all()
-    except Exception as e:
-        print('Failed to read News:', e)
-        return
-
-    n_updated = 0
-    for r in news_rows:
-        text = f"{r.title} {r.summary or ''}"
-        new_cat = determine_category(text)
-        if (r.category or '') != new_cat:
-            r.category = new_cat
-            n_updated += 1
-
-    try:
-        db.commit()
-    except Exception as e:
-        print('Failed to commit News updates:', e)
-
-    try:
-        wiki_rows = db.query(Wiki).all()
-    except Exception as e:
-        print('Failed to read Wiki:', e)
-        wiki_rows = []
-
-    w_updated = 0
-    for w in wiki_rows:
-        text = f"{w.title} {(w.preview or '')} {(w.content or '')}"
-        new_cat = determine_category(text)
-        new_tags = ','.join(extract_keywords((w.preview or '') + ' ' + (w.content or ''), top_n=6))
-        changed = False
-        if (w.category or '') != new_cat:
-            w.category = new_cat
-            changed = True
-        if (w.tags or '') != new_tags:
-            w.tags = new_tags
-            changed = True
-        if changed:
-            w_updated += 1
-
-    try:
-        db.commit()
-    except Exception as e:
-        print('Failed to commit Wiki updates:', e)
-
-    db.close()
-
-    print(f"Reclassification complete. News updated: {n_updated}, Wiki updated: {w_updated}")
+        stale = {entity: stale_count(db, entity) for entity in entities}
+    finally:
+        db.close()
+
+    updated = {}
+    for entity in entities:
+        if not stale[entity] and not args.full:
+            print(f"{entity}: 규칙 버전 {current_version(entity)} 최신 (대상 없음)")
+            updated[entity] = 0
+            continue
+        try:
+            result = reclassify(entity, workers=args.workers, chunk_size=args.chunk_size, full=args.full)
+        except Exception as e:
+            print(f'Failed to reclassify {entity}:', e)
+            continue
+        updated[entity] = result["changed"]
+        print(f"{entity}: 규칙 버전 {current_version(entity)}, {result['scanned']}건 검사, "
+              f"{result['changed']}건 변경 ({result['elapsed']}s)")
+
+    print(f"Reclassification complete. News updated: {updated.get('news', 0)}, Wiki updated: {updated.get('wiki', 0)}")
 
 
 if __name__ == '__main__':
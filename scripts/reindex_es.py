@@ -0,0 +1,58 @@
+"""
+SQLite → Elasticsearch 무중단 재색인
+
+새 버전 인덱스(news_v<타임스탬프>)를 만들어 bulk 적재한 뒤 news/wiki 별칭을 원자적으로 전환합니다.
+매핑/nori 분석기 변경 시에도 검색이 비지 않습니다.
+
+사용법:
+    python scripts/reindex_es.py                      # news + wiki
+    python scripts/reindex_es.py news --chunk-size 1000 --parallelism 4
+    python scripts/reindex_es.py wiki --keep 0        # 이전 버전 모두 삭제
+    python scripts/reindex_es.py --list               # 별칭별 현재 버전 확인
+"""
+import sys
+import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.elasticsearch_client import get_es_client, rebuild_index, alias_targets, INDEX_DEFINITIONS
+from app.search_sync import reconcile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Elasticsearch 무중단 재색인")
+    parser.add_argument('index', nargs='?', choices=['news', 'wiki', 'all'], default='all')
+    parser.add_argument('--chunk-size', type=int, default=None, help='_bulk 요청당 문서 수')
+    parser.add_argument('--parallelism', type=int, default=None, help='동시 _bulk 요청 수')
+    parser.add_argument('--keep', type=int, default=1, help='롤백용으로 남길 이전 버전 수')
+    parser.add_argument('--no-reconcile', action='store_true', help='전환 후 정합성 검사 생략')
+    parser.add_argument('--list', action='store_true', help='별칭과 버전 인덱스 목록만 출력')
+    args = parser.parse_args()
+
+    targets = list(INDEX_DEFINITIONS) if args.index == 'all' else [args.index]
+
+    if args.list:
+        es = get_es_client()
+        for alias in targets:
+            versions = sorted(es.indices.get(index=f"{alias}_v*", ignore_unavailable=True).keys())
+            print(f"{alias} → {', '.join(alias_targets(alias, es)) or '(별칭 없음)'} / 버전: {', '.join(versions) or '-'}")
+        return
+
+    for alias in targets:
+        stats = rebuild_index(alias, chunk_size=args.chunk_size, parallelism=args.parallelism, keep=args.keep)
+        print(f"✅ {alias} → {stats['index']}: {stats['indexed']}건 색인, 실패 {stats['failed']}건, "
+              f"{stats['elapsed']}초 ({stats['docs_per_sec']} docs/s)")
+        if stats['deleted']:
+            print(f"   이전 버전 삭제: {', '.join(stats['deleted'])}")
+
+        if not args.no_reconcile:
+            # 적재 도중 이전 인덱스로만 반영된 변경을 대기열에 재등록
+            result = reconcile(alias, repair=True)
+            fixes = len(result['missing']) + len(result['extra']) + len(result['changed'])
+            if fixes:
+                print(f"   적재 중 변경된 문서 {fixes}건을 동기화 대기열에 재등록")
+
+
+if __name__ == '__main__':
+    main()
@@ -49,6 +49,8 @@ function initializePage() {
     initializePagination();
     // 초기 섹션 활성화
     switchSection(currentSection);
+    // 신규 기사 실시간 수신 (폴링 대신 SSE)
+    subscribeLiveUpdates();
     // 브라우저 알림 권한 요청
     if ("Notification" in window && Notification.permission === "default") {
         Notification.requestPermission();
@@ -109,6 +111,7 @@ async function fetchNews() {
         
         const data = await response.json();
         renderNews(data.news);
+        updateCategoryFacets(data.facets && data.facets.news && data.facets.news.category);
         
         totalPages = data.pagination.total_pages;
         
@@ -126,6 +129,21 @@ async function fetchNews() {
     }
 }
 
+// 검색 응답에 포함된 카테고리 집계로 필터 옵션에 건수 표시 (ES 사용 시)
+function updateCategoryFacets(buckets) {
+    const select = document.getElementById('newsCategory');
+    if (!select) return;
+    const counts = {};
+    (buckets || []).forEach(b => { counts[b.key] = b.count; });
+    Array.from(select.options).forEach(option => {
+        if (!option.value) return;
+        if (!option.dataset.label) option.dataset.label = option.textContent;
+        option.textContent = buckets
+            ? `${option.dataset.label} (${counts[option.value] || 0})`
+            : option.dataset.label;
+    });
+}
+
 function filterNews() {
     const q = document.getElementById('newsSearch').value.toLowerCase();
     const newsItems = document.querySelectorAll('#newsGrid .news-item');
@@ -175,6 +193,9 @@ function createNewsElement(item) {
         ? 'badge-source-kr' 
         : 'badge-source-en';
     const sourceIcon = item.source && item.source.includes('보안뉴스') ? '🇰🇷' : '🌍';
+    // 검색 결과에는 검색어가 강조된 조각(highlight)이 함께 올 수 있음
+    const highlight = item.highlight || {};
+    const summary = highlight.summary || item.summary;
 
     let sourceLink;
     if (item.source && item.source.includes('보안뉴스')) {
@@ -194,9 +215,9 @@ function createNewsElement(item) {
             <span>${item.date}</span>
         </div>
         <h3 class="news-title">
-            <a href="${item.url}" target="_blank">${item.title}</a>
+            <a href="${item.url}" target="_blank">${highlight.title || item.title}</a>
         </h3>
-        ${item.summary ? `<p class="news-summary">${item.summary.replace(/<br\s*\/?>/gi, ' ')}</p>` : ''}
+        ${summary ? `<p class="news-summary">${summary.replace(/<br\s*\/?>/gi, ' ')}</p>` : ''}
         <div class="news-footer">
             <div>📰 출처: ${sourceLink}</div>
             <button class="btn btn-danger" onclick="deleteNews('${item.id}')">삭제</button>
@@ -309,6 +330,42 @@ function filterByCategory(category) {
     fetchNews();
 }
 
+// 입력 중에는 가벼운 자동완성(/api/suggest)만 호출하고, 실제 검색은 입력이 멈춘 뒤 한 번만 실행
+let suggestTimer = null;
+let searchTimer = null;
+let suggestController = null;
+
+function onSearchInput(value) {
+    clearTimeout(suggestTimer);
+    clearTimeout(searchTimer);
+    suggestTimer = setTimeout(() => loadSuggestions(value), 80);
+    searchTimer = setTimeout(() => searchContent(value), 300);
+}
+
+async function loadSuggestions(query) {
+    const list = document.getElementById('searchSuggestions');
+    if (!list) return;
+    if (suggestController) suggestController.abort();
+    if (!query.trim()) {
+        list.innerHTML = '';
+        return;
+    }
+    suggestController = new AbortController();
+    try {
+        const resp = await fetch(`/api/suggest?q=${encodeURIComponent(query)}`, { signal: suggestController.signal });
+        const data = await resp.json();
+        list.innerHTML = '';
+        data.suggestions.forEach(item => {
+            const option = document.createElement('option');
+            option.value = item.title;
+            option.label = item.type === 'wiki' ? '지식' : '뉴스';
+            list.appendChild(option);
+        });
+    } catch (e) {
+        if (e.name !== 'AbortError') console.error('자동완성 오류:', e);
+    }
+}
+
 function searchContent(query) {
     if (currentSection === 'news') {
         document.getElementById('newsSearch').value = query;
@@ -341,32 +398,94 @@ function renderWikiResults(wikis) {
         return;
     }
     wikis.forEach(item => {
-        const el = document.createElement('div');
-        el.className = 'wiki-card';
-        el.onclick = () => location.href = `/wiki/${item.id}`;
+        wikiGrid.appendChild(createWikiElement(item));
+    });
+}
 
-        const tagsHtml = (item.tags || '').split(',').filter(t => t).map(t => `<span class="tag">#${t}</span>`).join('');
-        
-        let badgeHtml = '';
-        if (item.type === 'auto') {
-            badgeHtml = '<span class="badge badge-wiki-auto">🤖 자동수집</span>';
-        } else if (item.type === 'manual') {
-            badgeHtml = '<span class="badge badge-wiki-manual">✍️ 수동작성</span>';
-        } else {
-            badgeHtml = '<span class="badge badge-wiki-expert">📚 전문문서</span>';
+function createWikiElement(item) {
+    const el = document.createElement('div');
+    el.className = 'wiki-card';
+    el.onclick = () => location.href = `/wiki/${item.id}`;
+
+    const tagsHtml = (item.tags || '').split(',').filter(t => t).map(t => `<span class="tag">#${t}</span>`).join('');
+    
+    let badgeHtml = '';
+    if (item.type === 'auto') {
+        badgeHtml = '<span class="badge badge-wiki-auto">🤖 자동수집</span>';
+    } else if (item.type === 'manual') {
+        badgeHtml = '<span class="badge badge-wiki-manual">✍️ 수동작성</span>';
+    } else {
+        badgeHtml = '<span class="badge badge-wiki-expert">📚 전문문서</span>';
+    }
+
+    const highlight = item.highlight || {};
+    const preview = highlight.content || item.preview_medium || item.preview;
+    el.innerHTML = `
+        <div class="wiki-header">
+            <div class="badge badge-category">${item.category || ''}</div>
+            ${badgeHtml}
+        </div>
+        <h3 class="wiki-title">${highlight.title || item.title}</h3>
+        ${preview ? `<p class="wiki-preview">${preview}</p>` : ''}
+        ${tagsHtml ? `<div class="wiki-tags">${tagsHtml}</div>` : ''}
+    `;
+    return el;
+}
+
+// 지식 사전 지연 로드 ("더 보기")
+async function loadMoreWiki() {
+    const wikiGrid = document.getElementById('wikiGrid');
+    const moreBtn = document.getElementById('wikiLoadMore');
+    if (!wikiGrid) return;
+
+    try {
+        const resp = await fetch(`/api/wiki?offset=${window.wikiOffset}&limit=${window.wikiLimit}`);
+        if (!resp.ok) throw new Error(`HTTP error! status: ${resp.status}`);
+        const wikis = await resp.json();
+        wikis.forEach(item => wikiGrid.appendChild(createWikiElement(item)));
+        window.wikiOffset += wikis.length;
+
+        if (moreBtn && (wikis.length < window.wikiLimit || window.wikiOffset >= window.wikiTotal)) {
+            moreBtn.remove();
         }
+    } catch (e) {
+        console.error('위키 로드 오류:', e);
+    }
+}
 
-        el.innerHTML = `
-            <div class="wiki-header">
-                <div class="badge badge-category">${item.category || ''}</div>
-                ${badgeHtml}
-            </div>
-            <h3 class="wiki-title">${item.title}</h3>
-            ${item.preview ? `<p class="wiki-preview">${item.preview}</p>` : ''}
-            ${tagsHtml ? `<div class="wiki-tags">${tagsHtml}</div>` : ''}
-        `;
-        
-        wikiGrid.appendChild(el);
+// ## Region: 실시간 업데이트 (SSE) ##
+
+function subscribeLiveUpdates() {
+    if (!window.EventSource) return;
+
+    // EventSource는 재접속 시 Last-Event-ID를 자동으로 보내 놓친 이벤트를 이어받음
+    const source = new EventSource('/api/stream?types=news');
+
+    source.addEventListener('news', (e) => {
+        const item = JSON.parse(e.data);
+        const q = document.getElementById('newsSearch')?.value;
+        const category = document.getElementById('newsCategory')?.value;
+        // 첫 페이지의 필터 없는 목록에만 바로 추가
+        if (currentPage !== 1 || q || category) return;
+
+        const newsGrid = document.getElementById('newsGrid');
+        if (!newsGrid) return;
+        newsGrid.querySelector('.info-message')?.remove();
+        newsGrid.prepend(createNewsElement(item));
+        if (newsGrid.children.length > currentLimit) {
+            newsGrid.lastElementChild.remove();
+        }
+
+        const totalItemsEl = document.getElementById('totalItems');
+        const total = parseInt(totalItemsEl?.textContent.replace(/[^0-9]/g, ''), 10);
+        if (totalItemsEl && !isNaN(total)) {
+            totalItemsEl.textContent = total + 1;
+        }
+    });
+
+    // 서버가 놓친 이벤트를 재전송할 수 없을 때는 목록을 새로 불러옴
+    source.addEventListener('reset', () => {
+        if (currentPage === 1) fetchNews();
     });
 }
 
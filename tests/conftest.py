@@ -0,0 +1,33 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+# app.database는 임포트 시점의 작업 디렉터리에 security_news.db를 만들므로 임시 디렉터리로 이동
+os.chdir(tempfile.mkdtemp(prefix="newcrawler_test_"))
+os.environ.setdefault("USE_ELASTICSEARCH", "true")
+
+# 쓰기 훅 모듈(app.stats, app.data_version 등)은 app.models를 통해 먼저 로드되어야 함
+import app.models  # noqa: E402,F401
+
+
+@pytest.fixture
+def db():
+    from app.database import SessionLocal, ensure_schema
+    import app.models  # noqa: F401 (ensure_schema 전에 모델 등록)
+    from app.models import News, Wiki, SearchOutbox, StatBucket, DataVersion
+
+    ensure_schema()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        for model in (SearchOutbox, StatBucket, DataVersion, News, Wiki):
+            session.query(model).delete()
+        session.commit()
+        session.close()
@@ -0,0 +1,24 @@
+import asyncio
+
+from app.cache import LRUBackend, ResponseCache
+from app.data_version import bump_versions
+from app.database import engine
+
+
+def test_cached_response_follows_data_version_bumped_elsewhere(db):
+    cache = ResponseCache(backend=LRUBackend(), ttl=600)
+    calls = []
+
+    @cache.cached("news_list", tags=("news",))
+    async def news_list(page=1):
+        calls.append(page)
+        return {"page": page, "call": len(calls)}
+
+    assert asyncio.run(news_list(page=1)) == {"page": 1, "call": 1}
+    assert asyncio.run(news_list(page=1)) == {"page": 1, "call": 1}
+
+    # 다른 프로세스의 쓰기처럼 이 캐시의 invalidate()를 거치지 않고 버전만 증가
+    with engine.begin() as conn:
+        bump_versions(conn, ["news"])
+
+    assert asyncio.run(news_list(page=1)) == {"page": 1, "call": 2}
@@ -0,0 +1,20 @@
+from types import SimpleNamespace
+
+from app.elasticsearch_client import news_document, wiki_document
+
+
+def test_wiki_content_is_indexed_without_html():
+    wiki = SimpleNamespace(id=1, title="SQL 인젝션", category="web", type="auto", tags="sql, web", created_at=None,
+                           preview="미리보기", content="<h2>개요</h2>\n<p>SQL &amp; XSS 공격</p>")
+
+    doc = wiki_document(wiki)
+
+    assert doc["content"] == "개요 SQL & XSS 공격"
+    assert doc["tags"] == ["sql", "web"]
+
+
+def test_news_summary_line_breaks_become_spaces():
+    news = SimpleNamespace(id=1, title="t", source="s", date="2024-01-01", category="web", url="u", created_at=None,
+                           summary="첫 줄<br>둘째 줄<BR/>셋째 줄")
+
+    assert news_document(news)["summary"] == "첫 줄 둘째 줄 셋째 줄"
@@ -0,0 +1,28 @@
+import gzip
+
+from tools.export_ndjson import last_exported_id, truncate_to
+
+
+def test_resume_drops_truncated_line(tmp_path):
+    path = tmp_path / "news.ndjson"
+    path.write_bytes(b'{"id": 1}\n{"id": 2}\n{"id": 3, "t": "tru')
+
+    last_id, offset, intact = last_exported_id(str(path), False)
+    assert (last_id, intact) == (2, False)
+    truncate_to(str(path), False, offset)
+
+    assert path.read_bytes() == b'{"id": 1}\n{"id": 2}\n'
+
+
+def test_resume_rewrites_broken_gzip_member(tmp_path):
+    path = tmp_path / "news.ndjson.gz"
+    second = gzip.compress(b'{"id": 3}\n' * 1000)
+    path.write_bytes(gzip.compress(b'{"id": 1}\n{"id": 2}\n') + second[:len(second) // 2])
+
+    last_id, offset, intact = last_exported_id(str(path), True)
+    assert not intact
+    truncate_to(str(path), True, offset)
+    with gzip.open(path, "ab") as f:
+        f.write(b'{"id": 4}\n')
+
+    assert last_exported_id(str(path), True) == (4, offset + 10, True)
@@ -0,0 +1,34 @@
+import pytest
+
+from app.ai_summarizer import LLMClient
+from tools.mock_llm_server import start_mock_server
+
+PAYLOAD = {"model": "test", "messages": [{"role": "user", "content": "hi"}]}
+
+
+@pytest.fixture
+def bad_request_server():
+    server = start_mock_server(fail_rate=1.0, error_status=400, base_ms=0, gen_ms=0)
+    yield server
+    server.shutdown()
+
+
+def test_client_error_fails_fast_without_backoff(bad_request_server):
+    client = LLMClient(url=bad_request_server.url, max_in_flight=1, max_retries=3)
+
+    with pytest.raises(Exception, match="LLM 요청 오류"):
+        client.complete(PAYLOAD, timeout=5)
+
+    assert bad_request_server.stats["requests"] == 1
+    assert client._backoff == 0.0
+    assert client.metrics()["retries"] == 0
+
+
+def test_stream_client_error_fails_fast_without_backoff(bad_request_server):
+    client = LLMClient(url=bad_request_server.url, max_in_flight=1, max_retries=3)
+
+    with pytest.raises(Exception, match="LLM 요청 오류"):
+        list(client.stream(PAYLOAD, timeout=5))
+
+    assert bad_request_server.stats["requests"] == 1
+    assert client._backoff == 0.0
@@ -0,0 +1,54 @@
+import elasticsearch.helpers
+
+from app import search_sync
+from app.models import News, SearchOutbox
+
+
+def add_news(db, title="news"):
+    news = News(title=title, source="test", date="2024-01-01", summary="", category="trend")
+    db.add(news)
+    db.commit()
+    return news.id
+
+
+def fake_bulk(errors):
+    def bulk(es, actions, raise_on_error=False, stats_only=False):
+        return len(actions) - len(errors), errors
+    return bulk
+
+
+def test_failed_bulk_item_stays_in_outbox(db, monkeypatch):
+    news_id = add_news(db)
+    # 별칭으로 색인해도 ES는 실제 버전 인덱스 이름으로 응답함
+    errors = [{"index": {"_index": "news_v20240101000000000", "_id": str(news_id), "status": 500, "error": "boom"}}]
+    monkeypatch.setattr(elasticsearch.helpers, "bulk", fake_bulk(errors))
+
+    synced, done = search_sync.drain_once(es=object())
+
+    assert synced == set() and done == 0
+    db.expire_all()
+    row = db.query(SearchOutbox).filter(SearchOutbox.entity == "news", SearchOutbox.entity_id == news_id).one()
+    assert row.attempts == 1
+    assert "boom" in row.last_error
+
+
+def test_successful_bulk_item_leaves_outbox(db, monkeypatch):
+    news_id = add_news(db)
+    monkeypatch.setattr(elasticsearch.helpers, "bulk", fake_bulk([]))
+
+    synced, done = search_sync.drain_once(es=object())
+
+    assert synced == {"news"} and done == 1
+    assert db.query(SearchOutbox).filter(SearchOutbox.entity_id == news_id).count() == 0
+
+
+def test_missing_document_delete_counts_as_synced(db, monkeypatch):
+    news_id = add_news(db)
+    db.delete(db.get(News, news_id))
+    db.commit()
+    errors = [{"delete": {"_index": "news_v20240101000000000", "_id": str(news_id), "status": 404}}]
+    monkeypatch.setattr(elasticsearch.helpers, "bulk", fake_bulk(errors))
+
+    search_sync.drain_once(es=object())
+
+    assert db.query(SearchOutbox).count() == 0
@@ -0,0 +1,21 @@
+from app import stats
+from app.models import News
+
+
+def test_rows_without_created_at_use_fixed_day_bucket(db):
+    # created_at 컬럼 추가 이전에 저장된 행처럼 날짜가 없는 행
+    db.execute(News.__table__.insert().values(title="undated", source="test", date="2024-01-01",
+                                              category="web", created_at=None))
+    db.commit()
+    stats.rebuild_stats(db)
+    assert stats.compute_expected(db)[("news", "total", "", stats.NO_DAY)] == 1
+
+    # 증분 갱신도 같은 버킷에서 빼고 더함
+    news = db.query(News).filter(News.title == "undated").one()
+    news.category = "malware"
+    db.commit()
+
+    assert stats.check_stats(db) == []
+    assert stats.get_breakdown(db, "news", "category") == [("malware", 1)]
+    # 날짜 없는 버킷은 최근 N일 조회에 포함되지 않음
+    assert stats.get_daily(db, "news") == {}
@@ -2,49 +2,110 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.models import News
 from app.database import SQLALCHEMY_DATABASE_URL
-from app.ai_summarizer import summarize_news
-import time
+from app import llm_cache
+from app.enrichment import requeue
+from app.llm_scheduler import llm_priority
+from app.ai_summarizer import summarize_news, summarize_news_batch, batch_metrics, llm_client, llm_breaker, LLMClient
+import argparse
 
 # DB 연결
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 Session = sessionmaker(bind=engine)
 db = Session()
 
-def batch_summarize():
-    """요약이 없거나 부족한 뉴스들을 AI로 일괄 요약"""
+def iter_targets(chunk_size=100):
+    """요약이 비어 있는 뉴스를 id 순서로 chunk_size개씩 읽어 (id, 제목, 요약) 스트림으로 반환"""
+    last_id = 0
+    while True:
+        rows = db.query(News.id, News.title, News.summary).filter(
+            (News.summary == "") | (News.summary == None), News.id > last_id
+        ).order_by(News.id).limit(chunk_size).all()
+        if not rows:
+            return
+        # 다음 청크를 읽기 전에 읽기 트랜잭션을 닫아 결과 반영(commit)과 충돌하지 않게 함
+        db.rollback()
+        yield from rows
+        last_id = rows[-1].id
+
+def iter_chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def summarize_stream(client, batch_size=1):
+    """(행, 요약, 예외) 스트림 (batch_size > 1이면 batch_size개 기사를 한 요청으로 요약)"""
+    # 본문이 없으면 제목으로라도 시도
+    if batch_size <= 1:
+        yield from client.map(lambda row: summarize_news(row.title, row.summary, client=client), iter_targets())
+        return
+    batches = client.map(
+        lambda rows: summarize_news_batch([(row.title, row.summary) for row in rows], client=client),
+        iter_chunks(iter_targets(), batch_size)
+    )
+    for rows, summaries, error in batches:
+        for row, summary in zip(rows, summaries or [None] * len(rows)):
+            yield row, summary, error
+
+def batch_summarize(concurrency=None, batch_size=1):
+    """요약이 없거나 부족한 뉴스들을 AI로 일괄 요약 (동시 요청 수만큼 병렬 처리)"""
     print("=== 일괄 AI 요약 시작 ===")
     
-    # 요약이 비어있거나 너무 짧은 항목들 조회 (AI 요약이 아닌 경우)
-    # 여기서는 간단히 제목만 있거나 요약이 50자 미만인 항목들을 대상으로 함
-    news_items = db.query(News).filter((News.summary == "") | (News.summary == None)).all()
-    
-    print(f"대상 항목 수: {len(news_items)}")
-    
     updated = 0
-    for item in news_items:
+    processed = 0
+    deferred = 0
+    client = LLMClient(max_in_flight=concurrency) if concurrency else llm_client
+    for row, new_summary, error in summarize_stream(client, batch_size):
+        processed += 1
         try:
-            print(f"요약 중: {item.title[:50]}...")
-            # 본문이 없으면 제목으로라도 시도
-            new_summary = summarize_news(item.title, item.summary)
-            
-            if new_summary:
-                item.summary = new_summary
+            if error:
+                print(f"   오류 ({row.title[:30]}...): {error}")
+            elif new_summary:
+                # ORM으로 수정해야 ETag/ES 동기화 훅이 적용됨
+                item = db.get(News, row.id)
+                if item is not None:
+                    item.summary = new_summary
+                    db.commit()
+                    updated += 1
+                print(f"   완료: {row.title[:30]}... → {new_summary[:60]}...")
+            elif llm_breaker.state != "closed":
+                # LLM 서버가 내려가 있으면 즉시 건너뛰고 보강 대기열에 넘겨 나중에 처리
+                requeue(db, "news_summary", row.id, {"title": row.title, "text": row.summary or ""})
                 db.commit()
-                updated += 1
-                print(f"   완료: {new_summary[:100]}...")
+                deferred += 1
             else:
-                print("   실패: AI 응답 없음")
-                
-            time.sleep(1) # 모델 부하 조절
-            
+                print(f"   실패: AI 응답 없음 ({row.title[:30]}...)")
         except Exception as e:
             print(f"   오류: {e}")
             db.rollback()
 
-    print(f"=== 일괄 요약 완료: {updated}개 업데이트됨 ===")
+    metrics = client.metrics()
+    print(f"=== 일괄 요약 완료: {processed}개 중 {updated}개 업데이트됨 ===")
+    print(f"처리량 {metrics['items_per_sec']} items/s, 지연 p50 {metrics['latency_ms']['p50']}ms "
+          f"/ p95 {metrics['latency_ms']['p95']}ms / p99 {metrics['latency_ms']['p99']}ms, 재시도 {metrics['retries']}회")
+    if batch_size > 1:
+        batches = batch_metrics()
+        print(f"배치 요청 {batches['batches']}회, 응답 누락/파싱 실패로 개별 요청 {batches['fallbacks']}건")
+    if deferred:
+        print(f"LLM 사용 불가로 {deferred}개를 건너뛰고 보강 대기열에 등록했습니다 (회로 차단기: {llm_breaker.snapshot()['last_error']})")
+    cache = llm_cache.stats()
+    print(f"LLM 캐시 적중 {cache['hits']}건 / 미적중 {cache['misses']}건 (적중률 {cache['hit_rate']}), "
+          f"절약된 LLM 시간 {cache['saved_seconds']}초")
+    queue = metrics['scheduler']['classes']['batch']
+    print(f"LLM 슬롯 대기 p50 {queue['wait_ms']['p50']}ms / p95 {queue['wait_ms']['p95']}ms / 최대 {queue['wait_ms']['max']}ms")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요약 없는 뉴스 일괄 AI 요약")
+    parser.add_argument('--concurrency', type=int, default=None, help='동시 요청 수 (기본: LLM_MAX_IN_FLIGHT)')
+    parser.add_argument('--batch-size', type=int, default=1, help='한 요청에 묶을 기사 수 (기본: 1, 기사별 요청)')
+    args = parser.parse_args()
     try:
-        batch_summarize()
+        # 서버의 화면 요청/보강 작업보다 낮은 우선순위로 실행
+        with llm_priority("batch", "batch_summarize"):
+            batch_summarize(args.concurrency, args.batch_size)
     finally:
         db.close()
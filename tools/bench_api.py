@@ -0,0 +1,90 @@
+"""
+API 응답 직렬화/압축 벤치마크
+
+/api/news?limit=100 과 /api/search 응답에 대해
+- 표준 json(JSONResponse) vs orjson(FastJSONResponse) 직렬화 시간
+- 원본 / gzip / brotli(설치 시) 페이로드 크기
+를 측정합니다. 현재 security_news.db 데이터를 사용합니다.
+
+사용법:
+    python tools/bench_api.py [--iterations 200] [--query 랜섬웨어]
+"""
+import os
+import sys
+import gzip
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.responses import FastJSONResponse, orjson
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _time_render(response_cls, payload, iterations):
+    renderer = response_cls.__new__(response_cls)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        body = renderer.render(payload)
+    elapsed = time.perf_counter() - start
+    return elapsed / iterations * 1000, body
+
+
+def bench_endpoint(client, path, iterations):
+    # 압축 없이 원본 페이로드를 받아 직렬화만 따로 측정
+    resp = client.get(path, headers={"Accept-Encoding": "identity"})
+    resp.raise_for_status()
+    payload = resp.json()
+
+    std_ms, std_body = _time_render(JSONResponse, payload, iterations)
+    fast_ms, fast_body = _time_render(FastJSONResponse, payload, iterations)
+
+    sizes = {
+        "raw": len(std_body),
+        "gzip": len(gzip.compress(std_body, compresslevel=6)),
+    }
+    if brotli is not None:
+        sizes["br"] = len(brotli.compress(std_body, quality=5))
+
+    # 미들웨어를 거친 실제 응답 크기
+    wire = client.get(path, headers={"Accept-Encoding": "gzip"})
+    return {
+        "path": path,
+        "json_ms": std_ms,
+        "fast_ms": fast_ms,
+        "sizes": sizes,
+        "wire_bytes": int(wire.headers.get("content-length", len(wire.content))),
+        "wire_encoding": wire.headers.get("content-encoding", "identity"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 직렬화/압축 벤치마크")
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--query', default='보안')
+    args = parser.parse_args()
+
+    client = TestClient(app)
+    paths = ["/api/news?limit=100", f"/api/search?q={args.query}&limit=100"]
+
+    print(f"직렬화 엔진: {'orjson' if orjson else '표준 json (orjson 미설치)'}, 반복 {args.iterations}회\n")
+    for path in paths:
+        r = bench_endpoint(client, path, args.iterations)
+        speedup = r["json_ms"] / r["fast_ms"] if r["fast_ms"] else 0
+        print(f"[{r['path']}]")
+        print(f"  직렬화  json: {r['json_ms']:.3f}ms  fast: {r['fast_ms']:.3f}ms  (x{speedup:.1f})")
+        sizes = "  ".join(f"{k}: {v:,}B" for k, v in r["sizes"].items())
+        print(f"  페이로드 {sizes}")
+        print(f"  전송 크기 {r['wire_bytes']:,}B ({r['wire_encoding']})\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+분류/태깅 처리량 측정 (scripts/reclassify.py와 같은 입력)
+
+DB의 전체 뉴스/위키에서 reclassify와 같은 방식으로 텍스트를 만들고
+키워드마다 부분 문자열을 검색하던 기존 방식과 Aho-Corasick 매처(KeywordMatcher)의
+문서/초, MB/초를 비교합니다. 카테고리 결과가 기존 방식과 같은지도 확인합니다.
+
+사용법:
+    python tools/bench_classify.py [--repeat 3]
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.database import SessionLocal
+from app.models import News, Wiki
+from crawler.crawler import CATEGORY_KEYWORDS, SECURITY_KEYWORDS, determine_category, extract_keywords
+from crawler import keyword_matcher
+from crawler.keyword_matcher import KeywordMatcher
+
+
+def naive_category(text):
+    """기존 구현: 카테고리 키워드마다 부분 문자열 검색"""
+    if not text:
+        return 'trend'
+    t = text.lower()
+    for cat, keys in CATEGORY_KEYWORDS:
+        for k in keys:
+            if k in t:
+                return cat
+    return 'trend'
+
+
+def naive_keywords(text, top_n=6):
+    """기존 구현: 보안 키워드마다 부분 문자열 검색 (빈도는 모두 1)"""
+    if not text:
+        return []
+    t = text.lower()
+    found = [kw for keywords in SECURITY_KEYWORDS.values() for kw in keywords if kw in t]
+    freq = {}
+    for kw in found:
+        freq[kw] = freq.get(kw, 0) + 1
+    return [w for w, _ in sorted(freq.items(), key=lambda x: x[1], reverse=True)[:top_n]]
+
+
+def load_corpus():
+    """(카테고리용 텍스트, 태그용 텍스트) 목록"""
+    db = SessionLocal()
+    try:
+        docs = [(f"{title} {summary or ''}", None) for title, summary in db.query(News.title, News.summary).yield_per(2000)]
+        docs += [
+            (f"{title} {preview or ''} {content or ''}", f"{preview or ''} {content or ''}")
+            for title, preview, content in db.query(Wiki.title, Wiki.preview, Wiki.content).yield_per(2000)
+        ]
+        return docs
+    finally:
+        db.close()
+
+
+def measure(label, docs, classify, tag, repeat, size):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text, tag_text in docs:
+            classify(text)
+            if tag_text is not None:
+                tag(tag_text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<28} {len(docs) / best:>12,.0f} docs/s {size / best / 1e6:>8.2f} MB/s ({best * 1000:.1f}ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="분류/태깅 처리량 측정")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    docs = load_corpus()
+    if not docs:
+        print("DB에 뉴스/위키가 없습니다.")
+        return
+    size = sum(len(text.encode('utf-8')) + len((tag_text or '').encode('utf-8')) for text, tag_text in docs)
+    print(f"문서 {len(docs)}개, {size / 1e6:.2f}MB")
+
+    mismatched = sum(1 for text, _ in docs if naive_category(text) != determine_category(text))
+    print(f"카테고리 불일치: {mismatched}건")
+
+    measure("기존 (키워드별 검색)", docs, naive_category, naive_keywords, args.repeat, size)
+    measure(f"매처 ({'pyahocorasick' if keyword_matcher.ahocorasick else '파이썬 DFA'})",
+            docs, determine_category, lambda t: extract_keywords(t, top_n=6), args.repeat, size)
+    if keyword_matcher.ahocorasick:
+        category = KeywordMatcher(CATEGORY_KEYWORDS, native=False)
+        security = KeywordMatcher(SECURITY_KEYWORDS.items(), native=False)
+        measure("매처 (파이썬 DFA)", docs,
+                lambda t: category.label_hits(category.frequencies(t)), security.frequencies, args.repeat, size)
+
+
+if __name__ == '__main__':
+    main()
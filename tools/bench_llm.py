@@ -0,0 +1,220 @@
+"""
+LLM 요약/보강 경로 벤치마크 (모의 LLM 서버 사용)
+
+시나리오:
+- summarize        summarize_news를 기사별로 호출
+- wiki             generate_wiki_content 호출
+- batch_summarize  tools/batch_summarize.py (요약 없는 뉴스 일괄 요약, --batch-size 적용)
+- regenerate_wiki  tools/regenerate_wiki.py (자동 위키 본문 재생성)
+- enrichment       크롤러와 같은 방식으로 뉴스/위키를 저장하고 보강 작업을 등록한 뒤 EnrichmentWorkerPool로 처리
+
+임시 디렉터리의 빈 SQLite DB에서 실행하므로 실제 데이터는 바뀌지 않으며 LLM 캐시는 사용하지 않습니다.
+시나리오마다 처리량, 요청 지연 p50/p95/p99, 실제 보낸 요청 수, 재시도 횟수와 백오프 대기 시간,
+모의 서버가 주입한 오류 수를 출력합니다.
+
+사용법:
+    python tools/bench_llm.py [--items 40] [--concurrency 2] [--slots 2]
+    python tools/bench_llm.py --fail-rate 0.05 --retry-rate 0.05 --latency-dist lognormal
+    python tools/bench_llm.py --scenarios summarize,enrichment --url http://localhost:12345/v1/chat/completions
+"""
+import io
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from tools.mock_llm_server import start_mock_server, LATENCY_DISTRIBUTIONS
+
+SCENARIOS = ("summarize", "wiki", "batch_summarize", "regenerate_wiki", "enrichment")
+CATEGORIES = ("malware", "vulnerability", "network", "web", "crypto")
+SAMPLE_SENTENCES = [
+    "공격자는 VPN 장비의 인증 우회 취약점을 이용해 내부망에 침투했다.",
+    "랜섬웨어 조직이 의료기관의 백업 서버까지 암호화해 진료가 중단되었다.",
+    "보안 업체는 공급망 공격에 사용된 악성 업데이트 패키지를 분석해 공개했다.",
+    "피싱 메일에 첨부된 문서를 열면 원격 접속 도구가 설치되는 방식이다.",
+    "유출된 계정 정보는 다크웹에서 판매되고 있는 것으로 확인되었다.",
+]
+
+
+def make_articles(count, prefix):
+    return [
+        (f"{prefix} 보안 사고 {i}", " ".join(random.choice(SAMPLE_SENTENCES) for _ in range(6)), random.choice(CATEGORIES))
+        for i in range(count)
+    ]
+
+
+def seed_news(articles, with_jobs=False):
+    """이전 시나리오 데이터를 지우고 뉴스(요약 없음)와 자동 위키 저장, with_jobs면 크롤러처럼 보강 작업도 함께 등록"""
+    from app.database import SessionLocal
+    from app.models import News, Wiki, EnrichmentJob
+    from app.enrichment import enqueue
+
+    db = SessionLocal()
+    try:
+        for model in (News, Wiki, EnrichmentJob):
+            db.query(model).delete()
+        for title, text, category in articles:
+            news = News(title=title, source="bench", date="2024-01-01", summary="", category=category,
+                        url=f"https://bench.local/{random.getrandbits(32):x}")
+            wiki = Wiki(title=title, category=category, preview=text[:200], content=text, type="auto")
+            db.add_all([news, wiki])
+            db.flush()
+            if with_jobs:
+                enqueue(db, "wiki_content", wiki.id, {"title": title, "category": category})
+                enqueue(db, "news_summary", news.id, {"title": title, "text": text, "wiki_id": wiki.id})
+        db.commit()
+    finally:
+        db.close()
+
+
+def run_summarize(args, articles):
+    from app.ai_summarizer import llm_client, summarize_news
+    results = list(llm_client.map(lambda a: summarize_news(a[0], a[1]), articles))
+    return len(results), sum(1 for _, summary, _ in results if not summary)
+
+
+def run_wiki(args, articles):
+    from app.ai_summarizer import llm_client, generate_wiki_content
+    results = list(llm_client.map(lambda a: generate_wiki_content(a[0], a[2]), articles))
+    return len(results), sum(1 for _, content, _ in results if not content)
+
+
+def count_rows(model, *criteria):
+    from app.database import SessionLocal
+    db = SessionLocal()
+    try:
+        return db.query(model).filter(*criteria).count()
+    finally:
+        db.close()
+
+
+def run_batch_summarize(args, articles):
+    from app.models import News
+    seed_news(articles)
+    import tools.batch_summarize as tool
+    with contextlib.redirect_stdout(io.StringIO()):
+        tool.batch_summarize(None, args.batch_size)
+    return len(articles), count_rows(News, News.summary == "")
+
+
+def run_regenerate_wiki(args, articles):
+    from app.models import Wiki
+    seed_news(articles)
+    import tools.regenerate_wiki as tool
+    with contextlib.redirect_stdout(io.StringIO()):
+        tool.regenerate_wiki(None)
+    # 재생성된 본문은 섹션 제목(<h2>)을 포함
+    return len(articles), count_rows(Wiki, ~Wiki.content.contains("<h2>"))
+
+
+def run_enrichment(args, articles):
+    from app.database import SessionLocal
+    from app.enrichment import EnrichmentWorkerPool, queue_stats
+
+    seed_news(articles, with_jobs=True)
+    pool = EnrichmentWorkerPool(workers=args.concurrency, poll_interval=0.1)
+    db = SessionLocal()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            pool.start()
+            while True:
+                stats = queue_stats(db)
+                db.rollback()
+                if stats["pending"] + stats["running"] == 0:
+                    break
+                time.sleep(0.05)
+            pool.stop()
+    finally:
+        db.close()
+    return stats["done"] + stats["failed"], stats["failed"]
+
+
+RUNNERS = {
+    "summarize": run_summarize,
+    "wiki": run_wiki,
+    "batch_summarize": run_batch_summarize,
+    "regenerate_wiki": run_regenerate_wiki,
+    "enrichment": run_enrichment,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 요약/보강 경로 벤치마크")
+    parser.add_argument('--scenarios', default=",".join(SCENARIOS), help='쉼표로 구분한 시나리오 목록')
+    parser.add_argument('--items', type=int, default=40, help='시나리오별 기사 수')
+    parser.add_argument('--concurrency', type=int, default=2, help='LLM 동시 요청 수 / 보강 워커 수')
+    parser.add_argument('--batch-size', type=int, default=1, help='batch_summarize 시나리오의 배치 크기')
+    parser.add_argument('--url', default=None, help='측정할 LLM 서버 (생략 시 모의 서버 실행)')
+    mock = parser.add_argument_group('모의 서버')
+    mock.add_argument('--slots', type=int, default=2)
+    mock.add_argument('--base-ms', type=float, default=50.0)
+    mock.add_argument('--prompt-ms', type=float, default=0.5)
+    mock.add_argument('--gen-ms', type=float, default=5.0)
+    mock.add_argument('--latency-dist', choices=LATENCY_DISTRIBUTIONS, default='lognormal')
+    mock.add_argument('--jitter', type=float, default=0.5)
+    mock.add_argument('--fail-rate', type=float, default=0.0)
+    mock.add_argument('--retry-rate', type=float, default=0.0)
+    mock.add_argument('--malformed-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [s for s in scenarios if s not in RUNNERS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+
+    server = None
+    url = args.url
+    if url is None:
+        server = start_mock_server(
+            slots=args.slots, base_ms=args.base_ms, prompt_ms=args.prompt_ms, gen_ms=args.gen_ms,
+            latency_dist=args.latency_dist, jitter=args.jitter, fail_rate=args.fail_rate,
+            retry_rate=args.retry_rate, malformed_rate=args.malformed_rate
+        )
+        url = server.url
+
+    # app 모듈은 임포트 시점에 LLM 주소와 DB 경로(./security_news.db)를 읽으므로 먼저 환경을 맞춤
+    workdir = tempfile.mkdtemp(prefix="bench_llm_")
+    os.chdir(workdir)
+    os.environ.update({
+        "LM_STUDIO_URL": url,
+        "LLM_MAX_IN_FLIGHT": str(args.concurrency),
+        "LLM_CACHE_ENABLED": "false",
+        "USE_ELASTICSEARCH": "false",
+    })
+    from app.database import ensure_schema
+    import app.models  # noqa: F401 (ensure_schema 전에 모델 등록)
+    ensure_schema()
+    from app.ai_summarizer import llm_client, llm_breaker
+
+    random.seed(1)
+    print(f"LLM 서버: {url} / 동시 요청 {args.concurrency} / 기사 {args.items}개 / 임시 DB {workdir}")
+    print(f"{'시나리오':<16} {'항목':>5} {'실패':>4} {'시간(s)':>8} {'items/s':>8} {'p50(ms)':>8} {'p95(ms)':>8} "
+          f"{'p99(ms)':>8} {'요청':>5} {'재시도':>6} {'백오프(s)':>9} {'주입 오류':>9}")
+    for name in scenarios:
+        articles = make_articles(args.items, name)
+        llm_client.reset_metrics()
+        before = dict(server.stats) if server else {}
+        start = time.perf_counter()
+        items, failed = RUNNERS[name](args, articles)
+        elapsed = time.perf_counter() - start
+        metrics = llm_client.metrics()
+        after = dict(server.stats) if server else {}
+        requests_sent = after.get("requests", 0) - before.get("requests", 0) if server else "-"
+        injected = sum(after.get(k, 0) - before.get(k, 0) for k in ("errors", "retries", "malformed")) if server else "-"
+        latency = metrics["latency_ms"]
+        print(f"{name:<16} {items:>5} {failed:>4} {elapsed:>8.2f} {items / elapsed:>8.2f} {latency['p50'] or 0:>8} "
+              f"{latency['p95'] or 0:>8} {latency['p99'] or 0:>8} {requests_sent:>5} {metrics['retries']:>6} "
+              f"{metrics['backoff_wait_sec']:>9.2f} {injected:>9}")
+
+    if llm_breaker.state != "closed":
+        print(f"⚠️ 회로 차단기 상태: {llm_breaker.snapshot()}")
+
+
+if __name__ == '__main__':
+    main()
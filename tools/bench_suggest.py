@@ -0,0 +1,76 @@
+"""
+/api/suggest 지연 시간 측정 (목표: p99 20ms 미만)
+
+현재 DB의 뉴스/위키 제목에서 1~4글자 접두어를 뽑아 요청하고
+캐시 미스(첫 요청)와 캐시 적중(반복 요청) 각각의 p50/p99를 출력합니다.
+
+사용법:
+    python tools/bench_suggest.py [--prefixes 300] [--repeat 3]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.database import SessionLocal
+from app.models import News, Wiki
+
+
+def sample_prefixes(count):
+    db = SessionLocal()
+    try:
+        titles = [t for (t,) in db.query(News.title).limit(2000)] + [t for (t,) in db.query(Wiki.title).limit(2000)]
+    finally:
+        db.close()
+    titles = [t.strip() for t in titles if t and t.strip()]
+    if not titles:
+        return []
+    random.seed(42)
+    prefixes = set()
+    for _ in range(count * 20):
+        if len(prefixes) >= count:
+            break
+        title = random.choice(titles)
+        prefixes.add(title[:random.randint(1, min(4, len(title)))])
+    return list(prefixes)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/api/suggest 지연 시간 벤치마크")
+    parser.add_argument('--prefixes', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=3, help='접두어별 반복 요청 수 (캐시 적중 측정)')
+    args = parser.parse_args()
+
+    prefixes = sample_prefixes(args.prefixes)
+    if not prefixes:
+        print("제목 데이터가 없습니다.")
+        return
+
+    client = TestClient(app)
+    client.get("/api/suggest", params={"q": "warmup"})  # 접두어 인덱스 빌드
+
+    cold, warm = [], []
+    for prefix in prefixes:
+        for i in range(args.repeat + 1):
+            start = time.perf_counter()
+            client.get("/api/suggest", params={"q": prefix}).raise_for_status()
+            (cold if i == 0 else warm).append(time.perf_counter() - start)
+
+    for label, samples in (("캐시 미스", cold), ("캐시 적중", warm)):
+        if samples:
+            print(f"{label}: {len(samples)}회, p50 {percentile(samples, 0.5):.2f}ms, p99 {percentile(samples, 0.99):.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+뉴스 요약 처리량 측정: 기사별 요청 vs 여러 기사를 묶은 배치 요청
+
+모의 LLM 서버(tools/mock_llm_server.py)를 띄워 같은 기사 묶음을 모드별로 요약하고
+기사당 벽시계 시간과 프롬프트/응답 토큰 수, 배치 파싱 실패로 개별 요청한 건수를 출력합니다.
+LLM 캐시는 측정 중 사용하지 않습니다.
+
+사용법:
+    python tools/bench_summarize.py [--articles 48] [--batch-sizes 4,8] [--concurrency 1]
+    python tools/bench_summarize.py --url http://localhost:12345/v1/chat/completions   # 실제 LM Studio로 측정
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import llm_cache
+from app import ai_summarizer
+from app.ai_summarizer import LLMClient, summarize_news, summarize_news_batch
+from tools.mock_llm_server import start_mock_server
+
+SAMPLE_SENTENCES = [
+    "공격자는 VPN 장비의 인증 우회 취약점을 이용해 내부망에 침투했다.",
+    "랜섬웨어 조직이 의료기관의 백업 서버까지 암호화해 진료가 중단되었다.",
+    "보안 업체는 공급망 공격에 사용된 악성 업데이트 패키지를 분석해 공개했다.",
+    "피싱 메일에 첨부된 문서를 열면 원격 접속 도구가 설치되는 방식이다.",
+    "제조사는 긴급 보안 패치를 배포하고 관리자 페이지 외부 노출을 차단하라고 권고했다.",
+    "유출된 계정 정보는 다크웹에서 판매되고 있는 것으로 확인되었다.",
+]
+
+
+def make_articles(count, sentences=8):
+    random.seed(7)
+    return [
+        (f"보안 사고 {i}", " ".join(random.choice(SAMPLE_SENTENCES) for _ in range(sentences)))
+        for i in range(count)
+    ]
+
+
+def chunked(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def run(label, url, articles, batch_size, concurrency):
+    client = LLMClient(url=url, max_in_flight=concurrency)
+    before = ai_summarizer.batch_metrics()
+    start = time.perf_counter()
+    if batch_size == 1:
+        results = list(client.map(lambda article: summarize_news(*article, client=client), articles))
+        done = sum(1 for _, summary, _ in results if summary)
+    else:
+        results = list(client.map(lambda chunk: summarize_news_batch(chunk, client=client),
+                                  chunked(articles, batch_size)))
+        done = sum(1 for _, summaries, _ in results for summary in summaries or [] if summary)
+    elapsed = time.perf_counter() - start
+
+    metrics = client.metrics()
+    after = ai_summarizer.batch_metrics()
+    count = len(articles)
+    print(f"{label:<10} {metrics['completed']:>6} {elapsed * 1000 / count:>14.1f} "
+          f"{metrics['prompt_tokens'] / count:>14.1f} {metrics['completion_tokens'] / count:>14.1f} "
+          f"{after['fallbacks'] - before['fallbacks']:>8} {done:>4}/{count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="배치 요약 처리량 측정")
+    parser.add_argument('--articles', type=int, default=48)
+    parser.add_argument('--batch-sizes', default='4,8', help='쉼표로 구분한 배치 크기 목록')
+    parser.add_argument('--concurrency', type=int, default=1, help='동시 요청 수')
+    parser.add_argument('--url', default=None, help='측정할 LLM 서버 (생략 시 모의 서버 실행)')
+    parser.add_argument('--slots', type=int, default=1, help='모의 서버 동시 처리 슬롯 수')
+    parser.add_argument('--prompt-ms', type=float, default=2.0, help='모의 서버의 프롬프트 토큰당 처리 시간(ms)')
+    parser.add_argument('--gen-ms', type=float, default=10.0, help='모의 서버의 생성 토큰당 시간(ms)')
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help='모의 서버의 잘린 응답 비율')
+    args = parser.parse_args()
+
+    llm_cache.LLM_CACHE_ENABLED = False
+    url = args.url
+    if url is None:
+        server = start_mock_server(slots=args.slots, prompt_ms=args.prompt_ms, gen_ms=args.gen_ms,
+                                   malformed_rate=args.malformed_rate)
+        url = server.url
+        print(f"모의 LLM 서버: {url} (슬롯 {args.slots})")
+
+    articles = make_articles(args.articles)
+    print(f"기사 {len(articles)}개, 동시 요청 {args.concurrency}")
+    print(f"{'모드':<10} {'요청 수':>6} {'기사당 시간(ms)':>14} {'기사당 입력 토큰':>14} {'기사당 출력 토큰':>14} "
+          f"{'개별 재요청':>8} {'성공':>9}")
+    run("single", url, articles, 1, args.concurrency)
+    for size in [int(s) for s in args.batch_sizes.split(',') if s.strip()]:
+        run(f"batch-{size}", url, articles, size, args.concurrency)
+
+
+if __name__ == '__main__':
+    main()
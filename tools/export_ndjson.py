@@ -0,0 +1,110 @@
+"""
+뉴스/위키 NDJSON 내보내기 CLI (/api/export/*.ndjson 과 동일한 형식)
+
+사용법:
+    python tools/export_ndjson.py news -o news.ndjson
+    python tools/export_ndjson.py wiki -o wiki.ndjson.gz --gzip --since 2026-01-01
+    python tools/export_ndjson.py news -o news.ndjson --resume   # 중단된 지점부터 이어쓰기
+"""
+import os
+import sys
+import gzip
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.database import SessionLocal
+from app.export import iter_export_rows, iter_ndjson, iter_gzip
+
+
+def last_exported_id(path, compressed):
+    """
+    기존 출력 파일의 (마지막 id, 마지막 완전한 레코드가 끝나는 위치, 파일 전체가 온전한지)
+    위치는 압축을 푼 NDJSON 기준 바이트 오프셋입니다. 중간에 끊긴 마지막 줄/gzip 멤버는 제외합니다.
+    """
+    if not os.path.exists(path):
+        return 0, 0, True
+    opener = gzip.open if compressed else open
+    last_id, offset, intact = 0, 0, True
+    try:
+        with opener(path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    intact = False
+                    break
+                if line.strip():
+                    last_id = json.loads(line)["id"]
+                offset += len(line)
+    except (EOFError, OSError, ValueError, KeyError):
+        intact = False
+    return last_id, offset, intact
+
+
+def truncate_to(path, compressed, offset):
+    """파일을 완전한 레코드까지만 남김 (gzip은 온전한 앞부분을 임시 파일에 다시 압축한 뒤 교체)"""
+    if not compressed:
+        os.truncate(path, offset)
+        return
+    tmp_path = path + '.tmp'
+    remaining = offset
+    with gzip.open(path, 'rb') as src, gzip.open(tmp_path, 'wb') as dst:
+        while remaining > 0:
+            data = src.read(min(remaining, 1024 * 1024))
+            if not data:
+                break
+            dst.write(data)
+            remaining -= len(data)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뉴스/위키 NDJSON 내보내기")
+    parser.add_argument('entity', choices=['news', 'wiki'])
+    parser.add_argument('-o', '--output', help='출력 파일 (생략 시 표준 출력)')
+    parser.add_argument('--since', help='created_at 하한 (YYYY-MM-DD 또는 ISO 8601)')
+    parser.add_argument('--until', help='created_at 상한 (날짜만 주면 해당 일 포함)')
+    parser.add_argument('--category')
+    parser.add_argument('--after-id', type=int, default=0, help='이 id 다음부터 내보내기')
+    parser.add_argument('--resume', action='store_true', help='출력 파일의 마지막 id 다음부터 이어쓰기')
+    parser.add_argument('--gzip', action='store_true', help='gzip 압축')
+    parser.add_argument('--chunk-size', type=int, default=500)
+    args = parser.parse_args()
+
+    after_id = args.after_id
+    if args.resume and args.output:
+        last_id, offset, intact = last_exported_id(args.output, args.gzip)
+        if not intact:
+            # 끊긴 줄 뒤에 이어 쓰면 NDJSON/gzip 파일 전체를 읽을 수 없게 되므로 먼저 잘라냄
+            truncate_to(args.output, args.gzip, offset)
+            print(f"끊긴 마지막 레코드 제거 ({offset}바이트까지 유지)", file=sys.stderr)
+        after_id = max(after_id, last_id)
+        print(f"이어쓰기: id > {after_id}", file=sys.stderr)
+
+    db = SessionLocal()
+    out = open(args.output, 'ab' if args.resume else 'wb') if args.output else sys.stdout.buffer
+    start = time.time()
+    count = 0
+    try:
+        def counted(rows):
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield row
+
+        rows = iter_export_rows(db, args.entity, since=args.since, until=args.until,
+                                category=args.category, after_id=after_id, chunk_size=args.chunk_size)
+        chunks = iter_ndjson(counted(rows))
+        for chunk in (iter_gzip(chunks) if args.gzip else chunks):
+            out.write(chunk)
+    finally:
+        if args.output:
+            out.close()
+        db.close()
+
+    print(f"✅ {args.entity} {count}건 내보내기 완료 ({time.time() - start:.1f}초)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+"""
+벤치마크용 OpenAI 호환 LLM 모의 서버 (LM Studio 대신 사용)
+
+실제 모델 대신 토큰 수에 비례해 대기합니다.
+- 요청당 고정 지연 --base-ms + 프롬프트 토큰 × --prompt-ms + 응답 토큰 × --gen-ms
+- 지연 분포 --latency-dist (fixed, uniform, lognormal, exponential)와 --jitter로 요청마다 배율 적용
+- 동시 처리 슬롯 --slots개 (초과 요청은 대기)
+- 오류 주입: --fail-rate(--error-status 응답), --retry-rate({"type": "retry"} 응답), --malformed-rate(잘린 응답)
+응답에는 usage(prompt_tokens, completion_tokens)가 포함됩니다.
+"stream": true 요청에는 프롬프트 처리 후 토큰마다 SSE 조각(data: ...)을 보내고 data: [DONE]으로 끝냅니다.
+"[번호] 내용" 형식의 배치 요약 요청에는 번호별 JSON 배열로, 위키 본문 요청에는 세 섹션 본문으로 답합니다.
+GET /stats로 처리/주입 건수를 확인할 수 있습니다.
+
+사용법:
+    python tools/mock_llm_server.py [--port 12345] [--slots 1] [--prompt-ms 0.5] [--gen-ms 20] [--latency-dist lognormal]
+    LM_STUDIO_URL=http://localhost:12345/v1/chat/completions python tools/batch_summarize.py
+"""
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+ARTICLE_PATTERN = re.compile(r"^\[(\d+)\] (.*)$", re.MULTILINE)
+WIKI_PATTERN = re.compile(r"보안 주제 '(.*?)'")
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal", "exponential")
+
+
+def latency_factor(dist, jitter):
+    """요청별 지연 배율 (평균 약 1)"""
+    if dist == "uniform":
+        return random.uniform(max(1 - jitter, 0), 1 + jitter)
+    if dist == "lognormal":
+        return random.lognormvariate(-jitter ** 2 / 2, jitter)
+    if dist == "exponential":
+        return random.expovariate(1.0)
+    return 1.0
+
+
+def estimate_tokens(text):
+    """대략적인 토큰 수 (한국어 위주 텍스트 기준 약 2글자당 1토큰)"""
+    return max(1, len(text) // 2)
+
+
+def fake_completion(prompt):
+    """프롬프트 형식에 맞는 그럴듯한 응답 생성"""
+    wiki = WIKI_PATTERN.search(prompt)
+    if wiki:
+        topic = wiki.group(1)
+        return (f"<h2>기술 설명</h2><p>{topic}은(는) 공격자가 시스템의 약점을 악용하는 보안 위협임.</p>"
+                f"<h2>공격 방식</h2><p>공격자는 {topic} 관련 취약점을 찾아 권한을 탈취하거나 데이터를 유출함.</p>"
+                f"<h2>방어 및 보안</h2><ul><li>최신 보안 패치 적용</li><li>접근 통제와 모니터링 강화</li></ul>")
+    articles = ARTICLE_PATTERN.findall(prompt)
+    if articles and "JSON" in prompt:
+        return json.dumps([
+            {"id": int(n), "summary": f"{text[:40]} 관련 보안 사고가 발생함."} for n, text in articles
+        ], ensure_ascii=False)
+    match = re.search(r"내용: (.*)", prompt)
+    subject = match.group(1)[:40] if match else prompt[:40]
+    return f"{subject} 관련 보안 사고가 발생함. 공격자는 취약점을 이용해 피해를 입힘."
+
+
+class MockLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port, slots=1, prompt_ms=0.5, gen_ms=20.0, base_ms=0.0, latency_dist="fixed", jitter=0.3,
+                 fail_rate=0.0, error_status=503, retry_rate=0.0, malformed_rate=0.0):
+        super().__init__(("127.0.0.1", port), MockLLMHandler)
+        self.slots = threading.BoundedSemaphore(slots)
+        self.prompt_ms = prompt_ms
+        self.gen_ms = gen_ms
+        self.base_ms = base_ms
+        self.latency_dist = latency_dist
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.error_status = error_status
+        self.retry_rate = retry_rate
+        self.malformed_rate = malformed_rate
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "prompt_tokens": 0, "completion_tokens": 0,
+                      "errors": 0, "retries": 0, "malformed": 0}
+
+    def count(self, field, amount=1):
+        with self.lock:
+            self.stats[field] += amount
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/v1/chat/completions"
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/v1/models":
+            self._send_json(200, {"data": [{"id": "mock-model", "object": "model"}]})
+        elif self.path == "/stats":
+            with self.server.lock:
+                self._send_json(200, dict(self.server.stats))
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/v1/chat/completions":
+            self._send_json(404, {"error": "not found"})
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+        server = self.server
+        server.count("requests")
+        if random.random() < server.fail_rate:
+            server.count("errors")
+            self._send_json(server.error_status, {"error": "busy"})
+            return
+        if random.random() < server.retry_rate:
+            server.count("retries")
+            self._send_json(200, {"type": "retry"})
+            return
+
+        messages = body.get("messages") or []
+        prompt = messages[-1]["content"] if messages else ""
+        prompt_tokens = sum(estimate_tokens(m.get("content", "")) for m in messages)
+        content = fake_completion(prompt)
+        if random.random() < server.malformed_rate:
+            server.count("malformed")
+            content = content[: len(content) // 2]
+        completion_tokens = min(estimate_tokens(content), body.get("max_tokens") or 10 ** 6)
+
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        server.count("prompt_tokens", prompt_tokens)
+        server.count("completion_tokens", completion_tokens)
+        factor = latency_factor(server.latency_dist, server.jitter)
+
+        if body.get("stream"):
+            with server.slots:
+                self._stream(body, content, usage, factor)
+            return
+
+        with server.slots:
+            time.sleep(factor * (server.base_ms + prompt_tokens * server.prompt_ms + completion_tokens * server.gen_ms) / 1000)
+
+        self._send_json(200, {
+            "id": f"mock-{time.time_ns()}",
+            "object": "chat.completion",
+            "model": body.get("model", "mock-model"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": usage,
+        })
+
+    def _stream(self, body, content, usage, factor=1.0):
+        server = self.server
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        def send(chunk):
+            self.wfile.write(f"data: {chunk}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        chunk_id = f"mock-{time.time_ns()}"
+        model = body.get("model", "mock-model")
+        time.sleep(factor * (server.base_ms + usage["prompt_tokens"] * server.prompt_ms) / 1000)
+        # 약 2글자 = 1토큰 단위로 전송
+        pieces = [content[i:i + 2] for i in range(0, len(content), 2)][:usage["completion_tokens"]]
+        for index, piece in enumerate(pieces):
+            time.sleep(factor * server.gen_ms / 1000)
+            send(json.dumps({
+                "id": chunk_id, "object": "chat.completion.chunk", "model": model,
+                "choices": [{"index": 0, "delta": {"content": piece},
+                             "finish_reason": "stop" if index == len(pieces) - 1 else None}],
+            }, ensure_ascii=False))
+        send(json.dumps({"id": chunk_id, "object": "chat.completion.chunk", "model": model,
+                         "choices": [], "usage": usage}))
+        send("[DONE]")
+
+
+def start_mock_server(port=0, **options):
+    """백그라운드 스레드에서 모의 서버 실행 (port=0이면 빈 포트 사용), 서버 객체 반환"""
+    server = MockLLMServer(port, **options)
+    threading.Thread(target=server.serve_forever, name="mock-llm-server", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 LLM 모의 서버")
+    parser.add_argument('--port', type=int, default=12345)
+    parser.add_argument('--slots', type=int, default=1, help='동시 처리 슬롯 수')
+    parser.add_argument('--prompt-ms', type=float, default=0.5, help='프롬프트 토큰당 처리 시간(ms)')
+    parser.add_argument('--gen-ms', type=float, default=20.0, help='생성 토큰당 시간(ms)')
+    parser.add_argument('--base-ms', type=float, default=0.0, help='요청당 고정 지연(ms)')
+    parser.add_argument('--latency-dist', choices=LATENCY_DISTRIBUTIONS, default='fixed', help='요청별 지연 배율 분포')
+    parser.add_argument('--jitter', type=float, default=0.3, help='uniform/lognormal 분포의 폭')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='오류 응답 비율')
+    parser.add_argument('--error-status', type=int, default=503, help='오류 응답 상태 코드')
+    parser.add_argument('--retry-rate', type=float, default=0.0, help='{"type": "retry"} 응답 비율')
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help='잘린 응답 비율')
+    args = parser.parse_args()
+
+    server = MockLLMServer(args.port, slots=args.slots, prompt_ms=args.prompt_ms, gen_ms=args.gen_ms,
+                           base_ms=args.base_ms, latency_dist=args.latency_dist, jitter=args.jitter,
+                           fail_rate=args.fail_rate, error_status=args.error_status,
+                           retry_rate=args.retry_rate, malformed_rate=args.malformed_rate)
+    print(f"모의 LLM 서버 실행 중: {server.url} (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
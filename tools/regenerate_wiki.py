@@ -2,49 +2,83 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.models import Wiki
 from app.database import SQLALCHEMY_DATABASE_URL
-from app.ai_summarizer import generate_wiki_content
-import time
+from app import llm_cache
+from app.enrichment import requeue
+from app.llm_scheduler import llm_priority
+from app.ai_summarizer import generate_wiki_content, llm_client, llm_breaker, LLMClient
+import argparse
 
 # DB 연결
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 Session = sessionmaker(bind=engine)
 db = Session()
 
-def regenerate_wiki():
-    """기존 위키 내용들을 새로운 형식(기술 설명, 공격 방식, 방어 전략)으로 재생성"""
+def iter_targets(chunk_size=100):
+    """자동 생성(auto) 위키를 id 순서로 chunk_size개씩 읽어 (id, 제목, 카테고리) 스트림으로 반환"""
+    last_id = 0
+    while True:
+        rows = db.query(Wiki.id, Wiki.title, Wiki.category).filter(
+            Wiki.type == "auto", Wiki.id > last_id
+        ).order_by(Wiki.id).limit(chunk_size).all()
+        if not rows:
+            return
+        # 다음 청크를 읽기 전에 읽기 트랜잭션을 닫아 결과 반영(commit)과 충돌하지 않게 함
+        db.rollback()
+        yield from rows
+        last_id = rows[-1].id
+
+def regenerate_wiki(concurrency=None):
+    """기존 위키 내용들을 새로운 형식(기술 설명, 공격 방식, 방어 전략)으로 재생성 (동시 요청 수만큼 병렬 처리)"""
     print("=== 위키 콘텐츠 재생성 시작 ===")
     
-    # 자동으로 생성된(auto) 위키 항목들 조회
-    wiki_items = db.query(Wiki).filter(Wiki.type == "auto").all()
-    
-    print(f"대상 항목 수: {len(wiki_items)}")
-    
     updated = 0
-    for item in wiki_items:
+    processed = 0
+    deferred = 0
+    client = LLMClient(max_in_flight=concurrency) if concurrency else llm_client
+    results = client.map(lambda row: generate_wiki_content(row.title, row.category, client=client), iter_targets())
+    for row, new_content, error in results:
+        processed += 1
         try:
-            print(f"처리 중: {item.title[:50]}...")
-            
-            # 새로운 형식으로 콘텐츠 생성
-            new_content = generate_wiki_content(item.title, item.category)
-            
-            if new_content:
-                item.content = new_content
+            if error:
+                print(f"   오류 ({row.title[:30]}...): {error}")
+            elif new_content:
+                # ORM으로 수정해야 미리보기 등 파생 필드가 함께 갱신됨
+                item = db.get(Wiki, row.id)
+                if item is not None:
+                    item.content = new_content
+                    db.commit()
+                    updated += 1
+                    print(f"   완료: {row.title[:30]}... (길이: {len(new_content)})")
+            elif llm_breaker.state != "closed":
+                # LLM 서버가 내려가 있으면 즉시 건너뛰고 보강 대기열에 넘겨 나중에 처리
+                requeue(db, "wiki_content", row.id, {"title": row.title, "category": row.category})
                 db.commit()
-                updated += 1
-                print(f"   완료 (길이: {len(new_content)})")
+                deferred += 1
             else:
-                print("   실패: AI 응답 없음")
-                
-            time.sleep(1.5) # 모델 부하 조절 및 상세 생성을 위해 약간 더 대기
-            
+                print(f"   실패: AI 응답 없음 ({row.title[:30]}...)")
         except Exception as e:
             print(f"   오류: {e}")
             db.rollback()
 
-    print(f"=== 위키 재생성 완료: {updated}개 업데이트됨 ===")
+    metrics = client.metrics()
+    print(f"=== 위키 재생성 완료: {processed}개 중 {updated}개 업데이트됨 ===")
+    print(f"처리량 {metrics['items_per_sec']} items/s, 지연 p50 {metrics['latency_ms']['p50']}ms "
+          f"/ p95 {metrics['latency_ms']['p95']}ms / p99 {metrics['latency_ms']['p99']}ms, 재시도 {metrics['retries']}회")
+    if deferred:
+        print(f"LLM 사용 불가로 {deferred}개를 건너뛰고 보강 대기열에 등록했습니다 (회로 차단기: {llm_breaker.snapshot()['last_error']})")
+    cache = llm_cache.stats()
+    print(f"LLM 캐시 적중 {cache['hits']}건 / 미적중 {cache['misses']}건 (적중률 {cache['hit_rate']}), "
+          f"절약된 LLM 시간 {cache['saved_seconds']}초")
+    queue = metrics['scheduler']['classes']['batch']
+    print(f"LLM 슬롯 대기 p50 {queue['wait_ms']['p50']}ms / p95 {queue['wait_ms']['p95']}ms / 최대 {queue['wait_ms']['max']}ms")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="자동 위키 콘텐츠 일괄 재생성")
+    parser.add_argument('--concurrency', type=int, default=None, help='동시 요청 수 (기본: LLM_MAX_IN_FLIGHT)')
+    args = parser.parse_args()
     try:
-        regenerate_wiki()
+        # 서버의 화면 요청/보강 작업보다 낮은 우선순위로 실행
+        with llm_priority("batch", "regenerate_wiki"):
+            regenerate_wiki(args.concurrency)
     finally:
         db.close()